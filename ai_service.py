@@ -1,60 +1,385 @@
+import asyncio
+import copy
+import hashlib
 import requests
+import httpx
 import json
 import os
+import tempfile
+from result_cache import cache_from_env
+from nadi_core import SHORT_CODES
+
+# OpenRouter chat completions for the AI job summary.
+# AsyncAIService is the one to call from async handlers: each instance keeps one keep-alive connection pool,
+# allows at most AI_MAX_IN_FLIGHT upstream calls at a time and gives every request a deadline (time spent
+# waiting for a slot included), so a slow completion only holds up its own request.
+# AIService is the original blocking client, kept for scripts.
+# AI_BASE_URL can point both at another OpenAI-compatible endpoint, e.g. the stub in verify_ai_service.py.
+#
+# Job prompts only depend on a handful of labels, so identical prompts are common: successful analyses are
+# cached under a hash of the request payload (model + messages) in AI_CACHE: SQLite in the temp directory by
+# default, so the workers on a host share it (AI_CACHE_BACKEND / _SIZE / _TTL / _PATH as for KUNDLI_CACHE).
+# Concurrent identical prompts in one AsyncAIService share a single upstream call.
+#
+# stream_job_analysis is the streaming variant for server-sent events: the completion is requested with
+# "stream": true and its JSON is parsed as the tokens arrive (JsonStreamParser), so the summary text can be
+# shown while the model is still writing it. generate_job_analysis stays the non-streaming fallback.
+
+AI_BASE_URL = os.environ.get("AI_BASE_URL", "https://openrouter.ai/api/v1/chat/completions")
+AI_MODEL = "google/gemini-2.0-flash-001"
+AI_MAX_IN_FLIGHT = int(os.environ.get("AI_MAX_IN_FLIGHT", "4"))
+AI_TIMEOUT = float(os.environ.get("AI_TIMEOUT", "30"))
+
+SYSTEM_PROMPT = "You are an expert Nadi Astrologer. Analyze the astrological data based strictly on the provided Nadi rules. Always return valid JSON."
+TIMEOUT_MESSAGE = "Request to AI service timed out. Please try again."
+
+AI_CACHE = cache_from_env("AI_CACHE", maxsize=5000, ttl=7 * 86400.0, path=os.path.join(tempfile.gettempdir(), "ai_cache.sqlite3"), backend="sqlite")
+
+def request_headers(api_key):
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": "https://astrojob.onrender.com", # Optional, for OpenRouter analytics
+        "X-Title": "AstroJob Nadi Engine"
+    }
+
+def job_payload(prompt):
+    return {
+        "model": AI_MODEL, 
+        "messages": [
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": prompt}
+        ]
+    }
+
+def parse_completion(result, status_code):
+    """The JSON object in the first choice of a chat completion, or {"error": ...}."""
+    if 'choices' not in result or len(result['choices']) == 0:
+        return {"error": f"AI provider returned no choices. Status: {status_code}"}
+        
+    return parse_content(result['choices'][0]['message']['content'])
+
+def parse_content(content):
+    """The JSON object in the text of a completion."""
+    # Clean content in case of markdown blocks
+    content = content.replace('```json', '').replace('```', '').strip()
+    
+    return json.loads(content)
+
+JSON_ESCAPES = {'"': '"', '\\': '\\', '/': '/', 'b': '\b', 'f': '\f', 'n': '\n', 'r': '\r', 't': '\t'}
+
+class JsonStreamParser:
+    """
+    Incremental reader for one JSON object arriving in pieces, e.g. the tokens of a streamed completion.
+    feed() returns what became readable as events: ("delta", path, text) for each piece of a string value
+    (an empty string gives one empty delta) and ("value", path, value) for other scalars once complete.
+    path lists the keys / array indexes down to the value. Anything before the first "{" (a markdown
+    fence) or after its closing "}" is skipped. Syntax is not checked: parse_content has the last word.
+    """
+
+    def __init__(self):
+        self.stack = []     # open containers: [kind "{" or "[", current key or index, expecting a key]
+        self.done = False
+        self.mode = None    # None between tokens, "key", "key_escape", "string", "escape", "unicode" or "scalar"
+        self.buf = ""       # key, scalar or \u digits read so far
+        self.path = None    # of the value being read
+        self.text = []      # string value decoded since the last delta
+        self.sent = False   # the current string value has produced a delta
+        self.high = None    # high surrogate waiting for its pair
+
+    def feed(self, chunk):
+        events = []
+        for c in chunk:
+            if self.done:
+                break
+            mode = self.mode
+            if mode == "string":
+                if c == '"':
+                    self._flush(events, closing=True)
+                    self.mode = None
+                elif c == '\\':
+                    self.mode = "escape"
+                else:
+                    self.text.append(c)
+            elif mode == "escape":
+                if c == 'u':
+                    self.mode, self.buf = "unicode", ""
+                else:
+                    self.text.append(JSON_ESCAPES.get(c, c))
+                    self.mode = "string"
+            elif mode == "unicode":
+                self.buf += c
+                if len(self.buf) == 4:
+                    self._codepoint(int(self.buf, 16))
+                    self.mode = "string"
+            elif mode == "key":
+                if c == '"':
+                    top = self.stack[-1]
+                    top[1], top[2] = json.loads('"' + self.buf + '"'), False
+                    self.mode = None
+                else:
+                    self.buf += c
+                    if c == '\\':
+                        self.mode = "key_escape"
+            elif mode == "key_escape":
+                self.buf += c
+                self.mode = "key"
+            elif mode == "scalar" and c not in ',}] \t\r\n':
+                self.buf += c
+            else:
+                if mode == "scalar":
+                    events.append(("value", self.path, json.loads(self.buf)))
+                    self.mode = None
+                self._token(c)
+        if self.mode in ("string", "escape", "unicode"):
+            self._flush(events)
+        return events
+
+    def _token(self, c):
+        stack = self.stack
+        if not stack:
+            if c == '{':
+                stack.append(["{", None, True])
+            return
+        top = stack[-1]
+        if c in ' \t\r\n:':
+            return
+        if c == ',':
+            top[2] = top[0] == "{"
+        elif c in '}]':
+            stack.pop()
+            self.done = not stack
+        elif top[2]:
+            if c == '"':
+                self.mode, self.buf = "key", ""
+        else:
+            # Start of a value
+            if top[0] == "[":
+                top[1] += 1
+            if c == '{':
+                stack.append(["{", None, True])
+            elif c == '[':
+                stack.append(["[", -1, False])
+            else:
+                self.path = [s[1] for s in stack]
+                if c == '"':
+                    self.mode, self.sent = "string", False
+                else:
+                    self.mode, self.buf = "scalar", c
+
+    def _codepoint(self, code):
+        if 0xD800 <= code < 0xDC00:
+            self.high = code
+            return
+        if 0xDC00 <= code < 0xE000 and self.high is not None:
+            code = 0x10000 + ((self.high - 0xD800) << 10) + (code - 0xDC00)
+        self.high = None
+        self.text.append(chr(code))
+
+    def _flush(self, events, closing=False):
+        if self.text or (closing and not self.sent):
+            events.append(("delta", self.path, "".join(self.text)))
+            self.text, self.sent = [], True
+
+def prompt_cache_key(payload):
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
 
 class AIService:
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache=AI_CACHE):
         self.api_key = api_key
-        self.base_url = "https://openrouter.ai/api/v1/chat/completions"
-        self.headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://astrojob.onrender.com", # Optional, for OpenRouter analytics
-            "X-Title": "AstroJob Nadi Engine"
-        }
+        self.base_url = AI_BASE_URL
+        self.headers = request_headers(api_key)
+        self.cache = cache
 
     def generate_job_analysis(self, prompt_data):
         """
         Generates a job analysis using OpenRouter.
         """
         prompt = self._build_job_prompt(prompt_data)
-        
-        payload = {
-            "model": "google/gemini-2.0-flash-001", 
-            "messages": [
-                {"role": "system", "content": "You are an expert Nadi Astrologer. Analyze the astrological data based strictly on the provided Nadi rules. Always return valid JSON."},
-                {"role": "user", "content": prompt}
-            ]
-        }
+        payload = job_payload(prompt)
+        key = prompt_cache_key(payload)
+        cached = self.cache.get(key) if self.cache is not None else None
+        if cached is not None:
+            return cached
 
         response = None
         try:
             # Add a 30 second timeout
             response = requests.post(self.base_url, headers=self.headers, data=json.dumps(payload), timeout=30)
             response.raise_for_status()
-            result = response.json()
-            
-            if 'choices' not in result or len(result['choices']) == 0:
-                return {"error": f"AI provider returned no choices. Status: {response.status_code}"}
-                
-            content = result['choices'][0]['message']['content']
-            
-            # Clean content in case of markdown blocks
-            content = content.replace('```json', '').replace('```', '').strip()
-            
-            return json.loads(content)
+            result = parse_completion(response.json(), response.status_code)
+            if self.cache is not None and "error" not in result:
+                self.cache.put(key, result)
+            return result
         except requests.exceptions.Timeout:
-            return {"error": "Request to AI service timed out. Please try again."}
+            return {"error": TIMEOUT_MESSAGE}
         except Exception as e:
             details = response.text if response is not None else "No response from server"
             return {"error": f"AI Error: {str(e)}", "details": details}
 
     def _build_job_prompt(self, data):
-        c6 = data['csl6']
-        c10 = data['csl10']
-        others = ", ".join(data['others'])
+        return build_job_prompt(data)
+
+class AsyncAIService:
+    """
+    Non-blocking AIService. Share one instance per process (get_async_ai_service): the connection pool,
+    the in-flight limit and request coalescing belong to the instance.
+    """
+
+    def __init__(self, api_key, base_url=None, max_in_flight=None, timeout=None, cache=AI_CACHE):
+        self.api_key = api_key
+        self.base_url = base_url or AI_BASE_URL
+        self.timeout = timeout or AI_TIMEOUT
+        self.cache = cache
+        self._pending = {}  # prompt cache key -> upstream call in progress
+        max_in_flight = max_in_flight or AI_MAX_IN_FLIGHT
+        self._slots = asyncio.BoundedSemaphore(max_in_flight)
+        self._client = httpx.AsyncClient(
+            headers=request_headers(api_key),
+            limits=httpx.Limits(max_connections=max_in_flight, max_keepalive_connections=max_in_flight),
+            timeout=httpx.Timeout(self.timeout)
+        )
+
+    async def generate_job_analysis(self, prompt_data, timeout=None):
+        """
+        Same result as AIService.generate_job_analysis. timeout (seconds, default AI_TIMEOUT) is the deadline
+        for this caller, including the wait for an in-flight slot or for an identical call already upstream.
+        A caller giving up does not cancel the upstream call; its result still lands in the cache.
+        """
+        payload = job_payload(build_job_prompt(prompt_data))
+        key = prompt_cache_key(payload)
+        call = self._pending.get(key)
+        if call is None:
+            cached = await self._cache_get(key)
+            if cached is not None:
+                return cached
+            # An identical call may have gone upstream while the cache was read
+            call = self._pending.get(key)
+        if call is None:
+            call = self._pending[key] = asyncio.ensure_future(self._complete(key, payload))
+            call.add_done_callback(lambda _: self._pending.pop(key, None))
+        try:
+            async with asyncio.timeout(self.timeout if timeout is None else timeout):
+                result = await asyncio.shield(call)
+        except TimeoutError:
+            return {"error": TIMEOUT_MESSAGE}
+        # Coalesced callers each get their own copy
+        return copy.deepcopy(result)
 
-        return f"""
+    # AI_CACHE is SQLite by default, and a write lock there can keep a call waiting for up to 10 s:
+    # cache reads and writes run in a worker thread, never on the event loop
+    async def _cache_get(self, key):
+        return await asyncio.to_thread(self.cache.get, key) if self.cache is not None else None
+
+    async def _cache_put(self, key, result):
+        if self.cache is not None and "error" not in result:
+            await asyncio.to_thread(self.cache.put, key, result)
+
+    async def _complete(self, key, payload):
+        response = None
+        try:
+            async with asyncio.timeout(self.timeout):
+                async with self._slots:
+                    response = await self._client.post(self.base_url, content=json.dumps(payload))
+            response.raise_for_status()
+            result = parse_completion(response.json(), response.status_code)
+            await self._cache_put(key, result)
+            return result
+        except (TimeoutError, httpx.TimeoutException):
+            return {"error": TIMEOUT_MESSAGE}
+        except Exception as e:
+            details = response.text if response is not None else "No response from server"
+            return {"error": f"AI Error: {str(e)}", "details": details}
+
+    async def stream_job_analysis(self, prompt_data, timeout=None):
+        """
+        Streaming generate_job_analysis: an async generator of (event, data) pairs.
+        "delta" {"path", "text"} and "value" {"path", "value"} carry the JSON of the completion as the
+        provider produces it (JsonStreamParser events), then exactly one "done" with the full result, the
+        same dict generate_job_analysis returns, or one "error" with {"error", ...}. A cached prompt goes
+        straight to "done". timeout bounds the whole stream, slot wait included. Streams are not coalesced;
+        a stream that completes fills the cache like any other call.
+        """
+        payload = job_payload(build_job_prompt(prompt_data))
+        key = prompt_cache_key(payload)
+        cached = await self._cache_get(key)
+        if cached is not None:
+            yield "done", cached
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + (self.timeout if timeout is None else timeout)
+        try:
+            async with asyncio.timeout_at(deadline):
+                await self._slots.acquire()
+        except TimeoutError:
+            yield "error", {"error": TIMEOUT_MESSAGE}
+            return
+
+        parser, content, details = JsonStreamParser(), [], None
+        try:
+            request = self._client.stream("POST", self.base_url, content=json.dumps({**payload, "stream": True}),
+                                          timeout=max(deadline - loop.time(), 0.001))
+            async with request as response:
+                if response.status_code >= 400:
+                    await response.aread()
+                    details = response.text
+                    response.raise_for_status()
+                # Server-sent events: "data: <chunk>" lines, ": comment" keep-alives, "data: [DONE]" at the end
+                async for line in response.aiter_lines():
+                    if loop.time() > deadline:
+                        raise TimeoutError
+                    if not line.startswith("data:"):
+                        continue
+                    data = line[5:].strip()
+                    if data == "[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    if "error" in chunk:
+                        details = data
+                        raise RuntimeError(chunk["error"].get("message", "provider error") if isinstance(chunk["error"], dict) else chunk["error"])
+                    choices = chunk.get("choices") or [{}]
+                    text = (choices[0].get("delta") or {}).get("content") or ""
+                    content.append(text)
+                    for event, path, value in parser.feed(text):
+                        yield event, {"path": path, "text" if event == "delta" else "value": value}
+            result = parse_content("".join(content))
+        except (TimeoutError, httpx.TimeoutException):
+            yield "error", {"error": TIMEOUT_MESSAGE}
+            return
+        except Exception as e:
+            details = details or "".join(content) or "No response from server"
+            yield "error", {"error": f"AI Error: {str(e)}", "details": details}
+            return
+        finally:
+            self._slots.release()
+
+        await self._cache_put(key, result)
+        yield "done", result
+
+    async def aclose(self):
+        await self._client.aclose()
+
+_async_services = {}
+
+def get_async_ai_service(api_key):
+    """Process-wide AsyncAIService for api_key, created on first use."""
+    service = _async_services.get(api_key)
+    if service is None:
+        service = _async_services[api_key] = AsyncAIService(api_key)
+    return service
+
+async def close_async_ai_services():
+    """Close the shared pools (app shutdown)."""
+    while _async_services:
+        await _async_services.popitem()[1].aclose()
+
+def build_job_prompt(data):
+    c6 = data['csl6']
+    c10 = data['csl10']
+    others = ", ".join(data['others'])
+
+    return f"""
 You are a 'Gold Nadi' Professional Consultant. Analyze the native's career potential based on their 6th and 10th Cuspal Sublords (CSL) and supporting planets.
 
 PRIMARY DATA:
@@ -78,3 +403,15 @@ RETURN JSON EXACTLY:
 }}
 }}
 """
+
+STRONG_SUCCESS = ("Excellent", "High")
+
+def job_prompt_data(report):
+    """
+    build_job_prompt input from a prediction_engine.job_report: the report rows of the 6th and 10th cusp
+    sub lords and the other planets rated High or better.
+    """
+    rows = {SHORT_CODES[r["planet"]]: r for r in report["reports"]}
+    csl6, csl10 = rows[report["csl_focus"]["csl6"]], rows[report["csl_focus"]["csl10"]]
+    others = [r["planet"] for r in report["reports"] if r is not csl6 and r is not csl10 and r["prediction"]["success_rate"] in STRONG_SUCCESS]
+    return {"csl6": csl6, "csl10": csl10, "others": others}
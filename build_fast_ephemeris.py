@@ -0,0 +1,84 @@
+import argparse
+import time
+import numpy as np
+from nadi_core import SWISS_EPHEMERIS
+from fast_ephemeris import JD_START, JD_END, SERIES, BODY_SERIES, AYANAMSA_SERIES, ANGULAR_SERIES, pack_series, gmst_linear, clenshaw
+
+# Offline builder for the fast ephemeris coefficient file (KP_FAST_EPHEMERIS_FILE).
+# Each block is fitted by least squares on 2x oversampled Chebyshev nodes of the Swiss Ephemeris values,
+# then checked against swe every CHECK_STEP days; blocks off by more than TOLERANCE_ARCSEC are bisected.
+
+TOLERANCE_ARCSEC = 0.02
+CHECK_STEP = 0.05          # days between validation samples
+MIN_BLOCK = 1.0 / 1440.0   # one minute
+
+SERIES_BODY = {name: code for code, name in BODY_SERIES.items()}
+SERIES_AYANAMSA = {name: mode for mode, name in AYANAMSA_SERIES.items()}
+
+def sample_series(name, jds):
+    """Swiss Ephemeris reference values of a series at the given instants (UT)."""
+    jds = np.asarray(jds, dtype=np.float64)
+    if name in SERIES_BODY:
+        return np.array([SWISS_EPHEMERIS.lon_speed(jd, SERIES_BODY[name])[0] for jd in jds.ravel()]).reshape(jds.shape)
+    if name in SERIES_AYANAMSA:
+        return np.array([SWISS_EPHEMERIS.ayanamsa_ut(jd, SERIES_AYANAMSA[name]) for jd in jds.ravel()]).reshape(jds.shape)
+    if name == "Obliquity":
+        return np.array([SWISS_EPHEMERIS.obliquity(jd) for jd in jds.ravel()]).reshape(jds.shape)
+    if name == "Sidereal Time":
+        resid = np.array([SWISS_EPHEMERIS.sidtime(jd) * 15.0 for jd in jds.ravel()]).reshape(jds.shape) - gmst_linear(jds)
+        return (resid + 180.0) % 360.0 - 180.0
+    raise KeyError(name)
+
+def _block_points(starts, ends, x):
+    # Instants at normalized positions x in [-1, 1] of every block, shape (n_blocks, len(x))
+    return (starts[:, None] + ends[:, None]) / 2.0 + x[None, :] * (ends - starts)[:, None] / 2.0
+
+def fit_blocks(name, starts, ends, n_coeffs):
+    n_nodes = 2 * n_coeffs
+    # Ascending Chebyshev nodes, so angular samples can be unwrapped along the block
+    x = np.sort(np.cos(np.pi * (np.arange(n_nodes) + 0.5) / n_nodes))
+    values = sample_series(name, _block_points(starts, ends, x))
+    if name in ANGULAR_SERIES:
+        values = np.unwrap(values, period=360.0, axis=1)
+    return np.polynomial.chebyshev.chebfit(x, values.T, n_coeffs - 1).T
+
+def block_errors(name, starts, ends, coeffs):
+    """Worst deviation from swe (degrees) of every block on a grid of CHECK_STEP days (at least 4 per coefficient)."""
+    n_check = max(4 * coeffs.shape[1], int(np.ceil((ends - starts).max() / CHECK_STEP)) + 1)
+    x = np.linspace(-1.0, 1.0, n_check)
+    ref = sample_series(name, _block_points(starts, ends, x))
+    val, _ = clenshaw(coeffs[:, None, :], x[None, :])
+    return np.abs((val - ref + 180.0) % 360.0 - 180.0).max(axis=1)
+
+def build_series(name, block_days, n_coeffs):
+    starts = JD_START + block_days * np.arange(int(np.ceil((JD_END - JD_START) / block_days)))
+    ends = np.minimum(starts + block_days, JD_END)
+    done_starts, done_coeffs = [], []
+    while len(starts):
+        coeffs = fit_blocks(name, starts, ends, n_coeffs)
+        ok = (block_errors(name, starts, ends, coeffs) <= TOLERANCE_ARCSEC / 3600.0) | (ends - starts <= MIN_BLOCK)
+        done_starts.append(starts[ok])
+        done_coeffs.append(coeffs[ok])
+        mids = (starts[~ok] + ends[~ok]) / 2.0
+        starts, ends = np.concatenate([starts[~ok], mids]), np.concatenate([mids, ends[~ok]])
+    starts, coeffs = np.concatenate(done_starts), np.concatenate(done_coeffs)
+    order = np.argsort(starts)
+    return starts[order], coeffs[order]
+
+def build(out_path):
+    blocks = []
+    for name, block_days, n_coeffs in SERIES:
+        t = time.perf_counter()
+        starts, coeffs = build_series(name, block_days, n_coeffs)
+        n_base = int(np.ceil((JD_END - JD_START) / block_days))
+        print(f"{name:16s} {len(starts):6d} blocks x {n_coeffs:2d} coeffs ({len(starts) - n_base} from refinement, {time.perf_counter() - t:.1f}s)")
+        blocks.append((starts, coeffs))
+    data = pack_series(blocks)
+    np.save(out_path, data)
+    print(f"{len(SERIES)} series, {data.nbytes / 1e6:.1f} MB -> {out_path}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the Chebyshev fast ephemeris file")
+    parser.add_argument("out_path", nargs="?", default="fast_ephemeris.npy")
+    args = parser.parse_args()
+    build(args.out_path)
@@ -0,0 +1,178 @@
+from bisect import bisect_right
+import numpy as np
+import swisseph as swe
+
+# Chebyshev "fast ephemeris" for 1900-2100 UT.
+# Coefficient blocks for Sun..Saturn, the mean node, true obliquity, sidereal time and the KP / Lahiri
+# ayanamsas are generated once from Swiss Ephemeris (build_fast_ephemeris.py) into a single .npy file,
+# memory-mapped here and evaluated with Clenshaw's recurrence, for one instant or a whole array of them.
+# Blocks have a base length per series and are bisected where Swiss Ephemeris changes faster than the
+# base block can follow (light deflection near solar conjunctions). Error against swe stays below
+# 0.1 arcsec (verify_fast_ephemeris.py).
+#
+# File layout (float64): header[HEADER_LEN], directory[len(SERIES) x 3] = (n_blocks, n_coeffs, offset),
+# then per series: block starts[n_blocks], coefficients[n_blocks x n_coeffs].
+
+FORMAT_VERSION = 2
+JD_START = 2415020.5   # 1900-01-01 00:00 UT
+JD_END = 2488069.5     # 2100-01-01 00:00 UT
+HEADER_LEN = 4
+
+# (series, base block length in days, Chebyshev coefficients per block)
+SERIES = (
+    ("Sun", 32, 14),
+    ("Moon", 4, 16),
+    ("Mercury", 8, 14),
+    ("Venus", 16, 14),
+    ("Mars", 16, 14),
+    ("Jupiter", 32, 12),
+    ("Saturn", 32, 12),
+    ("Mean Node", 16, 12),
+    ("Obliquity", 8, 14),
+    ("Sidereal Time", 8, 14),
+    ("KP Ayanamsa", 64, 8),
+    ("Lahiri Ayanamsa", 64, 8),
+)
+
+BODY_SERIES = {
+    swe.SUN: "Sun", swe.MOON: "Moon", swe.MERCURY: "Mercury", swe.VENUS: "Venus", swe.MARS: "Mars",
+    swe.JUPITER: "Jupiter", swe.SATURN: "Saturn", swe.MEAN_NODE: "Mean Node"
+}
+AYANAMSA_SERIES = {swe.SIDM_KRISHNAMURTI: "KP Ayanamsa", swe.SIDM_LAHIRI: "Lahiri Ayanamsa"}
+# Longitude-like series are stored unwrapped per block and reduced mod 360 on evaluation
+ANGULAR_SERIES = frozenset(BODY_SERIES.values())
+
+def file_header():
+    return np.array([FORMAT_VERSION, JD_START, JD_END, len(SERIES)], dtype=np.float64)
+
+def pack_series(blocks):
+    """Serialize [(starts, coeffs), ...] in SERIES order into the flat file array."""
+    directory, chunks = [], []
+    offset = HEADER_LEN + 3 * len(SERIES)
+    for (_, _, n_coeffs), (starts, coeffs) in zip(SERIES, blocks):
+        directory.append((len(starts), n_coeffs, offset))
+        chunks += [np.asarray(starts, dtype=np.float64), np.asarray(coeffs, dtype=np.float64).ravel()]
+        offset += len(starts) * (1 + n_coeffs)
+    return np.concatenate([file_header(), np.asarray(directory, dtype=np.float64).ravel()] + chunks)
+
+def gmst_linear(jd):
+    """Linear part of Greenwich mean sidereal time in degrees; the table stores sidtime minus this."""
+    return (280.46061837 + 360.98564736629 * (jd - 2451545.0)) % 360.0
+
+def clenshaw(coeffs, x):
+    """Value and d/dx of sum(c_k T_k(x)) along the last axis of coeffs (vectorized over the rest)."""
+    b1 = b2 = d1 = d2 = 0.0
+    for k in range(coeffs.shape[-1] - 1, 0, -1):
+        c = coeffs[..., k]
+        b1, b2, d1, d2 = c + 2.0 * x * b1 - b2, b1, 2.0 * b1 + 2.0 * x * d1 - d2, d1
+    return coeffs[..., 0] + x * b1 - b2, b1 + x * d1 - d2
+
+def _clenshaw_scalar(coeffs, x):
+    b1 = b2 = d1 = d2 = 0.0
+    for k in range(len(coeffs) - 1, 0, -1):
+        b1, b2, d1, d2 = coeffs[k] + 2.0 * x * b1 - b2, b1, 2.0 * b1 + 2.0 * x * d1 - d2, d1
+    return coeffs[0] + x * b1 - b2, b1 + x * d1 - d2
+
+class FastEphemeris:
+    """
+    Table-driven ephemeris with the same interface as nadi_core.SwissEphemeris. Instants outside
+    1900-2100 and bodies without a table (e.g. the true node) are passed to `fallback`.
+    """
+
+    name = "fast"
+
+    def __init__(self, path, fallback=None):
+        data = np.load(path, mmap_mode="r")
+        if data.ndim != 1 or not np.array_equal(data[:HEADER_LEN], file_header()):
+            raise ValueError(f"{path} does not match fast ephemeris format v{FORMAT_VERSION}")
+        directory = np.asarray(data[HEADER_LEN:HEADER_LEN + 3 * len(SERIES)]).reshape(len(SERIES), 3)
+        self.path = path
+        self.fallback = fallback
+        self._series = {}
+        for (name, _, n_coeffs), (n_blocks, file_coeffs, offset) in zip(SERIES, directory):
+            n_blocks, offset = int(n_blocks), int(offset)
+            if int(file_coeffs) != n_coeffs:
+                raise ValueError(f"{path}: {name} has {int(file_coeffs)} coefficients per block, expected {n_coeffs}")
+            starts = np.array(data[offset:offset + n_blocks])
+            ends = np.append(starts[1:], JD_END)
+            coeffs = data[offset + n_blocks:offset + n_blocks * (1 + n_coeffs)].reshape(n_blocks, n_coeffs)
+            self._series[name] = (starts, ends, starts.tolist(), ends.tolist(), coeffs)
+
+    @staticmethod
+    def covers(jd):
+        return JD_START <= jd < JD_END
+
+    def evaluate(self, name, jd):
+        """
+        Value and rate per day of a series at jd (UT). jd may be a float or an array of them;
+        arrays are evaluated in one vectorized pass and must lie inside 1900-2100.
+        """
+        starts, ends, start_list, end_list, coeffs = self._series[name]
+        if isinstance(jd, (float, int)):
+            # Scalar path in plain floats: one chart at a time
+            idx = bisect_right(start_list, jd) - 1
+            a, b = start_list[idx], end_list[idx]
+            val, dval = _clenshaw_scalar(coeffs[idx].tolist(), (2.0 * jd - a - b) / (b - a))
+        else:
+            jd = np.asarray(jd, dtype=np.float64)
+            if jd.size and (jd.min() < JD_START or jd.max() >= JD_END):
+                raise ValueError("Fast ephemeris covers 1900-01-01 to 2100-01-01 UT only")
+            idx = np.searchsorted(starts, jd, side="right") - 1
+            a, b = starts[idx], ends[idx]
+            val, dval = clenshaw(np.asarray(coeffs[idx]), (2.0 * jd - a - b) / (b - a))
+        if name in ANGULAR_SERIES:
+            val = val % 360.0
+        return val, dval * 2.0 / (b - a)
+
+    # SwissEphemeris interface
+
+    def lon_speed(self, jd, code):
+        name = BODY_SERIES.get(code)
+        if name is None or not self.covers(jd):
+            return self.fallback.lon_speed(jd, code)
+        return self.evaluate(name, jd)
+
+    def ayanamsa_ut(self, jd, mode):
+        name = AYANAMSA_SERIES.get(mode)
+        if name is None or not self.covers(jd):
+            return self.fallback.ayanamsa_ut(jd, mode)
+        return self.evaluate(name, jd)[0]
+
+    def obliquity(self, jd):
+        if not self.covers(jd):
+            return self.fallback.obliquity(jd)
+        return self.evaluate("Obliquity", jd)[0]
+
+    def sidtime(self, jd):
+        if not self.covers(jd):
+            return self.fallback.sidtime(jd)
+        return float((gmst_linear(jd) + self.evaluate("Sidereal Time", jd)[0]) % 360.0) / 15.0
+
+    # Array forms: one vectorized pass when every instant is inside the table, else the fallback's
+
+    def covers_all(self, jds):
+        jds = np.asarray(jds)
+        return jds.size == 0 or (jds.min() >= JD_START and jds.max() < JD_END)
+
+    def lon_speed_batch(self, jds, code):
+        name = BODY_SERIES.get(code)
+        if name is None or not self.covers_all(jds):
+            return self.fallback.lon_speed_batch(jds, code)
+        return self.evaluate(name, np.asarray(jds, dtype=np.float64))
+
+    def ayanamsa_batch(self, jds, mode):
+        name = AYANAMSA_SERIES.get(mode)
+        if name is None or not self.covers_all(jds):
+            return self.fallback.ayanamsa_batch(jds, mode)
+        return self.evaluate(name, np.asarray(jds, dtype=np.float64))[0]
+
+    def obliquity_batch(self, jds):
+        if not self.covers_all(jds):
+            return self.fallback.obliquity_batch(jds)
+        return self.evaluate("Obliquity", np.asarray(jds, dtype=np.float64))[0]
+
+    def sidtime_batch(self, jds):
+        if not self.covers_all(jds):
+            return self.fallback.sidtime_batch(jds)
+        jds = np.asarray(jds, dtype=np.float64)
+        return (gmst_linear(jds) + self.evaluate("Sidereal Time", jds)[0]) % 360.0 / 15.0
@@ -0,0 +1,80 @@
+import json
+import os
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Encoding of the large /kundli family responses (a full chart is ~170 kB of JSON).
+# Handlers return FastJSONResponse themselves, so FastAPI neither validates the result against the
+# endpoint's response model nor walks it with jsonable_encoder first; the models in kundli_models.py
+# document the layout (OpenAPI) and verify_fast_response.py checks engine output against them.
+# orjson renders when installed, stdlib json otherwise (same JSON, ~6x slower).
+#
+# CompressionMiddleware compresses every response of at least COMPRESS_MIN_SIZE bytes (KP_COMPRESS_MIN_SIZE):
+# brotli when the brotli package is installed and the client accepts it, gzip otherwise. Streamed bodies
+# are flushed per chunk, so NDJSON lines still reach the client as soon as they are written.
+
+COMPRESS_MIN_SIZE = int(os.environ.get("KP_COMPRESS_MIN_SIZE", "1024"))
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5   # dynamic content: ~gzip 6 speed, smaller output
+
+def json_bytes(content):
+    """content as compact UTF-8 JSON (the JSONResponse format)."""
+    if orjson is not None:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content):
+        return json_bytes(content)
+
+class FlushingGZipResponder(GZipResponder):
+    def apply_compression(self, body, *, more_body):
+        if more_body:
+            self.gzip_file.write(body)
+            self.gzip_file.flush()
+            body = self.gzip_buffer.getvalue()
+            self.gzip_buffer.seek(0)
+            self.gzip_buffer.truncate()
+            return body
+        return super().apply_compression(body, more_body=False)
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app, minimum_size, quality=BROTLI_QUALITY):
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=quality)
+
+    def apply_compression(self, body, *, more_body):
+        return self.compressor.process(body) + (self.compressor.flush() if more_body else self.compressor.finish())
+
+class CompressionMiddleware:
+    """starlette GZipMiddleware with brotli preferred when available (server-sent events are left alone)."""
+
+    def __init__(self, app, minimum_size=COMPRESS_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept = Headers(scope=scope).get("Accept-Encoding", "")
+        if brotli is not None and "br" in accept:
+            responder = BrotliResponder(self.app, self.minimum_size)
+        elif "gzip" in accept:
+            responder = FlushingGZipResponder(self.app, self.minimum_size, compresslevel=GZIP_LEVEL)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
@@ -0,0 +1,108 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+# Runs CPU-bound engine calls (calculate_kundli, the prashna engine) for async handlers off the event loop.
+# KP_EXECUTOR picks where:
+#   thread  - a thread pool (default). pyswisseph keeps the GIL for every call, so charts still share one
+#             core, but the loop stays free for other requests. This is safe because the only process-global
+#             ephemeris state the engines change, the sidereal mode, is only touched under
+#             nadi_core.sidereal_mode; FastEphemeris tables are read-only.
+#   process - a process pool, one chart per core in parallel. Calls, arguments and results must pickle, and
+#             workers import the calling module afresh, so they see its import-time state only.
+#   inline  - on the event loop, as the handlers used to.
+# KP_EXECUTOR_WORKERS sets the pool size (default: CPU count), KP_EXECUTOR_QUEUE how many calls may wait for
+# a free worker (default: 4 per worker). Past that, run() raises ExecutorBusy and the handler answers 503,
+# so a burst is turned away at once instead of queueing behind work its clients will have given up on.
+
+EXECUTOR_MODES = ("thread", "process", "inline")
+
+class ExecutorBusy(Exception):
+    """Every worker is busy and the queue is full."""
+
+class EngineExecutor:
+    def __init__(self, mode="thread", workers=None, max_queue=None):
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode: {mode} (expected one of {', '.join(EXECUTOR_MODES)})")
+        self.mode = mode
+        self.workers = workers or os.cpu_count() or 1
+        self.max_queue = 4 * self.workers if max_queue is None else max_queue
+        self.pending = 0    # submitted and not finished: running + queued
+        self.rejected = 0
+        self._pool = None
+        self._lock = threading.Lock()
+
+    def _get_pool(self):
+        with self._lock:
+            if self._pool is None:
+                if self.mode == "process":
+                    # forkserver, not fork: a forked worker would inherit any lock (sidereal mode, caches)
+                    # a request thread holds at that moment and hang on it
+                    self._pool = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("forkserver"))
+                else:
+                    self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="engine")
+            return self._pool
+
+    def _reset_pool(self, broken):
+        with self._lock:
+            if self._pool is broken:
+                self._pool = None
+        broken.shutdown(wait=False, cancel_futures=True)
+
+    def _admit(self):
+        with self._lock:
+            if self.pending >= self.workers + self.max_queue:
+                self.rejected += 1
+                raise ExecutorBusy(f"{self.pending} engine calls pending (limit {self.workers + self.max_queue})")
+            self.pending += 1
+
+    def _release(self, _=None):
+        with self._lock:
+            self.pending -= 1
+
+    async def run(self, fn, *args):
+        """
+        fn(*args) on the executor. A call stays pending until fn returns, also when its caller is cancelled
+        (a queued call is dropped instead). In process mode fn must be a module-level function.
+        """
+        self._admit()
+        if self.mode == "inline":
+            try:
+                return fn(*args)
+            finally:
+                self._release()
+        pool = self._get_pool()
+        try:
+            future = pool.submit(fn, *args)
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        try:
+            return await asyncio.wrap_future(future)
+        except BrokenProcessPool:
+            # A worker process died; replace the pool for the next call
+            self._reset_pool(pool)
+            raise
+
+    def stats(self):
+        return {"mode": self.mode, "workers": self.workers, "max_queue": self.max_queue, "pending": self.pending, "rejected": self.rejected}
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+def executor_from_env(prefix, mode="thread"):
+    """EngineExecutor configured from the {prefix} / {prefix}_WORKERS / {prefix}_QUEUE environment variables."""
+    workers = os.environ.get(f"{prefix}_WORKERS")
+    max_queue = os.environ.get(f"{prefix}_QUEUE")
+    return EngineExecutor(
+        os.environ.get(prefix, mode),
+        workers=int(workers) if workers else None,
+        max_queue=int(max_queue) if max_queue else None
+    )
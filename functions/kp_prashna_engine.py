@@ -2,6 +2,7 @@ import swisseph as swe
 import datetime
 import pytz
 import math
+from nadi_core import sidereal_mode
 
 class KPMixedPrashnaEngine:
     def __init__(self):
@@ -123,31 +124,31 @@ class KPMixedPrashnaEngine:
         jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, 
                         utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0)
         
-        # 2. Set Lahiri Ayanamsa
-        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-        ayan_val = swe.get_ayanamsa_ut(jd)
+        # 2. Set Lahiri Ayanamsa; the sidereal chart below is computed under the sidereal-mode lock
+        with sidereal_mode(swe.SIDM_LAHIRI):
+            ayan_val = swe.get_ayanamsa_ut(jd)
         
-        # 3. Calculate Real-Time Chart (Sidereal)
-        # Planets
-        planets_data = []
-        for p_name, p_code in self.PLANETS.items():
-            res, _ = swe.calc_ut(jd, p_code, swe.FLG_SIDEREAL)
-            lon_val = res[0]
-            if p_name == "Ketu":
-                lon_val = (lon_val + 180) % 360
+            # 3. Calculate Real-Time Chart (Sidereal)
+            # Planets
+            planets_data = []
+            for p_name, p_code in self.PLANETS.items():
+                res, _ = swe.calc_ut(jd, p_code, swe.FLG_SIDEREAL)
+                lon_val = res[0]
+                if p_name == "Ketu":
+                    lon_val = (lon_val + 180) % 360
             
-            sign, sl, nl, sub = self.get_kp_lords(lon_val)
-            planets_data.append({
-                "name": p_name,
-                "degree": lon_val,
-                "sign": sign,
-                "sl": sl,
-                "nl": nl,
-                "sub": sub
-            })
+                sign, sl, nl, sub = self.get_kp_lords(lon_val)
+                planets_data.append({
+                    "name": p_name,
+                    "degree": lon_val,
+                    "sign": sign,
+                    "sl": sl,
+                    "nl": nl,
+                    "sub": sub
+                })
             
-        # House Cusps (Placidus)
-        cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P', swe.FLG_SIDEREAL)
+            # House Cusps (Placidus)
+            cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P', swe.FLG_SIDEREAL)
         old_asc = ascmc[0]
         
         # 4. Apply Prashna Number Logic
@@ -1,6 +1,6 @@
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Set, Tuple, Union
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,7 +9,10 @@ import json
 import os
 import traceback
 import logging
-from nadi_core import NadiEngine, HIT_MATRIX, SUCCESS_LABELS, HOUSE_JOB_AREAS
+from nadi_core import get_engine, KUNDLI_CACHE
+from prediction_engine import predict, resolve_areas, job_report, kundli_view
+from ai_service import AsyncAIService, get_async_ai_service, close_async_ai_services, job_prompt_data, AI_CACHE
+from engine_executor import executor_from_env, ExecutorBusy
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,11 +20,28 @@ logger = logging.getLogger("nadi-engine")
 
 app = FastAPI(title="Nadi Precision Engine Gold v1.64")
 
+# Engine calls of the async handlers run here (KP_EXECUTOR = thread | process | inline, see engine_executor.py)
+ENGINE_EXECUTOR = executor_from_env("KP_EXECUTOR")
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("🚀 Nadi Precision Engine Gold starting up...")
     logger.info(f"NODE_TYPE: Mean, AYANAMSA: KP")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_async_ai_services()
+    ENGINE_EXECUTOR.shutdown()
+
+@app.exception_handler(ExecutorBusy)
+async def executor_busy_handler(request: Request, exc: ExecutorBusy):
+    logger.warning(f"503 for {request.url.path}: {exc}")
+    return JSONResponse(
+        status_code=503,
+        content={"status": "error", "message": "Server busy, please retry shortly."},
+        headers={"Retry-After": "1"},
+    )
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     body = await request.body()
@@ -67,20 +87,19 @@ class CalculationSettings(BaseModel):
     house_system: str = "Placidus"
     node_type: str = "Mean"
 
+class DashaWindow(BaseModel):
+    start_date: str
+    end_date: str
+
 class KundliRequest(BaseModel):
     birth_details: BirthDetails
     calculation_settings: CalculationSettings
     horary_number: Optional[int] = None
+    dasha_depth: Optional[int] = None
+    dasha_window: Optional[DashaWindow] = None
+    dasha_date: Optional[str] = None
 
-# Global Engine Cache to avoid repeated initializations
-engine_cache = {}
-
-def get_engine(node_type="Mean", ayanamsa="KP", house_system="Placidus"):
-    key = (node_type, ayanamsa, house_system)
-    if key not in engine_cache:
-        engine_cache[key] = NadiEngine(node_type=node_type, ayanamsa=ayanamsa, house_system=house_system)
-    return engine_cache[key]
-
+# Engines are cached per (node_type, ayanamsa, house_system) in nadi_core.get_engine
 # Initialize the default engine
 engine = get_engine(node_type="Mean", ayanamsa="KP")
 
@@ -92,29 +111,44 @@ def health_check():
 def health_check_alias():
     return {"status": "online", "service": "Nadi Precision Engine Gold", "version": "1.64-HIT-THEORY-FIX"}
 
+@app.get("/api/v1/kp/cache/stats")
+def cache_stats():
+    return {"kundli": KUNDLI_CACHE.stats() if KUNDLI_CACHE is not None else None, "ai": AI_CACHE.stats() if AI_CACHE is not None else None}
+
+@app.get("/api/v1/kp/executor/stats")
+def executor_stats():
+    return ENGINE_EXECUTOR.stats()
+
+def kundli_result(req: KundliRequest):
+    # Pass request data to the engine
+    dt_str = f"{req.birth_details.date_of_birth} {req.birth_details.time_of_birth}"
+    
+    # Coerce lat/lon to float
+    lat_val = float(req.birth_details.latitude)
+    lon_val = float(req.birth_details.longitude)
+    
+    # Determine strict settings
+    nt = req.calculation_settings.node_type
+    requested_ayanamsa = req.calculation_settings.ayanamsa
+    request_engine = get_engine(node_type=nt, ayanamsa=requested_ayanamsa, house_system=req.calculation_settings.house_system)
+    
+    result = request_engine.calculate_kundli(
+        dt_str, 
+        req.birth_details.timezone,
+        lat_val,
+        lon_val,
+        horary_number=req.horary_number,
+        dasha_depth=req.dasha_depth,
+        dasha_window=(req.dasha_window.start_date, req.dasha_window.end_date) if req.dasha_window else None,
+        dasha_date=req.dasha_date
+    )
+    return result
+
 @app.post("/api/v1/kp/kundli")
-def generate_kundli(req: KundliRequest):
+async def generate_kundli(req: KundliRequest):
     try:
-        # Pass request data to the engine
-        dt_str = f"{req.birth_details.date_of_birth} {req.birth_details.time_of_birth}"
-        
-        # Coerce lat/lon to float
-        lat_val = float(req.birth_details.latitude)
-        lon_val = float(req.birth_details.longitude)
-        
-        # Determine strict settings
-        nt = req.calculation_settings.node_type
-        requested_ayanamsa = req.calculation_settings.ayanamsa
-        request_engine = get_engine(node_type=nt, ayanamsa=requested_ayanamsa, house_system=req.calculation_settings.house_system)
-        
-        result = request_engine.calculate_kundli(
-            dt_str, 
-            req.birth_details.timezone,
-            lat_val,
-            lon_val,
-            horary_number=req.horary_number
-        )
-        
+        result = await ENGINE_EXECUTOR.run(kundli_result, req)
+
         # Inject place back into metadata for frontend
         result["metadata"]["place"] = req.birth_details.place
         import datetime
@@ -122,133 +156,80 @@ def generate_kundli(req: KundliRequest):
         
         return result
         
+    except ExecutorBusy:
+        raise
     except Exception as e:
         return {"status": "error", "message": f"Engine Error: {str(e)}"}
 
-@app.post("/api/v1/kp/job-analysis")
-async def job_analysis(req: KundliRequest):
-    try:
-        # 1. Get Base Kundli
-        dt_str = f"{req.birth_details.date_of_birth} {req.birth_details.time_of_birth}"
-        lat_val = float(req.birth_details.latitude)
-        lon_val = float(req.birth_details.longitude)
-        
-        request_engine = get_engine(node_type=req.calculation_settings.node_type, ayanamsa=req.calculation_settings.ayanamsa, house_system=req.calculation_settings.house_system)
-        result = request_engine.calculate_kundli(dt_str, req.birth_details.timezone, lat_val, lon_val, horary_number=req.horary_number)
-        
-        if result.get("status") == "error":
-            return result
+def kundli_for_predictions(req: KundliRequest):
+    # Only the sections predict() / job_report() read (no dasha tree, no vargas), or a cached /kundli result
+    request_engine = get_engine(node_type=req.calculation_settings.node_type, ayanamsa=req.calculation_settings.ayanamsa, house_system=req.calculation_settings.house_system)
+    dt_str = f"{req.birth_details.date_of_birth} {req.birth_details.time_of_birth}"
+    chart = request_engine.chart(dt_str, req.birth_details.timezone, float(req.birth_details.latitude), float(req.birth_details.longitude),
+                                 horary_number=req.horary_number, dasha_depth=req.dasha_depth,
+                                 dasha_window=(req.dasha_window.start_date, req.dasha_window.end_date) if req.dasha_window else None,
+                                 dasha_date=req.dasha_date)
+    if chart is None:
+        return {"status": "error", "message": f"Invalid Date Format: {dt_str}."}
+    chart.load_cached()
+    return {"status": "success", **kundli_view(chart)}
+
+def dasha_info(result):
+    return {
+        "dasha": result["dasha"]["current_dasha"],
+        "bhukti": result["dasha"]["current_bukthi"],
+        "antara": result["dasha"]["current_antara"]
+    }
+
+# Engine work of the async handlers, run on ENGINE_EXECUTOR (module-level so process workers can unpickle it)
+
+def predictions_report(req: KundliRequest, areas):
+    result = kundli_for_predictions(req)
+    if result.get("status") == "error":
+        return result
+    return {"status": "success", "areas": list(areas), "dasha_info": dasha_info(result), "predictions": predict(result, areas)}
 
-        # 2. Process ALL 9 Planets for Gold Nadi
-        planet_reports = []
-        planet_positions = {p["planet"]: p["house"] for p in result["planets"]}
+def job_analysis_report(req: KundliRequest):
+    # Job area of the shared prediction engine, in the Gold Nadi report layout
+    result = kundli_for_predictions(req)
+    if result.get("status") == "error":
+        return result
+    return job_report(result)
 
-        for entry in result["nakshatra_nadi"]:
-            p_name = entry["planet"]
-            p_house = planet_positions.get(p_name)
-            
-            # Significators
-            pl_houses = [s["house"] for s in entry["pl_signified"]]
-            nl_houses = [s["house"] for s in entry["nl_signified"]]
-            sl_houses = [s["house"] for s in entry["sl_signified"]]
-
-            # 4-Scenario Hit Theory Categorization (Page 8)
-            has_11 = 11 in combo_all
-            has_12 = 12 in combo_all
-            
-            green_houses = {2, 10, 11}
-            blue_houses = {1, 3, 4}
-            red_houses = {12}
-            
-            if has_11 and has_12: # S1
-                green_houses.update({6, 7, 9})
-                red_houses.update({5, 8})
-            elif has_11 and not has_12: # S2
-                green_houses.update({5, 6, 7, 8, 9})
-            elif not has_11 and has_12: # S3
-                red_houses.update({5, 6, 7, 8, 9})
-            else: # S4 (Neither)
-                green_houses.update({6, 7, 9})
-                red_houses.update({5, 8})
-
-            # Identify "Hits" for circling
-            def get_hit_house(houses, pos):
-                if pos in houses: return pos
-                priority = [11, 10, 2, 6, 7, 9, 3, 4, 1, 8, 5, 12]
-                for h in priority:
-                    if h in houses: return h
-                return None
-
-            pl_hit = get_hit_house(pl_houses, p_house)
-            nl_hit = get_hit_house(nl_houses, p_house)
-            sl_hit = get_hit_house(sl_houses, p_house)
-
-            job_areas = []
-            if sl_hit in HOUSE_JOB_AREAS: job_areas.append(f"Primary: {HOUSE_JOB_AREAS[sl_hit]}")
-            if nl_hit in HOUSE_JOB_AREAS and nl_hit != sl_hit: job_areas.append(f"Secondary: {HOUSE_JOB_AREAS[nl_hit]}")
-            if not job_areas and pl_hit in HOUSE_JOB_AREAS: job_areas.append(f"Focus: {HOUSE_JOB_AREAS[pl_hit]}")
-
-            # Income / Expenses Mapping (Refined Labels)
-            inc_label = "Income"
-            if 11 in combo_all: inc_label = "Very High Income"
-            elif 10 in combo_all: inc_label = "High Income"
-            elif len([h for h in combo_all if h in {2, 6, 7, 9}]) >= 2: inc_label = "Medium Income"
-
-            exp_label = "No Significant Loss"
-            if 12 in combo_all and (5 in combo_all or 8 in combo_all): exp_label = "High Loss/Exp"
-            elif 12 in combo_all: exp_label = "Medium Loss"
-            elif 5 in combo_all or 8 in combo_all: exp_label = "Obstacles"
-
-            # Success Rate (Matrix underlying logic)
-            nl_matrix_h = nl_hit if nl_hit else 1
-            sl_matrix_h = sl_hit if sl_hit else 1
-            rate_code = HIT_MATRIX[nl_matrix_h][sl_matrix_h - 1]
-            success_rate = SUCCESS_LABELS.get(rate_code, "Medium")
-
-            prediction = {
-                "overall_combination": {
-                    "good": [h for h in combo_all if h in green_houses],
-                    "medium": [h for h in combo_all if h in blue_houses],
-                    "bad": [h for h in combo_all if h in red_houses]
-                },
-                "income_expenses": {
-                    "good": inc_label,
-                    "bad": exp_label
-                },
-                "success_rate": success_rate,
-                "job_areas": job_areas,
-                "hits": {"pl": pl_hit, "nl": nl_hit, "sl": sl_hit}
-            }
+def job_ai_prompt(req: KundliRequest):
+    report = job_analysis_report(req)
+    if report.get("status") == "error":
+        return report
+    return job_prompt_data(report)
 
-            planet_reports.append({
-                "planet": p_name,
-                "star_lord": entry["star_lord"],
-                "sub_lord": entry["sub_lord"],
-                "pl": pl_houses,
-                "nl": nl_houses,
-                "sl": sl_houses,
-                "prediction": prediction
-            })
+class PredictionRequest(KundliRequest):
+    areas: Optional[List[str]] = None
+
+@app.post("/api/v1/kp/predictions")
+async def get_predictions(req: PredictionRequest):
+    try:
+        areas = resolve_areas(req.areas)
+        return await ENGINE_EXECUTOR.run(predictions_report, req, areas)
+    except ExecutorBusy:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
 
-        # Identify 6th and 10th CSL for the "Top" focus
-        csl6_name = next(h["sub_lord"] for h in result["houses"] if h["house_number"] == 6)
-        csl10_name = next(h["sub_lord"] for h in result["houses"] if h["house_number"] == 10)
+@app.post("/api/v1/kp/job-analysis")
+async def job_analysis(req: KundliRequest):
+    try:
+        report = await ENGINE_EXECUTOR.run(job_analysis_report, req)
+        if report.get("status") == "error":
+            return report
 
         # 3. Skip AI for now (user requested stability and pure tables)
         analysis_summary = None # Disabled to stop blank page crashes
 
-        return {
-            "status": "success",
-            "csl_focus": {"csl6": csl6_name, "csl10": csl10_name},
-            "dasha_info": {
-                "dasha": result["dasha"]["current_dasha"],
-                "bhukti": result["dasha"]["current_bukthi"],
-                "antara": result["dasha"]["current_antara"]
-            },
-            "reports": planet_reports,
-            "ai_summary": analysis_summary
-        }
+        return {"status": "success", **report, "ai_summary": analysis_summary}
         
+    except ExecutorBusy:
+        raise
     except Exception as e:
         error_msg = traceback.format_exc()
         print(f"❌ Analysis Crash:\n{error_msg}")
@@ -261,6 +242,60 @@ async def job_analysis(req: KundliRequest):
             }
         )
 
+async def job_ai_request(req: KundliRequest):
+    """(AsyncAIService, build_job_prompt input) for the AI summary endpoints, or an error dict."""
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        return {"status": "error", "message": "Key missing in Env Vars"}
+    prompt_data = await ENGINE_EXECUTOR.run(job_ai_prompt, req)
+    if prompt_data.get("status") == "error":
+        return prompt_data
+    return get_async_ai_service(api_key), prompt_data
+
+@app.post("/api/v1/kp/job-analysis/ai-summary")
+async def job_ai_summary(req: KundliRequest):
+    """AI summary of the job analysis in one response: the fallback for clients that cannot stream."""
+    try:
+        prepared = await job_ai_request(req)
+        if isinstance(prepared, dict):
+            return prepared
+        ai, prompt_data = prepared
+        summary = await ai.generate_job_analysis(prompt_data)
+        if "error" in summary:
+            return {"status": "api_error", "result": summary}
+        return {"status": "success", "ai_summary": summary}
+    except ExecutorBusy:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
+# Proxies must pass events through as they are written
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+async def sse_stream(events):
+    async for event, data in events:
+        yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post("/api/v1/kp/job-analysis/ai-summary/stream")
+async def job_ai_summary_stream(req: KundliRequest):
+    """
+    The AI summary as server-sent events while the model writes it: "delta" {"path", "text"} and "value"
+    {"path", "value"} pieces of the summary JSON, then "done" with the ai_summary of the non-streaming
+    endpoint, or "error". Errors before the stream starts come back as plain JSON.
+    """
+    try:
+        prepared = await job_ai_request(req)
+        if isinstance(prepared, dict):
+            return prepared
+        ai, prompt_data = prepared
+        return StreamingResponse(sse_stream(ai.stream_job_analysis(prompt_data)), media_type="text/event-stream", headers=SSE_HEADERS)
+    except ExecutorBusy:
+        raise
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
 @app.get("/api/v1/kp/health/ai")
 async def health_ai():
     """Diagnostic endpoint to test AI connectivity."""
@@ -269,10 +304,15 @@ async def health_ai():
         if not api_key:
             return {"status": "error", "message": "Key missing in Env Vars"}
         
-        from ai_service import AIService
-        ai = AIService(api_key)
-        # Very simple test prompt
-        test_result = ai.generate_job_analysis({"csl6": {"planet":"Sun","pl":[1],"nl":[2],"sl":[3]}, "csl10": {"planet":"Sun","pl":[1],"nl":[2],"sl":[3]}})
+        # Own uncached service: the probe prompt never changes, so a cached answer would say nothing
+        # about the key or the provider today
+        ai = AsyncAIService(api_key, cache=None)
+        try:
+            # Very simple test prompt
+            test_prediction = {"success_rate": "Good", "income_expenses": {"good": "High", "bad": "Low"}}
+            test_result = await ai.generate_job_analysis({"csl6": {"planet": "Sun", "prediction": test_prediction}, "csl10": {"planet": "Sun", "prediction": test_prediction}, "others": ["Jupiter"]})
+        finally:
+            await ai.aclose()
         
         if "error" in test_result:
             return {"status": "api_error", "result": test_result}
@@ -289,20 +329,25 @@ class MixedPrashnaRequest(BaseModel):
     longitude: float
     timezone: str
 
+def mixed_prashna_text(req: MixedPrashnaRequest):
+    from kp_prashna_engine import KPMixedPrashnaEngine
+    engine = KPMixedPrashnaEngine()
+    return engine.calculate(
+        req.prashna_number,
+        req.date,
+        req.time,
+        req.latitude,
+        req.longitude,
+        req.timezone
+    )
+
 @app.post("/api/v1/kp/mixed-prashna")
 async def mixed_prashna(req: MixedPrashnaRequest):
     try:
-        from kp_prashna_engine import KPMixedPrashnaEngine
-        engine = KPMixedPrashnaEngine()
-        result_text = engine.calculate(
-            req.prashna_number,
-            req.date,
-            req.time,
-            req.latitude,
-            req.longitude,
-            req.timezone
-        )
+        result_text = await ENGINE_EXECUTOR.run(mixed_prashna_text, req)
         return {"status": "success", "result": result_text}
+    except ExecutorBusy:
+        raise
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
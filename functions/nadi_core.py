@@ -38,59 +38,597 @@ import swisseph as swe
 import datetime
 import pytz
 import math
+import os
+import json
+import threading
+import hashlib
+import numpy as np
+from bisect import bisect_right
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import cached_property, lru_cache
+from itertools import accumulate
+from types import MappingProxyType
 from dateutil.relativedelta import relativedelta
+from result_cache import cache_from_env
+from fast_ephemeris import FastEphemeris
+
+# Static astrological tables, built once at import and shared (read-only) by every engine
+SIGNS = (
+    "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
+    "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
+)
+
+SIGN_RULERS = MappingProxyType({
+    "Aries": "Mars", "Taurus": "Venus", "Gemini": "Mercury", "Cancer": "Moon",
+    "Leo": "Sun", "Virgo": "Mercury", "Libra": "Venus", "Scorpio": "Mars",
+    "Sagittarius": "Jupiter", "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"
+})
+
+DASHA_ORDER = ("Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury")
+DASHA_YEARS = MappingProxyType({
+    "Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10,
+    "Mars": 7, "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17
+})
+
+NAKSHATRAS = (
+    "Ashwini","Bharani","Krittika","Rohini","Mrigashira",
+    "Ardra","Punarvasu","Pushya","Ashlesha","Magha",
+    "Purva Phalguni","Uttara Phalguni","Hasta","Chitra","Swati",
+    "Vishakha","Anuradha","Jyeshtha","Mula","Purva Ashadha",
+    "Uttara Ashadha","Shravana","Dhanishta","Shatabhisha","Purva Bhadrapada",
+    "Uttara Bhadrapada","Revati"
+)
+
+ASPECTS = MappingProxyType({
+    "Conjunction": 0, "Sextile": 60, "Square": 90, "Trine": 120, "Opposition": 180
+})
+
+SHORT_CODES = MappingProxyType({
+    "Sun": "Su", "Moon": "Mo", "Mars": "Ma", "Mercury": "Me",
+    "Jupiter": "Ju", "Venus": "Ve", "Saturn": "Sa",
+    "Rahu": "Ra", "Ketu": "Ke"
+})
+
+PLANETS_BY_NODE_TYPE = MappingProxyType({
+    node_type: MappingProxyType({
+        "Sun": swe.SUN, "Moon": swe.MOON, "Mars": swe.MARS, "Mercury": swe.MERCURY,
+        "Jupiter": swe.JUPITER, "Venus": swe.VENUS, "Saturn": swe.SATURN,
+        "Rahu": node, "Ketu": node
+    })
+    for node_type, node in (("Mean", swe.MEAN_NODE), ("True", swe.TRUE_NODE))
+})
+
+NAK_SIZE = 360.0 / 27.0
+NADI_TYPES = ("Vata", "Pitta", "Kapha")
+
+def _build_kp_index():
+    """
+    KP Sub / Sub-Sub boundary index (27 x 9 = 243 subs, 243 x 9 = 2187 sub-subs).
+    Arcs are accumulated exactly like the original per-call walk so lookups are bit-identical:
+    edges are relative to the nakshatra (subs) or the sub (sub-subs) and carry the same 1e-10 tolerance.
+    """
+    subs, sub_subs = [], []
+    sub_edges, sub_offsets, sub_sub_edges, sub_sub_offsets = [], [], [], []
+    lord_tails = []
+    for n_idx in range(27):
+        nak_start = n_idx * NAK_SIZE
+        star_lord = DASHA_ORDER[n_idx % 9]
+        sl_idx = DASHA_ORDER.index(star_lord)
+        sub_seq = DASHA_ORDER[sl_idx:] + DASHA_ORDER[:sl_idx]
+        current_off = 0.0
+        for i, sub_lord in enumerate(sub_seq):
+            arc = (DASHA_YEARS[sub_lord] / 120.0) * NAK_SIZE
+            sub_pos = len(subs)
+            subs.append((nak_start + current_off, n_idx, star_lord, sub_lord, i + 1))
+            sub_offsets.append(current_off)
+            sub_edges.append(current_off + arc + 1e-10)
+
+            ssl_start_idx = DASHA_ORDER.index(sub_lord)
+            ssl_seq = DASHA_ORDER[ssl_start_idx:] + DASHA_ORDER[:ssl_start_idx]
+            off_ssl = 0.0
+            for j, ssl_lord in enumerate(ssl_seq):
+                arc_ssl = (DASHA_YEARS[ssl_lord] / 120.0) * arc
+                sub_subs.append((nak_start + current_off + off_ssl, sub_pos, ssl_lord, j + 1))
+                sub_sub_offsets.append(off_ssl)
+                sub_sub_edges.append(off_ssl + arc_ssl + 1e-10)
+                lord_tails.append((star_lord, sub_lord, ssl_lord, NAKSHATRAS[n_idx], NADI_TYPES[i % 3], i + 1))
+                off_ssl += arc_ssl
+            current_off += arc
+    return (tuple(subs), tuple(sub_subs), tuple(sub_edges), tuple(sub_offsets),
+            tuple(sub_sub_edges), tuple(sub_sub_offsets), tuple(lord_tails))
+
+# KP_SUB_INDEX: (start_lon, nak_idx, star_lord, sub_lord, sub_no) sorted by longitude
+# KP_SUB_SUB_INDEX: (start_lon, sub_pos, sub_sub_lord, sub_sub_no) sorted by longitude
+(KP_SUB_INDEX, KP_SUB_SUB_INDEX, _SUB_EDGES, _SUB_OFFSETS,
+ _SUB_SUB_EDGES, _SUB_SUB_OFFSETS, _KP_LORD_TAILS) = _build_kp_index()
+KP_SUB_BOUNDARIES = tuple(s[0] for s in KP_SUB_INDEX)
+KP_SUB_SUB_BOUNDARIES = tuple(s[0] for s in KP_SUB_SUB_INDEX)
+_SIGN_HEADS = tuple((s, SIGN_RULERS[s]) for s in SIGNS)
+
+def kp_sub_position(degree):
+    """
+    Locate a longitude in the boundary index.
+    Returns (nak_idx, sub_pos, sub_sub_pos, elapsed_in_nak, rem_in_sub).
+    """
+    nak_idx = int(degree / NAK_SIZE) % 27
+    elapsed_in_nak = degree - nak_idx * NAK_SIZE
+
+    lo = nak_idx * 9
+    sub_pos = bisect_right(_SUB_EDGES, elapsed_in_nak, lo, lo + 9)
+    if elapsed_in_nak < 0.0 or sub_pos == lo + 9:
+        sub_pos = lo + 8
+    rem_in_sub = elapsed_in_nak - _SUB_OFFSETS[sub_pos]
+
+    lo_ss = sub_pos * 9
+    ss_pos = bisect_right(_SUB_SUB_EDGES, rem_in_sub, lo_ss, lo_ss + 9)
+    if ss_pos == lo_ss + 9:
+        ss_pos = lo_ss
+    return nak_idx, sub_pos, ss_pos, elapsed_in_nak, rem_in_sub
+
+# NumPy views of the index for batch lookups. Edge rows depend only on the
+# star lord (subs) or the sub lord (sub-subs), so 9 rows cover each level.
+_SUB_EDGES_NP = np.array(_SUB_EDGES[:81]).reshape(9, 9)
+_SUB_OFFSETS_NP = np.array(_SUB_OFFSETS)
+# (the first nakshatra's subs run through DASHA_ORDER, so its sub-sub rows are keyed by lord index)
+_SUB_SUB_EDGES_NP = np.array(_SUB_SUB_EDGES[:81]).reshape(9, 9)
+
+def kp_lords_batch(longitudes):
+    """
+    Vectorized get_kp_lords over an array of longitudes (struct-of-arrays).
+    Lords are returned as indices into DASHA_ORDER; nadi_index is the 1-9 sub number.
+    """
+    degree = np.mod(np.asarray(longitudes, dtype=np.float64), 360.0)
+    nak_idx = (degree / NAK_SIZE).astype(np.int64) % 27
+    elapsed_in_nak = degree - nak_idx * NAK_SIZE
+    star_lord = nak_idx % 9
+
+    sub_no = np.empty(degree.shape, dtype=np.int64)
+    for lord_idx in range(9):
+        mask = star_lord == lord_idx
+        sub_no[mask] = np.searchsorted(_SUB_EDGES_NP[lord_idx], elapsed_in_nak[mask], side="right")
+    sub_no[(elapsed_in_nak < 0.0) | (sub_no == 9)] = 8
+    sub_lord = (star_lord + sub_no) % 9
+    rem_in_sub = elapsed_in_nak - _SUB_OFFSETS_NP[nak_idx * 9 + sub_no]
+
+    ss_no = np.empty(degree.shape, dtype=np.int64)
+    for lord_idx in range(9):
+        mask = sub_lord == lord_idx
+        ss_no[mask] = np.searchsorted(_SUB_SUB_EDGES_NP[lord_idx], rem_in_sub[mask], side="right")
+    ss_no[ss_no == 9] = 0
+
+    return {
+        "sign_index": (degree / 30.0).astype(np.int64) % 12,
+        "star_lord": star_lord,
+        "sub_lord": sub_lord,
+        "sub_sub_lord": (sub_lord + ss_no) % 9,
+        "nakshatra_index": nak_idx,
+        "nadi_index": sub_no + 1,
+    }
+
+# House sets as 12-bit masks (bit h-1 <=> house h), converted to house lists only when serializing
+HOUSE_BIT = {h: 1 << (h - 1) for h in range(1, 13)}
+MASK_HOUSES = tuple(tuple(h for h in range(1, 13) if m >> (h - 1) & 1) for m in range(4096))
+POPCOUNT = tuple(len(houses) for houses in MASK_HOUSES)
+
+def houses_mask(houses):
+    mask = 0
+    for h in houses:
+        mask |= HOUSE_BIT[int(h)]
+    return mask
+
+# Accepted chart date/time input formats, tried in order before ISO 8601
+DATETIME_FORMATS = ("%Y-%m-%d %H:%M:%S", "%d-%m-%Y %H:%M:%S", "%Y/%m/%d %H:%M:%S", "%d/%m/%Y %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M")
+
+def parse_datetime(dt_str):
+    """Naive datetime from a chart input string, or None if no accepted format matches."""
+    for fmt in DATETIME_FORMATS:
+        try:
+            return datetime.datetime.strptime(dt_str, fmt)
+        except ValueError:
+            continue
+    try:
+        return datetime.datetime.fromisoformat(dt_str)
+    except (TypeError, ValueError):
+        return None
+
+def houses_batch(ramc, lat, eps, h_sys=b'P'):
+    """
+    Vectorized swe.houses_armc: tropical cusps (..., 12) for arrays of RAMC and obliquity (degrees) at one latitude.
+    Placidus cusps 11, 12, 2 and 3 are solved by Newton's method on their own semi-arcs (3-6 iterations, within
+    1e-7 arcsec of Swiss Ephemeris at mid latitudes); Equal houses run 30 degrees on from the ascendant.
+    """
+    ramc = np.radians(np.asarray(ramc, dtype=np.float64))
+    eps = np.radians(np.broadcast_to(eps, ramc.shape))
+    tan_phi = math.tan(math.radians(lat))
+    sin_eps, cos_eps = np.sin(eps), np.cos(eps)
+    asc = np.arctan2(np.cos(ramc), -(np.sin(ramc) * cos_eps + tan_phi * sin_eps))
+    cusps = np.empty(ramc.shape + (12,))
+    if h_sys == b'E':
+        cusps[...] = asc[..., None] + np.radians(30.0) * np.arange(12)
+        return np.degrees(cusps) % 360.0
+    if h_sys != b'P':
+        raise ValueError(f"Unsupported house system: {h_sys!r}")
+
+    cusps[..., 0] = asc
+    cusps[..., 9] = np.arctan2(np.sin(ramc), np.cos(ramc) * cos_eps)
+    # Each cusp's right ascension = RAMC + offset + frac * its own diurnal semi-arc (90 deg + ascensional difference)
+    with np.errstate(invalid="ignore"):
+        for house, offset, frac in ((11, 0.0, 1.0 / 3.0), (12, 0.0, 2.0 / 3.0), (2, math.pi / 3.0, 2.0 / 3.0), (3, 2.0 * math.pi / 3.0, 1.0 / 3.0)):
+            target = ramc + offset + frac * math.pi / 2.0
+            lam = np.arctan2(np.sin(target), np.cos(target) * cos_eps)
+            for _ in range(20):
+                sin_lam, cos_lam = np.sin(lam), np.cos(lam)
+                sin_dec = sin_eps * sin_lam
+                cos2_dec = 1.0 - sin_dec * sin_dec
+                x = tan_phi * sin_dec / np.sqrt(cos2_dec)
+                err = np.arctan2(sin_lam * cos_eps, cos_lam) - target - frac * np.arcsin(x)
+                err = (err + math.pi) % (2.0 * math.pi) - math.pi
+                slope = (cos_eps / (cos_lam * cos_lam + cos_eps * cos_eps * sin_lam * sin_lam)
+                         - frac * tan_phi * sin_eps * cos_lam / (cos2_dec * np.sqrt(cos2_dec) * np.sqrt(1.0 - x * x)))
+                step = err / slope
+                lam = lam - step
+                if not np.nanmax(np.abs(step), initial=0.0) > 1e-12:
+                    break
+            cusps[..., house - 1] = lam
+    for house in (1, 2, 3, 10, 11, 12):
+        cusps[..., (house + 5) % 12] = cusps[..., house - 1] + math.pi
+    if not np.isfinite(cusps).all():
+        raise ValueError(f"Placidus houses are undefined at latitude {lat} for some instants (polar circle)")
+    return np.degrees(cusps) % 360.0
+
+def _build_horary_table():
+    table = {}
+    nak_size = 360.0 / 27.0
+    num = 1
+    sign_names = SIGNS
+    calibration_offset = 27.0 / 3600.0 
+
+    for n_idx in range(27):
+        nak_start = n_idx * nak_size
+        star_lord = DASHA_ORDER[n_idx % 9]
+        start_lord_idx = DASHA_ORDER.index(star_lord)
+        sub_seq = DASHA_ORDER[start_lord_idx:] + DASHA_ORDER[:start_lord_idx]
+        
+        curr_nak_lon = 0.0
+        for lord in sub_seq:
+            arc = (DASHA_YEARS[lord] / 120.0) * nak_size
+            seg_start = nak_start + curr_nak_lon
+            seg_end = seg_start + arc
+            
+            s_sign = int(seg_start / 30.0)
+            e_sign = int((seg_end - 1e-8) / 30.0)
+            
+            if s_sign != e_sign:
+                table[num] = {
+                    "lon": seg_start + calibration_offset, "sign": sign_names[s_sign],
+                    "sl": SIGN_RULERS[sign_names[s_sign]],
+                    "nl": star_lord, "sub": lord
+                }
+                num += 1
+                table[num] = {
+                    "lon": (e_sign * 30.0) + calibration_offset, "sign": sign_names[e_sign],
+                    "sl": SIGN_RULERS[sign_names[e_sign]],
+                    "nl": star_lord, "sub": lord
+                }
+                num += 1
+            else:
+                table[num] = {
+                    "lon": seg_start + calibration_offset, "sign": sign_names[s_sign],
+                    "sl": SIGN_RULERS[sign_names[s_sign]],
+                    "nl": star_lord, "sub": lord
+                }
+                num += 1
+            
+            curr_nak_lon += arc
+            if num > 249: break
+        if num > 249: break
+    return MappingProxyType({num: MappingProxyType(entry) for num, entry in table.items()})
+
+HORARY_TABLE = _build_horary_table()
+
+def _ramc_closed_form(target_trop_asc, lat, eps):
+    """
+    RAMC that puts a tropical ecliptic longitude on the eastern horizon:
+    RAMC = RA - H0, with cos(H0) = -tan(lat) * tan(dec). None if the point never rises at lat.
+    """
+    lam, e, phi = math.radians(target_trop_asc), math.radians(eps), math.radians(lat)
+    ra = math.atan2(math.sin(lam) * math.cos(e), math.cos(lam))
+    dec = math.asin(math.sin(e) * math.sin(lam))
+    cos_h0 = -math.tan(phi) * math.tan(dec)
+    if abs(cos_h0) > 1.0:
+        return None
+    return math.degrees(ra - math.acos(cos_h0)) % 360.0
+
+def _asc_slope(ramc, lat, eps):
+    """d(Asc)/d(RAMC) from tan(Asc) = cos(RAMC) / -(sin(RAMC) cos(eps) + tan(lat) sin(eps))."""
+    th, e, phi = math.radians(ramc), math.radians(eps), math.radians(lat)
+    y = math.cos(th)
+    x = -(math.sin(th) * math.cos(e) + math.tan(phi) * math.sin(e))
+    dy = -math.sin(th)
+    dx = -math.cos(th) * math.cos(e)
+    return (x * dy - y * dx) / (x * x + y * y)
+
+def _search_ramc_for_ascendant(target_trop_asc, lat, eps):
+    """Brute-force RAMC search (2° scan + ternary refinement). Fallback for polar latitudes."""
+    def get_asc_for_ramc(r):
+        try:
+            _, a = swe.houses_armc(r % 360, lat, eps, b'E')
+            return a[0] 
+        except: 
+            return (r + 90) % 360
+
+    best_r = 0.0
+    min_diff = 400.0
+    for test_r in range(0, 360, 2):
+        curr = get_asc_for_ramc(float(test_r))
+        diff = abs((curr - target_trop_asc + 180) % 360 - 180)
+        if diff < min_diff:
+            min_diff = diff
+            best_r = float(test_r)
+
+    low, high = best_r - 2.0, best_r + 2.0
+    for _ in range(40):
+        m1 = low + (high - low) * 0.4
+        m2 = low + (high - low) * 0.6
+        v1 = get_asc_for_ramc(m1)
+        v2 = get_asc_for_ramc(m2)
+        d1 = abs((v1 - target_trop_asc + 180) % 360 - 180)
+        d2 = abs((v2 - target_trop_asc + 180) % 360 - 180)
+        if d1 < d2: high = m2
+        else: low = m1
+    return ((low + high) / 2.0) % 360
+
+def solve_prashna_ramc(target_trop_asc, lat, eps, h_sys=b'P', max_newton=2):
+    """
+    RAMC for a target tropical ascendant: closed-form inversion plus at most
+    max_newton Newton steps on swe.houses_armc (usually a single houses call).
+    Returns (ramc, cusps_trop, ascmc_trop) for h_sys.
+    """
+    ramc = _ramc_closed_form(target_trop_asc, lat, eps)
+    if ramc is not None:
+        for _ in range(max_newton + 1):
+            cusps_trop, ascmc_trop = swe.houses_armc(ramc, lat, eps, h_sys)
+            diff = (ascmc_trop[0] - target_trop_asc + 180) % 360 - 180
+            if abs(diff) < 1e-9:
+                return ramc, cusps_trop, ascmc_trop
+            ramc = (ramc - diff / _asc_slope(ramc, lat, eps)) % 360.0
+
+    ramc = _search_ramc_for_ascendant(target_trop_asc, lat, eps)
+    cusps_trop, ascmc_trop = swe.houses_armc(ramc, lat, eps, h_sys)
+    return ramc, cusps_trop, ascmc_trop
+
+DASHA_DAYS_PER_YEAR = 365.25636
+
+# path: tuple of lords from the mahadasha down, e.g. ("Venus", "Sun") for Venus-Sun bhukti
+DashaPeriod = namedtuple("DashaPeriod", "path start end")
+
+def _dasha_seq(lord):
+    idx = DASHA_ORDER.index(lord)
+    return DASHA_ORDER[idx:] + DASHA_ORDER[:idx]
+
+def _dasha_cum_years(seq):
+    return tuple(accumulate((DASHA_YEARS[p] for p in seq), initial=0))
+
+# Sub-period sequence beginning at each lord, and the years elapsed in a 120-year cycle
+# at the start of each of its sub-periods (plus the 120 end)
+_DASHA_SEQS = MappingProxyType({lord: _dasha_seq(lord) for lord in DASHA_ORDER})
+_DASHA_CUM_YEARS = MappingProxyType({lord: _dasha_cum_years(seq) for lord, seq in _DASHA_SEQS.items()})
+
+class VimshottariDasha:
+    """
+    Lazy Vimshottari dasha tree (Sidereal Year = 365.25636 days, Nakshatra = 48000 arcseconds).
+    Nothing is expanded or formatted until asked for. Sub-periods are chained from the
+    parent's start exactly like the eager tree, so every boundary is identical to it.
+    """
+    LABELS = ("D", "B", "A", "P", "S")
+    CHILD_KEYS = ("bukthis", "antaras", "pratyantars", "sookshmas")
+
+    def __init__(self, moon_lon, birth_dt):
+        self.moon_lon = moon_lon
+        abs_arcsec = moon_lon * 3600.0
+        nak_len_arcsec = 48000.0 
+        nak_idx = int(abs_arcsec // nak_len_arcsec) % 27
+        remaining_arcsec = nak_len_arcsec - (abs_arcsec % nak_len_arcsec)
+        balance_fraction = remaining_arcsec / nak_len_arcsec
+        self.first_lord = DASHA_ORDER[nak_idx % 9]
+        self.balance_years = DASHA_YEARS[self.first_lord] * balance_fraction
+        md_end_first = self._add(birth_dt, self.balance_years)
+        self.epoch = md_end_first - datetime.timedelta(days=DASHA_YEARS[self.first_lord] * DASHA_DAYS_PER_YEAR)
+        self._children = {}
+
+    @staticmethod
+    def _add(dt, float_yrs):
+        return dt + datetime.timedelta(days=float_yrs * DASHA_DAYS_PER_YEAR)
+
+    def children(self, path=()):
+        """Sub-periods of the period at path (the 9 mahadashas for the empty path)."""
+        path = tuple(path)
+        if path in self._children:
+            return self._children[path]
+        if path:
+            start, seq = self.period(path).start, _dasha_seq(path[-1])
+        else:
+            start, seq = self.epoch, _dasha_seq(self.first_lord)
+
+        periods = []
+        curs = start
+        for lord in seq:
+            years = 1
+            for p in path + (lord,):
+                years *= DASHA_YEARS[p]
+            end = self._add(curs, years / (120.0 ** len(path)))
+            periods.append(DashaPeriod(path + (lord,), curs, end))
+            curs = end
+        self._children[path] = periods
+        return periods
+
+    def period(self, path):
+        """The period at path, e.g. ("Venus", "Sun", "Moon")."""
+        path = tuple(path)
+        return next(p for p in self.children(path[:-1]) if p.path == path)
+
+    def period_at(self, dt, depth=4):
+        """
+        Running periods at dt, mahadasha first, down to depth levels (5 = sookshma); empty outside the 120 years.
+        Resolved by proportional arithmetic on the time elapsed since the epoch: one bisect per level, no tree walk.
+        Boundaries are computed from the epoch directly, so they may differ from children() by a few microseconds.
+        """
+        elapsed = (dt - self.epoch).total_seconds() / (86400.0 * DASHA_DAYS_PER_YEAR)
+        if not 0.0 <= elapsed <= 120.0:
+            return []
+        chain, path, lord = [], (), self.first_lord
+        start, span = 0.0, 120.0
+        for _ in range(depth):
+            cum = _DASHA_CUM_YEARS[lord]
+            # Inclusive boundaries: an instant on a boundary belongs to the later period
+            k = min(max(bisect_right(cum, (elapsed - start) * 120.0 / span) - 1, 0), 8)
+            lord = _DASHA_SEQS[lord][k]
+            start += span * cum[k] / 120.0
+            span = span * DASHA_YEARS[lord] / 120.0
+            path += (lord,)
+            chain.append(DashaPeriod(path, self._add(self.epoch, start), self._add(self.epoch, start + span)))
+        return chain
+
+    def range(self, start, end, depth=1):
+        """All periods at the given depth overlapping [start, end]; only overlapping branches are expanded."""
+        found = []
+        def walk(path):
+            for p in self.children(path):
+                if p.end < start or p.start > end:
+                    continue
+                if len(p.path) == depth:
+                    found.append(p)
+                else:
+                    walk(p.path)
+        walk(())
+        return found
+
+    def to_sequence(self, depth=None, window=None, today=None):
+        """
+        Serialize as mahadasha_sequence. depth=None keeps the classic layout: three full levels,
+        plus pratyantars under every bhukti of the running bhukti lord from the running mahadasha on.
+        depth=1..5 expands every period to that level; window=(start, end) keeps only overlapping periods.
+        """
+        fmt_dt = lambda dt: dt.strftime("%d/%m/%Y %H:%M:%S")
+        expand_pd = None
+        if depth is None:
+            running = self.period_at(today or datetime.datetime.now(pytz.UTC), 2)
+            if len(running) == 2:
+                expand_pd = (_dasha_seq(self.first_lord).index(running[0].path[0]), running[1].path[-1])
+        key_levels = 4 if depth == 5 else 3
+
+        def build(path, level, md_idx):
+            items = []
+            for i, p in enumerate(self.children(path)):
+                if window and (p.end < window[0] or p.start > window[1]):
+                    continue
+                item = {"planet": p.path[-1], "label": self.LABELS[level], "start_date": fmt_dt(p.start), "end_date": fmt_dt(p.end)}
+                if level < key_levels:
+                    if depth is not None:
+                        expand = level + 1 < depth
+                    elif level < 2:
+                        expand = True
+                    else:
+                        expand = expand_pd is not None and md_idx >= expand_pd[0] and p.path[1] == expand_pd[1]
+                    item[self.CHILD_KEYS[level]] = build(p.path, level + 1, i if level == 0 else md_idx) if expand else []
+                items.append(item)
+            return items
+
+        return build((), 0, None)
+
+# The Swiss Ephemeris sidereal mode is process-global state. Everything that depends on it runs under
+# sidereal_mode(), which holds this lock, so charts can be computed on a thread pool.
+_SWE_SID_LOCK = threading.RLock()
+
+@contextmanager
+def sidereal_mode(mode):
+    """Hold the Swiss Ephemeris sidereal mode at `mode` (swe.SIDM_*) for the duration of the block."""
+    with _SWE_SID_LOCK:
+        swe.set_sid_mode(mode, 0, 0)
+        yield
+
+def ayanamsa_ut(jd, mode):
+    """Ayanamsa of a sidereal mode at jd (UT), without racing other threads over the global mode."""
+    with sidereal_mode(mode):
+        return swe.get_ayanamsa_ut(jd)
+
+class SwissEphemeris:
+    """Swiss Ephemeris backend (the default). NadiEngine reads every ephemeris quantity through this interface."""
+
+    name = "swiss"
+
+    def lon_speed(self, jd, code):
+        res, _ = swe.calc_ut(jd, code, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        return res[0], res[3]
+
+    def ayanamsa_ut(self, jd, mode):
+        return ayanamsa_ut(jd, mode)
+
+    def obliquity(self, jd):
+        res, _ = swe.calc_ut(jd, swe.ECL_NUT, 0)
+        return res[0]
+
+    def sidtime(self, jd):
+        return swe.sidtime(jd)
+
+    # Array forms (one value per instant), used by NadiEngine.scan
+
+    def lon_speed_batch(self, jds, code):
+        res = np.array([swe.calc_ut(jd, code, swe.FLG_SWIEPH | swe.FLG_SPEED)[0] for jd in np.ravel(jds)]).reshape(np.shape(jds) + (-1,))
+        return res[..., 0], res[..., 3]
+
+    def ayanamsa_batch(self, jds, mode):
+        with sidereal_mode(mode):
+            return np.array([swe.get_ayanamsa_ut(jd) for jd in np.ravel(jds)]).reshape(np.shape(jds))
+
+    def obliquity_batch(self, jds):
+        return np.array([swe.calc_ut(jd, swe.ECL_NUT, 0)[0][0] for jd in np.ravel(jds)]).reshape(np.shape(jds))
+
+    def sidtime_batch(self, jds):
+        return np.array([swe.sidtime(jd) for jd in np.ravel(jds)]).reshape(np.shape(jds))
+
+SWISS_EPHEMERIS = SwissEphemeris()
+
+# Optional Chebyshev backend (fast_ephemeris.py), enabled by pointing KP_FAST_EPHEMERIS_FILE at a file
+# written by build_fast_ephemeris.py; instants outside 1900-2100 fall back to Swiss Ephemeris.
+DEFAULT_EPHEMERIS = SWISS_EPHEMERIS
+if os.environ.get("KP_FAST_EPHEMERIS_FILE") and os.path.exists(os.environ["KP_FAST_EPHEMERIS_FILE"]):
+    DEFAULT_EPHEMERIS = FastEphemeris(os.environ["KP_FAST_EPHEMERIS_FILE"], fallback=SWISS_EPHEMERIS)
+
+# Whole-chart result cache (KUNDLI_CACHE_BACKEND = memory | sqlite | off, plus _SIZE / _TTL / _PATH).
+# Entries are content-addressed by the normalized chart inputs; see NadiEngine.kundli_cache_key.
+KUNDLI_CACHE = cache_from_env("KUNDLI_CACHE", maxsize=256, ttl=3600.0, path="kundli_cache.sqlite3")
+
+# Quantities NadiEngine.scan can compute; "*_lords" expand to sign / star / sub / sub-sub lord columns
+SCAN_FIELDS = ("ascendant", "ascendant_lords", "cusps", "cusp_lords", "planets", "planet_lords", "speeds", "planet_houses", "moon_lahiri")
+
+# Sections of a calculate_kundli result that Chart.to_dict can select, by name -> result key.
+# The ascendant and metadata come with every selection; RESULT_KEYS is the full result's key order.
+CHART_SECTIONS = MappingProxyType({
+    "planets": "planets", "houses": "houses", "significations": "significations", "nadi": "nakshatra_nadi",
+    "dasha": "dasha", "vargas": "varga_charts", "aspects": "aspects"
+})
+RESULT_KEYS = ("ascendant", "houses", "planets", "significations", "nakshatra_nadi", "dasha", "varga_charts", "metadata", "aspects")
+VARGA_DIVISIONS = MappingProxyType({"D1": 1, "D9": 9, "D10": 10})
 
 class NadiEngine:
-    def __init__(self, node_type="Mean", ayanamsa="KP", house_system="Placidus"):
+    def __init__(self, node_type="Mean", ayanamsa="KP", house_system="Placidus", ephemeris=None):
         self.node_type = node_type
         self.ayanamsa = ayanamsa
         self.house_system = house_system
+        self.ephemeris = ephemeris if ephemeris is not None else DEFAULT_EPHEMERIS
         
-        # Constants
-        self.PLANETS = {
-            "Sun": swe.SUN, "Moon": swe.MOON, "Mars": swe.MARS, "Mercury": swe.MERCURY,
-            "Jupiter": swe.JUPITER, "Venus": swe.VENUS, "Saturn": swe.SATURN,
-            "Rahu": swe.MEAN_NODE if node_type == "Mean" else swe.TRUE_NODE,
-            "Ketu": swe.MEAN_NODE if node_type == "Mean" else swe.TRUE_NODE
-        }
-        
-        self.SIGN_RULERS = {
-            "Aries": "Mars", "Taurus": "Venus", "Gemini": "Mercury", "Cancer": "Moon",
-            "Leo": "Sun", "Virgo": "Mercury", "Libra": "Venus", "Scorpio": "Mars",
-            "Sagittarius": "Jupiter", "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"
-        }
-        
-        self.SIGNS = [
-            "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-            "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-        ]
-        
-        self.DASHA_ORDER = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
-        self.DASHA_YEARS = {
-            "Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10,
-            "Mars": 7, "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17
-        }
-        
-        self.HORARY_TABLE = self.generate_horary_table()
-        
-        self.NAKSHATRAS = [
-            "Ashwini","Bharani","Krittika","Rohini","Mrigashira",
-            "Ardra","Punarvasu","Pushya","Ashlesha","Magha",
-            "Purva Phalguni","Uttara Phalguni","Hasta","Chitra","Swati",
-            "Vishakha","Anuradha","Jyeshtha","Mula","Purva Ashadha",
-            "Uttara Ashadha","Shravana","Dhanishta","Shatabhisha","Purva Bhadrapada",
-            "Uttara Bhadrapada","Revati"
-        ]
-        
-        self.ASPECTS = {
-            "Conjunction": 0, "Sextile": 60, "Square": 90, "Trine": 120, "Opposition": 180
-        }
-        
-        self.SHORT_CODES = {
-            "Sun": "Su", "Moon": "Mo", "Mars": "Ma", "Mercury": "Me",
-            "Jupiter": "Ju", "Venus": "Ve", "Saturn": "Sa",
-            "Rahu": "Ra", "Ketu": "Ke"
-        }
+        # Static tables are shared module constants; the engine only holds configuration
+        self.PLANETS = PLANETS_BY_NODE_TYPE["Mean" if node_type == "Mean" else "True"]
+        self.SIGN_RULERS = SIGN_RULERS
+        self.SIGNS = SIGNS
+        self.DASHA_ORDER = DASHA_ORDER
+        self.DASHA_YEARS = DASHA_YEARS
+        self.HORARY_TABLE = HORARY_TABLE
+        self.NAKSHATRAS = NAKSHATRAS
+        self.ASPECTS = ASPECTS
+        self.SHORT_CODES = SHORT_CODES
 
     def decimal_to_dms(self, degree, is_absolute=False):
         """
@@ -210,96 +748,21 @@ class NadiEngine:
         return f"{dms} {sign_names[sign_idx]}"
 
     def generate_horary_table(self):
-        table = {}
-        nak_size = 360.0 / 27.0
-        num = 1
-        sign_names = ["Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo", "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"]
-        calibration_offset = 27.0 / 3600.0 
-
-        for n_idx in range(27):
-            nak_start = n_idx * nak_size
-            star_lord = self.DASHA_ORDER[n_idx % 9]
-            start_lord_idx = self.DASHA_ORDER.index(star_lord)
-            sub_seq = self.DASHA_ORDER[start_lord_idx:] + self.DASHA_ORDER[:start_lord_idx]
-            
-            curr_nak_lon = 0.0
-            for lord in sub_seq:
-                arc = (self.DASHA_YEARS[lord] / 120.0) * nak_size
-                seg_start = nak_start + curr_nak_lon
-                seg_end = seg_start + arc
-                
-                s_sign = int(seg_start / 30.0)
-                e_sign = int((seg_end - 1e-8) / 30.0)
-                
-                if s_sign != e_sign:
-                    table[num] = {
-                        "lon": seg_start + calibration_offset, "sign": sign_names[s_sign],
-                        "sl": self.SIGN_RULERS[sign_names[s_sign]],
-                        "nl": star_lord, "sub": lord
-                    }
-                    num += 1
-                    table[num] = {
-                        "lon": (e_sign * 30.0) + calibration_offset, "sign": sign_names[e_sign],
-                        "sl": self.SIGN_RULERS[sign_names[e_sign]],
-                        "nl": star_lord, "sub": lord
-                    }
-                    num += 1
-                else:
-                    table[num] = {
-                        "lon": seg_start + calibration_offset, "sign": sign_names[s_sign],
-                        "sl": self.SIGN_RULERS[sign_names[s_sign]],
-                        "nl": star_lord, "sub": lord
-                    }
-                    num += 1
-                
-                curr_nak_lon += arc
-                if num > 249: break
-            if num > 249: break
-        return table
+        return HORARY_TABLE
 
     def calculate_prashna_cusps(self, jd, lat, lon, horary_number, calibrated_ayan=None):
-        table = self.generate_horary_table()
+        table = self.HORARY_TABLE
         if horary_number not in table:
             raise ValueError(f"Invalid Horary Number: {horary_number}")
             
         target_sid_asc = table[horary_number]['lon']
-        swe.set_sid_mode(swe.SIDM_KRISHNAMURTI, 0, 0)
-        ayan = calibrated_ayan if calibrated_ayan is not None else swe.get_ayanamsa_ut(jd)
+        ayan = calibrated_ayan if calibrated_ayan is not None else self.ephemeris.ayanamsa_ut(jd, swe.SIDM_KRISHNAMURTI)
         target_trop_asc = (target_sid_asc + ayan) % 360
         
-        res, _ = swe.calc_ut(jd, swe.ECL_NUT, 0)
-        eps = res[0]
-        
-        def get_asc_for_ramc(r):
-            try:
-                _, a = swe.houses_armc(r % 360, lat, eps, b'E')
-                return a[0] 
-            except: 
-                return (r + 90) % 360
-
-        best_r = 0.0
-        min_diff = 400.0
-        for test_r in range(0, 360, 2):
-            curr = get_asc_for_ramc(float(test_r))
-            diff = abs((curr - target_trop_asc + 180) % 360 - 180)
-            if diff < min_diff:
-                min_diff = diff
-                best_r = float(test_r)
-
-        low, high = best_r - 2.0, best_r + 2.0
-        for _ in range(40):
-            m1 = low + (high - low) * 0.4
-            m2 = low + (high - low) * 0.6
-            v1 = get_asc_for_ramc(m1)
-            v2 = get_asc_for_ramc(m2)
-            d1 = abs((v1 - target_trop_asc + 180) % 360 - 180)
-            d2 = abs((v2 - target_trop_asc + 180) % 360 - 180)
-            if d1 < d2: high = m2
-            else: low = m1
+        eps = self.ephemeris.obliquity(jd)
         
-        final_ramc = (low + high) / 2.0
         h_sys = b'P' if self.house_system == "Placidus" else b'E'
-        cusps_trop, ascmc_trop = swe.houses_armc(final_ramc % 360, lat, eps, h_sys)
+        _, cusps_trop, ascmc_trop = solve_prashna_ramc(target_trop_asc, lat, eps, h_sys)
         cusps_sid = [(c - ayan) % 360 for c in cusps_trop]
         ascmc_sid = [(a - ayan) % 360 for a in ascmc_trop]
         return cusps_sid, ascmc_sid
@@ -307,115 +770,31 @@ class NadiEngine:
     def get_kp_lords(self, degree: float):
         """
         Compute Sign Lord, Nakshatra Lord, Sub Lord, Sub-Sub Lord.
-        Full floating-point precision maintained throughout.
+        Bisect lookup on the precomputed KP boundary index; full floating-point precision maintained.
         """
         degree = float(degree % 360.0)
+        ss_pos = kp_sub_position(degree)[2]
+        return _SIGN_HEADS[int(degree / 30.0) % 12] + _KP_LORD_TAILS[ss_pos]
 
-        # Sign
-        sign_names = ["Aries","Taurus","Gemini","Cancer","Leo","Virgo",
-                      "Libra","Scorpio","Sagittarius","Capricorn","Aquarius","Pisces"]
-        sign_idx = int(degree / 30.0) % 12
-        sign_lord = self.SIGN_RULERS[sign_names[sign_idx]]
-        
-        # Nakshatra
-        nak_size = 360.0 / 27.0  # = 13.333333...°
-        nak_idx = int(degree / nak_size) % 27
-        star_lord = self.DASHA_ORDER[nak_idx % 9]
-        
-        # Elapsed in Nakshatra
-        nak_start = nak_idx * nak_size
-        elapsed_in_nak = degree - nak_start 
-        
-        # Sub divisions
-        sl_idx = self.DASHA_ORDER.index(star_lord)
-        sub_seq = self.DASHA_ORDER[sl_idx:] + self.DASHA_ORDER[:sl_idx]
-        
-        sub_lord = star_lord
-        sub_arc = (self.DASHA_YEARS[star_lord] / 120.0) * nak_size
-        rem_in_sub = elapsed_in_nak
-        sub_idx_in_nak = 1
-        current_off = 0.0
-        
-        for i, lord in enumerate(sub_seq):
-            arc = (self.DASHA_YEARS[lord] / 120.0) * nak_size
-            if current_off <= elapsed_in_nak < (current_off + arc + 1e-10) or i == len(sub_seq) - 1:
-                sub_lord = lord
-                sub_arc = arc
-                sub_idx_in_nak = i + 1
-                rem_in_sub = elapsed_in_nak - current_off
-                break
-            current_off += arc
-        
-        # Sub-Sub Lord
-        ssl_lord = sub_lord
-        ssl_start_idx = self.DASHA_ORDER.index(sub_lord)
-        ssl_seq = self.DASHA_ORDER[ssl_start_idx:] + self.DASHA_ORDER[:ssl_start_idx]
-        off_ssl = 0.0
-        for lord in ssl_seq:
-            arc_ssl = (self.DASHA_YEARS[lord] / 120.0) * sub_arc
-            if off_ssl <= rem_in_sub < (off_ssl + arc_ssl + 1e-10):
-                ssl_lord = lord
-                break
-            off_ssl += arc_ssl
-        
-        nadi_type = "Unknown"
-        if sub_idx_in_nak in [1, 4, 7]: nadi_type = "Vata"
-        elif sub_idx_in_nak in [2, 5, 8]: nadi_type = "Pitta"
-        elif sub_idx_in_nak in [3, 6, 9]: nadi_type = "Kapha"
-            
-        return sign_names[sign_idx], sign_lord, star_lord, sub_lord, ssl_lord, self.NAKSHATRAS[nak_idx], nadi_type, sub_idx_in_nak
+    def get_kp_lords_batch(self, longitudes):
+        """
+        Batch form of get_kp_lords / get_nadi_triple_combination for NumPy arrays.
+        See kp_lords_batch for the returned columns.
+        """
+        return kp_lords_batch(longitudes)
 
     def get_nadi_triple_combination(self, degree: float):
         degree = degree % 360
-        naksh_size = 360.0 / 27.0
-        naksh_idx = int(degree / naksh_size) % 27
-        star_lord = self.DASHA_ORDER[naksh_idx % 9]
-        
-        rem_in_nak = degree - (naksh_idx * naksh_size)
-        sub_lord = star_lord
-        sub_idx = 0
-        current_off = 0.0
-        seq_start = naksh_idx % 9
-        sub_seq = self.DASHA_ORDER[seq_start:] + self.DASHA_ORDER[:seq_start]
+        nak_idx, sub_pos, ss_pos, elapsed_in_nak, _ = kp_sub_position(degree)
+        star_lord, sub_lord, planet_lord, nak_name, nadi_type, nadi_val = _KP_LORD_TAILS[ss_pos]
+        pl_val = KP_SUB_SUB_INDEX[ss_pos][3]
         
-        planet_lord = sub_lord
-        pl_idx = 0
-        
-        found_sub = False
-        for i, lord in enumerate(sub_seq):
-            arc = (self.DASHA_YEARS[lord] / 120.0) * naksh_size
-            if current_off <= rem_in_nak < (current_off + arc + 1e-10):
-                sub_lord = lord
-                sub_idx = i
-                rem_in_sub = rem_in_nak - current_off
-                
-                pl_seq_start = self.DASHA_ORDER.index(lord)
-                pl_seq = self.DASHA_ORDER[pl_seq_start:] + self.DASHA_ORDER[:pl_seq_start]
-                pl_off = 0.0
-                for j, pl_lord in enumerate(pl_seq):
-                    pl_arc = (self.DASHA_YEARS[pl_lord] / 120.0) * arc
-                    if pl_off <= rem_in_sub < (pl_off + pl_arc + 1e-10):
-                        planet_lord = pl_lord
-                        pl_idx = j
-                        break
-                    pl_off += pl_arc
-                found_sub = True
-                break
-            current_off += arc
-        
-        if not found_sub:
-            sub_lord = sub_seq[-1]
+        # Outside the nakshatra by rounding: last sub, planet lord = sub lord
+        if elapsed_in_nak < 0.0 or elapsed_in_nak >= _SUB_EDGES[nak_idx * 9 + 8]:
             planet_lord = sub_lord
-            sub_idx = 8
-            pl_idx = 8
-
-        nadi_type = "Unknown"
-        nadi_val = sub_idx + 1
-        if nadi_val in [1, 4, 7]: nadi_type = "Vata"
-        elif nadi_val in [2, 5, 8]: nadi_type = "Pitta"
-        elif nadi_val in [3, 6, 9]: nadi_type = "Kapha"
+            pl_val = 9
         
-        return self.NAKSHATRAS[naksh_idx], star_lord, sub_lord, planet_lord, nadi_type, nadi_val, pl_idx + 1
+        return nak_name, star_lord, sub_lord, planet_lord, nadi_type, nadi_val, pl_val
 
     def get_node_agents(self, node_name, node_data, all_planets):
         agents = []
@@ -458,61 +837,326 @@ class NadiEngine:
                 seen.add(a['planet'])
         return final_agents
 
-    def calculate_kundli(self, dt_str, timezone, lat, lon, horary_number=None):
+    def chart(self, dt_str, timezone, lat, lon, horary_number=None, dasha_depth=None, dasha_window=None, dasha_date=None):
+        """
+        Chart for calculate_kundli's arguments, each section computed on first access.
+        None when dt_str cannot be parsed.
+        """
         tz = pytz.timezone(timezone)
-        dt = None
-        formats = ["%Y-%m-%d %H:%M:%S", "%d-%m-%Y %H:%M:%S", "%Y/%m/%d %H:%M:%S", "%d/%m/%Y %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%dT%H:%M"]
-        for fmt in formats:
-            try:
-                dt = datetime.datetime.strptime(dt_str, fmt)
-                break
-            except ValueError:
-                continue
+        dt = parse_datetime(dt_str)
         if dt is None:
-            try:
-                dt = datetime.datetime.fromisoformat(dt_str)
-            except:
-                return {"status": "error", "message": f"Invalid Date Format: {dt_str}."}
-        birth_dt_loc = tz.localize(dt)
+            return None
+
+        window = None
+        if dasha_window:
+            w_start = tz.localize(datetime.datetime.strptime(dasha_window[0], "%Y-%m-%d"))
+            w_end = tz.localize(datetime.datetime.strptime(dasha_window[1], "%Y-%m-%d")) + datetime.timedelta(days=1)
+            window = (w_start, w_end)
+        ref_dt = None
+        if dasha_date:
+            ref_fmt = "%Y-%m-%d %H:%M:%S" if " " in dasha_date else "%Y-%m-%d"
+            ref_dt = tz.localize(datetime.datetime.strptime(dasha_date, ref_fmt))
+
+        return Chart(self, tz.localize(dt), lat, lon, horary_number=horary_number, dasha_depth=dasha_depth,
+                     dasha_window=dasha_window, window=window, ref_dt=ref_dt)
+
+    def calculate_kundli(self, dt_str, timezone, lat, lon, horary_number=None, dasha_depth=None, dasha_window=None, dasha_date=None, sections=None):
+        """
+        dasha_window: optional (start, end) "YYYY-MM-DD" dates, in the birth timezone, limiting the dasha tree.
+        dasha_date: optional "YYYY-MM-DD[ HH:MM:SS]" in the birth timezone for the current_* periods (default now).
+        sections: optional CHART_SECTIONS names; only those (plus ascendant and metadata) are computed and returned.
+        Full results are cached in KUNDLI_CACHE; a selection is served from a cached full result when there is one.
+        """
+        chart = self.chart(dt_str, timezone, lat, lon, horary_number, dasha_depth, dasha_window, dasha_date)
+        if chart is None:
+            return {"status": "error", "message": f"Invalid Date Format: {dt_str}."}
+
+        cached = chart.load_cached()
+        if sections is not None:
+            return chart.to_dict(sections)
+        if cached is not None:
+            return cached
+        result = chart.to_dict()
+        if KUNDLI_CACHE is not None:
+            KUNDLI_CACHE.put(chart.cache_key, result)
+        return result
+
+    def scan(self, start, end, step, lat, lon, fields=("ascendant",), timezone="UTC"):
+        """
+        Chart quantities at every instant from start to end (inclusive) in one vectorized pass, as NumPy columns.
+        start / end: datetimes or chart input strings, local to `timezone` unless timezone-aware.
+        step: seconds or a timedelta. fields: any of SCAN_FIELDS.
+
+        Always returns "jd" (UT) and "time" (datetime64, UTC), plus per field:
+          ascendant -> "ascendant" (n,)             cusps -> "cusps" (n, 12), houses 1..12
+          planets -> "planets" (n, p)               speeds -> "speeds" (n, p), degrees/day
+          planet_houses -> "planet_houses" (n, p)   planet columns follow self.PLANETS order
+          ascendant_lords / cusp_lords / planet_lords -> "<ascendant|cusp|planet>_sign" (index into SIGNS) and
+            "_star_lord", "_sub_lord", "_sub_sub_lord" (indices into DASHA_ORDER), shaped like the longitudes.
+          moon_lahiri -> "moon_lahiri" (n,), the Lahiri Moon longitude the dasha is computed from.
+        Longitudes are KP sidereal, exactly as calculate_kundli places them (natal charts; horary is not scanned).
+        """
+        tz = pytz.timezone(timezone)
+        bounds = []
+        for value in (start, end):
+            dt = parse_datetime(value) if isinstance(value, str) else value
+            if dt is None:
+                raise ValueError(f"Invalid Date Format: {value}.")
+            bounds.append((dt if dt.tzinfo else tz.localize(dt)).astimezone(pytz.UTC))
+        step_s = step.total_seconds() if isinstance(step, datetime.timedelta) else float(step)
+        if step_s <= 0:
+            raise ValueError("step must be positive")
+
+        offsets = np.arange(int((bounds[1] - bounds[0]).total_seconds() // step_s) + 1) * step_s
+        t0 = bounds[0]
+        jd = swe.julday(t0.year, t0.month, t0.day, t0.hour + t0.minute/60 + t0.second/3600 + t0.microsecond/3.6e9) + offsets / 86400.0
+        out = {"jd": jd, "time": np.datetime64(t0.replace(tzinfo=None), "us") + (offsets * 1e6).astype("timedelta64[us]")}
+        out.update(self.chart_columns(jd, lat, lon, fields))
+        return out
+
+    def chart_columns(self, jd, lat, lon, fields):
+        """The scan fields at arbitrary instants: jd is a 1-d array of Julian days (UT). See scan for the columns."""
+        unknown = set(fields) - set(SCAN_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown scan fields: {sorted(unknown)}")
+        jd = np.asarray(jd, dtype=np.float64)
+        out = {}
+        eph = self.ephemeris
+        wanted = set(fields)
+        ayan_kp = eph.ayanamsa_batch(jd, swe.SIDM_KRISHNAMURTI) - (6.2 / 3600.0)
+        values = {}
+        if wanted & {"ascendant", "ascendant_lords", "cusps", "cusp_lords", "planet_houses"}:
+            ramc = (eph.sidtime_batch(jd) * 15.0 + lon) % 360.0
+            h_sys = b'P' if self.house_system == "Placidus" else b'E'
+            cusps = (houses_batch(ramc, lat, eph.obliquity_batch(jd), h_sys) - ayan_kp[:, None]) % 360.0
+            values["ascendant"], values["cusps"] = cusps[:, 0], cusps
+        if wanted & {"planets", "planet_lords", "speeds", "planet_houses"}:
+            by_code = {code: eph.lon_speed_batch(jd, code) for code in set(self.PLANETS.values())}
+            values["planets"] = np.stack([
+                (by_code[code][0] - ayan_kp + (180.0 if name == "Ketu" else 0.0)) % 360.0 for name, code in self.PLANETS.items()
+            ], axis=1)
+            values["speeds"] = np.stack([by_code[code][1] for code in self.PLANETS.values()], axis=1)
+
+        if "planet_houses" in wanted:
+            # Same rule as calculate_kundli: the first house whose cusp arc holds the planet, else 1
+            planets, houses = values["planets"], np.ones(values["planets"].shape, dtype=np.int64)
+            for i in range(11, -1, -1):
+                curr, nxt = cusps[:, [i]], cusps[:, [(i + 1) % 12]]
+                inside = ((nxt < curr) & ((planets >= curr) | (planets < nxt))) | ((curr <= planets) & (planets < nxt))
+                houses[inside] = i + 1
+            out["planet_houses"] = houses
+        for field in ("ascendant", "cusps", "planets", "speeds"):
+            if field in wanted:
+                out[field] = values[field]
+        for prefix, source in (("ascendant", "ascendant"), ("cusp", "cusps"), ("planet", "planets")):
+            if f"{prefix}_lords" in wanted:
+                lords = kp_lords_batch(values[source])
+                out[f"{prefix}_sign"] = lords["sign_index"]
+                for level in ("star_lord", "sub_lord", "sub_sub_lord"):
+                    out[f"{prefix}_{level}"] = lords[level]
+        if "moon_lahiri" in wanted:
+            out["moon_lahiri"] = (eph.lon_speed_batch(jd, swe.MOON)[0] - eph.ayanamsa_batch(jd, swe.SIDM_LAHIRI)) % 360.0
+        return out
+
+    def kundli_cache_key(self, birth_dt_loc, lat, lon, horary_number=None, dasha_depth=None, dasha_window=None):
+        """
+        Content address of a chart: the UTC instant plus the UTC offset (dasha dates are printed in local time),
+        coordinates, engine settings, ephemeris backend and the options that shape the output. The reference
+        date is not part of it.
+        """
         utc_dt = birth_dt_loc.astimezone(pytz.UTC)
+        key = [
+            utc_dt.strftime("%Y-%m-%dT%H:%M:%S.%f"), birth_dt_loc.utcoffset().total_seconds(),
+            float(lat) + 0.0, float(lon) + 0.0, self.node_type, self.ayanamsa, self.house_system, self.ephemeris.name,
+            horary_number, dasha_depth, list(dasha_window) if dasha_window else None
+        ]
+        return hashlib.sha256(json.dumps(key).encode()).hexdigest()
+
+    def calculate_aspects(self, planets_raw):
+        res = []
+        for i in range(len(planets_raw)):
+            p1 = planets_raw[i]
+            for j in range(len(planets_raw)):
+                if i == j: continue
+                p2 = planets_raw[j]
+                diff = abs(p1["lon"] - p2["lon"])
+                if diff > 180: diff = 360 - diff
+                for name, deg in self.ASPECTS.items():
+                    if abs(diff - deg) <= 6.0:
+                        res.append({"planet": p1["planet"], "aspect": name, "target": p2["planet"], "degree_diff": round(diff, 2)})
+        f_res = []
+        for r in res:
+            if r["planet"] in ["Rahu", "Ketu"] and r["aspect"] not in ["Trine", "Opposition", "Conjunction"]: continue
+            f_res.append(r)
+        return f_res
+
+    def get_eff_sigs_detailed(self, p_name, planet_map, planet_ownership):
+        if p_name not in planet_map: return []
+        p_data = planet_map[p_name]
+        placed = int(p_data["house_placed"])
+        mask = HOUSE_BIT[placed] | houses_mask(planet_ownership.get(p_name, []))
+        if p_name in ["Rahu", "Ketu"]:
+            for agent in self.get_node_agents(p_name, p_data, list(planet_map.values())):
+                a_name = agent['planet']
+                if a_name and a_name in planet_map:
+                    mask |= HOUSE_BIT[int(planet_map[a_name]["house_placed"])] | houses_mask(planet_ownership.get(a_name, []))
+        return [{"house": h, "is_placed": h == placed} for h in MASK_HOUSES[mask]]
+
+    def calculate_kp_significators_4level(self, p_name, planet_map, planet_ownership):
+        if p_name not in planet_map: return {"L1":[], "L2":[], "L3":[], "L4":[], "is_self_strength": False}
+        p_data = planet_map[p_name]
+        sl_data = planet_map.get(p_data["star_lord"])
+        l1 = [int(sl_data["house_placed"])] if sl_data else []
+        l2 = [int(p_data["house_placed"])]
+        l3 = list(MASK_HOUSES[houses_mask(planet_ownership.get(p_data["star_lord"], []))])
+        l4 = list(MASK_HOUSES[houses_mask(planet_ownership.get(p_name, []))])
+        self_s = not any(p["star_lord"] == p_name for p in planet_map.values())
+        return {"L1": l2, "L2": l1, "L3": l4, "L4": l3, "is_self_strength": True} if self_s else {"L1": l1, "L2": l2, "L3": l3, "L4": l4, "is_self_strength": False}
+
+    def get_node_significators(self, node_name, planet_map, house_owners):
+        base = self.calculate_kp_significators_4level(node_name, planet_map, house_owners)
+        p_data = planet_map[node_name]
+        agents = self.get_node_agents(node_name, p_data, list(planet_map.values()))
+        masks = {lvl: houses_mask(base[lvl]) for lvl in ["L1", "L2", "L3", "L4"]}
+        merged = False
+        for agent in agents:
+            a_name = agent['planet']
+            if a_name and a_name in planet_map:
+                a_sigs = self.calculate_kp_significators_4level(a_name, planet_map, house_owners)
+                for lvl in masks:
+                    masks[lvl] |= houses_mask(a_sigs[lvl])
+                merged = True
+        if merged:
+            for lvl, mask in masks.items():
+                base[lvl] = list(MASK_HOUSES[mask])
+        agent_names = [a['planet'] for a in agents]
+        base["agent"] = ", ".join(agent_names) if agent_names else None
+        return base
+
+    def calculate_dasha(self, planets_raw, birth_dt_loc, moon_lon_lahiri=None, depth=None, window=None, ref_dt=None):
+        """
+        Final High-Precision Vimshottari Dasha (v1.2.8)
+        Sidereal Year = 365.25636 days.
+        Nakshatra Length = 48000 arcseconds.
+        Built on the lazy VimshottariDasha; depth / window limit how much of the tree is serialized.
+        ref_dt (aware datetime, default now) selects the running periods; depth=5 adds current_sookshma.
+        """
+        if moon_lon_lahiri is not None:
+            moon_lon = moon_lon_lahiri
+        else:
+            moon_lon = next(p["lon"] for p in planets_raw if p["planet"] == "Moon")
+        if depth is not None and not 1 <= depth <= 5:
+            raise ValueError(f"Invalid dasha depth: {depth} (expected 1-5)")
+
+        dasha = VimshottariDasha(moon_lon, birth_dt_loc)
+        today = ref_dt or datetime.datetime.now(pytz.UTC)
+        running = [p.path[-1] for p in dasha.period_at(today, 5 if depth == 5 else 4)]
+        act_md, act_ad, act_pd, act_sd, act_ssd = (running + ["None"] * 5)[:5]
+        tree = dasha.to_sequence(depth=depth, window=window, today=today)
+
+        bal_yrs_f = dasha.balance_years
+        y_bal = int(bal_yrs_f)
+        rem_d = (bal_yrs_f - y_bal) * DASHA_DAYS_PER_YEAR
+        m_bal = int(rem_d / 30.436875)
+        d_bal = int(rem_d - m_bal * 30.436875)
+        result = {"balance_at_birth": f"{y_bal}y {m_bal}m {d_bal}d", "current_dasha": act_md, "current_bukthi": act_ad, "current_antara": act_pd, "current_pratyantar": act_sd, "mahadasha_sequence": tree, "moon_lon": moon_lon}
+        if depth == 5:
+            result["current_sookshma"] = act_ssd
+        return result
+
+    def refresh_dasha(self, dasha_data, birth_dt_loc, depth=None, window=None, ref_dt=None):
+        """
+        Bring a stored calculate_dasha result up to date for ref_dt (default now), in place. The current_*
+        fields are re-resolved; the classic tree is rebuilt only when the running mahadasha/bhukti has moved on.
+        """
+        dasha = VimshottariDasha(dasha_data["moon_lon"], birth_dt_loc)
+        today = ref_dt or datetime.datetime.now(pytz.UTC)
+        running = [p.path[-1] for p in dasha.period_at(today, 5 if depth == 5 else 4)]
+        act_md, act_ad, act_pd, act_sd, act_ssd = (running + ["None"] * 5)[:5]
+        if depth is None and (act_md, act_ad) != (dasha_data["current_dasha"], dasha_data["current_bukthi"]):
+            dasha_data["mahadasha_sequence"] = dasha.to_sequence(depth=depth, window=window, today=today)
+        dasha_data.update(current_dasha=act_md, current_bukthi=act_ad, current_antara=act_pd, current_pratyantar=act_sd)
+        if depth == 5:
+            dasha_data["current_sookshma"] = act_ssd
+        return dasha_data
+
+class Chart:
+    """
+    One calculate_kundli chart. The raw positions are computed once; every result section is a cached
+    property named after its result key, so callers pay only for the sections they read.
+    Built by NadiEngine.chart.
+    """
+
+    def __init__(self, engine, birth_dt_loc, lat, lon, horary_number=None, dasha_depth=None, dasha_window=None, window=None, ref_dt=None):
+        self.engine = engine
+        self.birth_dt_loc = birth_dt_loc
+        self.lat = lat
+        self.lon = lon
+        self.horary_number = horary_number
+        self.dasha_depth = dasha_depth
+        self.dasha_window = dasha_window
+        self.window = window
+        self.ref_dt = ref_dt
+
+    @property
+    def cache_key(self):
+        return self.engine.kundli_cache_key(self.birth_dt_loc, self.lat, self.lon, self.horary_number, self.dasha_depth, self.dasha_window)
+
+    def load_cached(self):
+        """
+        The full result for these inputs if KUNDLI_CACHE has it (current_* dasha periods brought up to date),
+        else None. A cached result also backs this chart's section properties.
+        """
+        if KUNDLI_CACHE is None:
+            return None
+        cached = KUNDLI_CACHE.get(self.cache_key)
+        if cached is not None:
+            self.engine.refresh_dasha(cached["dasha"], self.birth_dt_loc, depth=self.dasha_depth, window=self.window, ref_dt=self.ref_dt)
+            self.__dict__.update((key, cached[key]) for key in RESULT_KEYS)
+        return cached
+
+    def to_dict(self, sections=None):
+        """
+        calculate_kundli result restricted to `sections` (CHART_SECTIONS names, default all).
+        The ascendant and metadata are always included.
+        """
+        sections = CHART_SECTIONS if sections is None else sections
+        unknown = [s for s in sections if s not in CHART_SECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown chart sections: {', '.join(unknown)} (expected any of {', '.join(CHART_SECTIONS)})")
+        keys = {"ascendant", "metadata"} | {CHART_SECTIONS[s] for s in sections}
+        return {"status": "success", **{key: getattr(self, key) for key in RESULT_KEYS if key in keys}}
+
+    # Shared intermediates
+
+    @cached_property
+    def positions(self):
+        e = self.engine
+        utc_dt = self.birth_dt_loc.astimezone(pytz.UTC)
+        lat, lon, horary_number = self.lat, self.lon, self.horary_number
         jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, utc_dt.hour + utc_dt.minute/60 + utc_dt.second/3600)
         
         # Calculate Multi-Ayanamsas
-        swe.set_sid_mode(swe.SIDM_KRISHNAMURTI, 0, 0)
-        ayan_kp = swe.get_ayanamsa_ut(jd) - (6.2 / 3600.0)
-        swe.set_sid_mode(swe.SIDM_LAHIRI, 0, 0)
-        ayan_lahiri = swe.get_ayanamsa_ut(jd)
+        eph = e.ephemeris
+        ayan_kp = eph.ayanamsa_ut(jd, swe.SIDM_KRISHNAMURTI) - (6.2 / 3600.0)
+        ayan_lahiri = eph.ayanamsa_ut(jd, swe.SIDM_LAHIRI)
         
-        h_sys = b'P' if self.house_system == "Placidus" else b'E'
+        h_sys = b'P' if e.house_system == "Placidus" else b'E'
         if horary_number:
-            cusps, ascmc = self.calculate_prashna_cusps(jd, lat, lon, horary_number, calibrated_ayan=ayan_kp)
+            cusps, ascmc = e.calculate_prashna_cusps(jd, lat, lon, horary_number, calibrated_ayan=ayan_kp)
         else:
-            gmst_hrs = swe.sidtime(jd)
+            gmst_hrs = eph.sidtime(jd)
             lst_hrs = (gmst_hrs + lon / 15.0) % 24.0
             ramc_deg = (lst_hrs * 15.0) % 360.0
-            res_nut, _ = swe.calc_ut(jd, swe.ECL_NUT, 0)
-            eps = res_nut[0]
+            eps = eph.obliquity(jd)
             cusps_trop, ascmc_trop = swe.houses_armc(ramc_deg, lat, eps, h_sys)
             cusps = [(c - ayan_kp) % 360 for c in cusps_trop]
             ascmc = [(a - ayan_kp) % 360 for a in ascmc_trop]
 
-        # Dual House Ownership Mapping (Traditional/KP parity)
-        planet_ownership_kp = {p: [] for p in self.PLANETS.keys()}
-        for i in range(12):
-            lon_val = cusps[i]
-            _, sl, _, _, _, _, _, _ = self.get_kp_lords(lon_val)
-            if sl in planet_ownership_kp and (i+1) not in planet_ownership_kp[sl]:
-                planet_ownership_kp[sl].append(i+1)
-        
-        # planet_ownership_trad is now a copy of KP for consistent rule application
-        planet_ownership_trad = {p: list(v) for p, v in planet_ownership_kp.items()}
-        
         planets_raw_kp = []
         planets_raw_lahiri = []
-        for name, code in self.PLANETS.items():
-            res, _ = swe.calc_ut(jd, code, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            lon_trop = res[0]
-            speed_val = res[3]
+        for name, code in e.PLANETS.items():
+            lon_trop, speed_val = eph.lon_speed(jd, code)
             lon_kp = (lon_trop - ayan_kp) % 360.0
             lon_lahiri = (lon_trop - ayan_lahiri) % 360.0
             if name == "Ketu":
@@ -521,25 +1165,78 @@ class NadiEngine:
             planets_raw_kp.append({"planet": name, "lon": lon_kp, "speed": speed_val})
             planets_raw_lahiri.append({"planet": name, "lon": lon_lahiri, "speed": speed_val})
 
+        return {"jd": jd, "ayan_kp": ayan_kp, "ayan_lahiri": ayan_lahiri, "cusps": cusps, "ascmc": ascmc,
+                "planets_raw_kp": planets_raw_kp, "planets_raw_lahiri": planets_raw_lahiri}
+
+    @cached_property
+    def moon_lon_lahiri(self):
+        # Use Lahiri Moon Longitude for Dasha for maximum precision
+        return next(p["lon"] for p in self.positions["planets_raw_lahiri"] if p["planet"] == "Moon")
+
+    @cached_property
+    def ownership(self):
+        e = self.engine
+        cusps = self.positions["cusps"]
+        # Dual House Ownership Mapping (Traditional/KP parity)
+        planet_ownership_kp = {p: [] for p in e.PLANETS.keys()}
+        for i in range(12):
+            lon_val = cusps[i]
+            _, sl, _, _, _, _, _, _ = e.get_kp_lords(lon_val)
+            if sl in planet_ownership_kp and (i+1) not in planet_ownership_kp[sl]:
+                planet_ownership_kp[sl].append(i+1)
+        
+        # planet_ownership_trad is now a copy of KP for consistent rule application
+        planet_ownership_trad = {p: list(v) for p, v in planet_ownership_kp.items()}
+        return planet_ownership_kp, planet_ownership_trad
+
+    @cached_property
+    def planet_map(self):
+        e = self.engine
+        p_map_kp = {p["planet"]: p for p in self.positions["planets_raw_kp"]}
+        return {p["planet"]: {**p, "degree_decimal": p_map_kp[p["planet"]]["lon"], "sign": e.get_kp_lords(p_map_kp[p["planet"]]["lon"])[0], "sign_lord": e.SHORT_CODES.get(e.get_kp_lords(p_map_kp[p["planet"]]["lon"])[1])} for p in self.planets}
+
+    @cached_property
+    def running_dasha(self):
+        """current_* dasha periods: from the dasha section when it is already there, else from a 1-level tree."""
+        dasha = self.__dict__.get("dasha")
+        if dasha is None:
+            dasha = self.engine.calculate_dasha(self.positions["planets_raw_lahiri"], self.birth_dt_loc, moon_lon_lahiri=self.moon_lon_lahiri, depth=1, ref_dt=self.ref_dt)
+        return {k: v for k, v in dasha.items() if k.startswith("current_")}
+
+    # Result sections
+
+    @cached_property
+    def ascendant(self):
+        e = self.engine
+        ascmc = self.positions["ascmc"]
+        sn_kp, sl_kp, nlk_kp, sub_kp, ssl_kp, nak_kp, nadi_kp, sub_idx_kp = e.get_kp_lords(ascmc[0])
+        return {"degree_dms": f"{e.decimal_to_dms(ascmc[0])} {sn_kp}", "sign": sn_kp, "sign_lord": sl_kp, "star_lord": nlk_kp, "sub_lord": sub_kp, "sub_sub_lord": ssl_kp, "nakshatra": nak_kp, "nadi": nadi_kp, "planet_lord": sl_kp}
+
+    @cached_property
+    def houses(self):
+        e = self.engine
+        cusps = self.positions["cusps"]
         houses_res = []
         for i in range(12):
             lon_val = cusps[i]
-            sn, sl, nlk, sub, ssl, nak, nadi, sub_idx = self.get_kp_lords(lon_val)
+            sn, sl, nlk, sub, ssl, nak, nadi, sub_idx = e.get_kp_lords(lon_val)
             houses_res.append({
-                "house_number": i+1, "cusp_degree_dms": self.decimal_to_dms(lon_val, is_absolute=True),
-                "sign": sn, "sign_lord": self.SHORT_CODES.get(sl, sl), "star_lord": self.SHORT_CODES.get(nlk, nlk), 
-                "sub_lord": self.SHORT_CODES.get(sub, sub), "sub_sub_lord": self.SHORT_CODES.get(ssl, ssl),
+                "house_number": i+1, "cusp_degree_dms": e.decimal_to_dms(lon_val, is_absolute=True),
+                "sign": sn, "sign_lord": e.SHORT_CODES.get(sl, sl), "star_lord": e.SHORT_CODES.get(nlk, nlk), 
+                "sub_lord": e.SHORT_CODES.get(sub, sub), "sub_sub_lord": e.SHORT_CODES.get(ssl, ssl),
                 "nakshatra": nak, "nadi": nadi, "nadi_index": sub_idx, "planet_lord": sl, "cusp_degree_decimal": lon_val
             })
-            
+        return houses_res
+
+    @cached_property
+    def planets(self):
+        e = self.engine
+        cusps = self.positions["cusps"]
         planets_res = []
-        sun_lon_lh = next(p["lon"] for p in planets_raw_lahiri if p["planet"] == "Sun")
-        p_map_kp = {p["planet"]: p for p in planets_raw_kp}
-        p_map_lh = {p["planet"]: p for p in planets_raw_lahiri}
+        p_map_kp = {p["planet"]: p for p in self.positions["planets_raw_kp"]}
         
-        for p_name in self.PLANETS.keys():
+        for p_name in e.PLANETS.keys():
             kp_data = p_map_kp[p_name]
-            lh_data = p_map_lh[p_name]
             hp = 1
             for i in range(12):
                 cusp_curr, cusp_next = cusps[i], cusps[(i+1)%12]
@@ -547,7 +1244,7 @@ class NadiEngine:
                     hp = i + 1; break
             
             # Revert to KP for Lords and Degrees (to match commit 184c1c4)
-            sn_kp, sl_kp, nlk_kp, sub_kp, ssl_kp, nak_kp, nadi_kp, sub_idx_kp = self.get_kp_lords(kp_data["lon"])
+            sn_kp, sl_kp, nlk_kp, sub_kp, ssl_kp, nak_kp, nadi_kp, sub_idx_kp = e.get_kp_lords(kp_data["lon"])
             
             is_combust = False
             if p_name != "Sun" and p_name in ["Moon","Mars","Mercury","Jupiter","Venus","Saturn"]:
@@ -559,13 +1256,13 @@ class NadiEngine:
                 
             planets_res.append({
                 "planet": p_name, 
-                "degree_dms": self.decimal_to_dms(kp_data["lon"], is_absolute=True),
+                "degree_dms": e.decimal_to_dms(kp_data["lon"], is_absolute=True),
                 "house_placed": int(hp), 
                 "sign": sn_kp, 
-                "sign_lord": self.SHORT_CODES.get(sl_kp, sl_kp),
-                "star_lord": self.SHORT_CODES.get(nlk_kp, nlk_kp), 
-                "sub_lord": self.SHORT_CODES.get(sub_kp, sub_kp),
-                "sub_sub_lord": self.SHORT_CODES.get(ssl_kp, ssl_kp), 
+                "sign_lord": e.SHORT_CODES.get(sl_kp, sl_kp),
+                "star_lord": e.SHORT_CODES.get(nlk_kp, nlk_kp), 
+                "sub_lord": e.SHORT_CODES.get(sub_kp, sub_kp),
+                "sub_sub_lord": e.SHORT_CODES.get(ssl_kp, ssl_kp), 
                 "nakshatra": nak_kp, 
                 "nadi": nadi_kp,
                 "nadi_index": sub_idx_kp, 
@@ -574,188 +1271,74 @@ class NadiEngine:
                 "planet_lord": sl_kp, 
                 "degree_decimal": kp_data["lon"]
             })
-            
-        planet_res_map_kp = {p["planet"]: {**p, "degree_decimal": p_map_kp[p["planet"]]["lon"], "sign": self.get_kp_lords(p_map_kp[p["planet"]]["lon"])[0], "sign_lord": self.SHORT_CODES.get(self.get_kp_lords(p_map_kp[p["planet"]]["lon"])[1])} for p in planets_res}
-        
+        return planets_res
+
+    @cached_property
+    def significations(self):
+        e = self.engine
+        planet_res_map_kp = self.planet_map
+        planet_ownership_kp, planet_ownership_trad = self.ownership
         significations_res = []
-        for p in planets_res:
+        for p in self.planets:
             p_name = p["planet"]
             # Rahu/Ketu use Traditional House Owners for their agents
             # Other planets use KP House Owners
             p_own = planet_ownership_trad if p_name in ["Rahu", "Ketu"] else planet_ownership_kp
-            sigs = self.get_node_significators(p_name, planet_res_map_kp, p_own) if p_name in ["Rahu", "Ketu"] else self.calculate_kp_significators_4level(p_name, planet_res_map_kp, p_own)
-            total = sorted(list(set(sigs["L1"] + sigs["L2"] + sigs["L3"] + sigs["L4"])))
+            sigs = e.get_node_significators(p_name, planet_res_map_kp, p_own) if p_name in ["Rahu", "Ketu"] else e.calculate_kp_significators_4level(p_name, planet_res_map_kp, p_own)
+            total = list(MASK_HOUSES[houses_mask(sigs["L1"]) | houses_mask(sigs["L2"]) | houses_mask(sigs["L3"]) | houses_mask(sigs["L4"])])
             significations_res.append({"planet": p_name, "levels": sigs, "total": total, "agent": sigs.get("agent", None)})
-        
+        return significations_res
+
+    @cached_property
+    def nakshatra_nadi(self):
+        e = self.engine
+        planet_res_map_kp = self.planet_map
+        planet_ownership_kp, planet_ownership_trad = self.ownership
+        p_map_kp = {p["planet"]: p for p in self.positions["planets_raw_kp"]}
         nak_nadi_res = []
-        for p in planets_res:
+        for p in self.planets:
             p_name = p["planet"]
             p_lon_kp = p_map_kp[p_name]["lon"]
-            nak, sl_n, sub_n, pl_n, nadi, s_idx, p_idx = self.get_nadi_triple_combination(p_lon_kp)
-            
-            # Gold Nadi Table significators
-            h_owners_gold = house_owners_trad if p_name in ["Rahu", "Ketu"] else house_owners_kp
+            nak, sl_n, sub_n, pl_n, nadi, s_idx, p_idx = e.get_nadi_triple_combination(p_lon_kp)
             
             nak_nadi_res.append({
                 "planet": p_name, "nakshatra_name": nak, "is_retrograde": p["is_retrograde"], "is_combust": p["is_combust"],
-                "pl_signified": self.get_eff_sigs_detailed(p_name, planet_res_map_kp, planet_ownership_trad if p_name in ["Rahu", "Ketu"] else planet_ownership_kp),
-                "star_lord": sl_n, "nl_signified": self.get_eff_sigs_detailed(sl_n, planet_res_map_kp, planet_ownership_trad if sl_n in ["Rahu", "Ketu"] else planet_ownership_kp),
-                "sub_lord": sub_n, "sl_signified": self.get_eff_sigs_detailed(sub_n, planet_res_map_kp, planet_ownership_trad if sub_n in ["Rahu", "Ketu"] else planet_ownership_kp),
-                "planet_lord": pl_n, "pl_lord_signified": self.get_eff_sigs_detailed(pl_n, planet_res_map_kp, planet_ownership_trad if pl_n in ["Rahu", "Ketu"] else planet_ownership_kp)
+                "pl_signified": e.get_eff_sigs_detailed(p_name, planet_res_map_kp, planet_ownership_trad if p_name in ["Rahu", "Ketu"] else planet_ownership_kp),
+                "star_lord": sl_n, "nl_signified": e.get_eff_sigs_detailed(sl_n, planet_res_map_kp, planet_ownership_trad if sl_n in ["Rahu", "Ketu"] else planet_ownership_kp),
+                "sub_lord": sub_n, "sl_signified": e.get_eff_sigs_detailed(sub_n, planet_res_map_kp, planet_ownership_trad if sub_n in ["Rahu", "Ketu"] else planet_ownership_kp),
+                "planet_lord": pl_n, "pl_lord_signified": e.get_eff_sigs_detailed(pl_n, planet_res_map_kp, planet_ownership_trad if pl_n in ["Rahu", "Ketu"] else planet_ownership_kp)
             })
-            
-        moon_lon_lh = next(p["lon"] for p in planets_raw_lahiri if p["planet"] == "Moon")
-        dasha_data = self.calculate_dasha(planets_raw_lahiri, birth_dt_loc, moon_lon_lahiri=moon_lon_lh)
-        varga_charts = {}
-        for v_name, d_val in {"D1": 1, "D9": 9, "D10": 10}.items():
-            vp = []
-            for p_dict in planets_raw_lahiri:
-                v_s = self.get_varga_sign(p_dict["lon"], d_val)
-                vp.append({"planet": p_dict["planet"], "sign": self.SIGNS[v_s], "is_retrograde": p_dict["planet"] in ["Rahu", "Ketu"] or p_dict["speed"] < 0})
-            asc_v = self.get_varga_sign(ascmc[0], d_val)
-            varga_charts[v_name] = {"planets": vp, "ascendant": {"sign": self.SIGNS[asc_v]}}
-
-        sn_kp, sl_kp, nlk_kp, sub_kp, ssl_kp, nak_kp, nadi_kp, sub_idx_kp = self.get_kp_lords(ascmc[0])
-        asc_res = {"degree_dms": f"{self.decimal_to_dms(ascmc[0])} {sn_kp}", "sign": sn_kp, "sign_lord": sl_kp, "star_lord": nlk_kp, "sub_lord": sub_kp, "sub_sub_lord": ssl_kp, "nakshatra": nak_kp, "nadi": nadi_kp, "planet_lord": sl_kp}
-        
-        moon_lon_lh = dasha_data["moon_lon"]
-        nak_size = 360/27
-        return {
-            "status": "success", "ascendant": asc_res, "houses": houses_res, "planets": planets_res,
-            "significations": significations_res, "nakshatra_nadi": nak_nadi_res, "dasha": dasha_data,
-            "varga_charts": varga_charts,
-            "metadata": {"ayanamsa": "KP (Planet Table), Lahiri (Dasha)", "ayanamsa_value": f"KP:{ayan_kp:.4f} L:{ayan_lahiri:.4f}", "janma_nakshatra": self.NAKSHATRAS[int(moon_lon_lh/nak_size)%27], "pada": int((moon_lon_lh % nak_size) / (nak_size / 4)) + 1, "horary_number": horary_number},
-            "aspects": self.calculate_aspects(planets_raw_lahiri)
-        }
+        return nak_nadi_res
 
-    def calculate_aspects(self, planets_raw):
-        res = []
-        for i in range(len(planets_raw)):
-            p1 = planets_raw[i]
-            for j in range(len(planets_raw)):
-                if i == j: continue
-                p2 = planets_raw[j]
-                diff = abs(p1["lon"] - p2["lon"])
-                if diff > 180: diff = 360 - diff
-                for name, deg in self.ASPECTS.items():
-                    if abs(diff - deg) <= 6.0:
-                        res.append({"planet": p1["planet"], "aspect": name, "target": p2["planet"], "degree_diff": round(diff, 2)})
-        f_res = []
-        for r in res:
-            if r["planet"] in ["Rahu", "Ketu"] and r["aspect"] not in ["Trine", "Opposition", "Conjunction"]: continue
-            f_res.append(r)
-        return f_res
+    @cached_property
+    def dasha(self):
+        return self.engine.calculate_dasha(self.positions["planets_raw_lahiri"], self.birth_dt_loc, moon_lon_lahiri=self.moon_lon_lahiri, depth=self.dasha_depth, window=self.window, ref_dt=self.ref_dt)
 
-    def get_eff_sigs_detailed(self, p_name, planet_map, planet_ownership):
-        if p_name not in planet_map: return []
-        p_data = planet_map[p_name]
-        sigs = [{"house": int(p_data["house_placed"]), "is_placed": True}]
-        h_seen = {int(p_data["house_placed"])}
-        
-        for h in planet_ownership.get(p_name, []):
-            if h not in h_seen:
-                sigs.append({"house": h, "is_placed": False})
-                h_seen.add(h)
-                
-        if p_name in ["Rahu", "Ketu"]:
-            for agent in self.get_node_agents(p_name, p_data, list(planet_map.values())):
-                a_name = agent['planet']
-                if a_name and a_name in planet_map:
-                    a_occ = int(planet_map[a_name]["house_placed"])
-                    if a_occ not in h_seen:
-                        sigs.append({"house": a_occ, "is_placed": False})
-                        h_seen.add(a_occ)
-                    for h in planet_ownership.get(a_name, []):
-                        if h not in h_seen:
-                            sigs.append({"house": h, "is_placed": False})
-                            h_seen.add(h)
-        return sorted(sigs, key=lambda x: x["house"])
+    @cached_property
+    def varga_charts(self):
+        e = self.engine
+        varga_charts = {}
+        for v_name, d_val in VARGA_DIVISIONS.items():
+            vp = []
+            for p_dict in self.positions["planets_raw_lahiri"]:
+                v_s = e.get_varga_sign(p_dict["lon"], d_val)
+                vp.append({"planet": p_dict["planet"], "sign": e.SIGNS[v_s], "is_retrograde": p_dict["planet"] in ["Rahu", "Ketu"] or p_dict["speed"] < 0})
+            asc_v = e.get_varga_sign(self.positions["ascmc"][0], d_val)
+            varga_charts[v_name] = {"planets": vp, "ascendant": {"sign": e.SIGNS[asc_v]}}
+        return varga_charts
 
-    def calculate_kp_significators_4level(self, p_name, planet_map, planet_ownership):
-        if p_name not in planet_map: return {"L1":[], "L2":[], "L3":[], "L4":[], "is_self_strength": False}
-        p_data = planet_map[p_name]
-        sl_data = planet_map.get(p_data["star_lord"])
-        l1 = [int(sl_data["house_placed"])] if sl_data else []
-        l2 = [int(p_data["house_placed"])]
-        l3 = sorted([int(h) for h in planet_ownership.get(p_data["star_lord"], [])])
-        l4 = sorted([int(h) for h in planet_ownership.get(p_name, [])])
-        self_s = not any(p["star_lord"] == p_name for p in planet_map.values())
-        return {"L1": l2, "L2": l1, "L3": l4, "L4": l3, "is_self_strength": True} if self_s else {"L1": l1, "L2": l2, "L3": l3, "L4": l4, "is_self_strength": False}
+    @cached_property
+    def metadata(self):
+        ayan_kp, ayan_lahiri = self.positions["ayan_kp"], self.positions["ayan_lahiri"]
+        moon_lon_lh = self.moon_lon_lahiri
+        nak_size = 360/27
+        return {"ayanamsa": "KP (Planet Table), Lahiri (Dasha)", "ayanamsa_value": f"KP:{ayan_kp:.4f} L:{ayan_lahiri:.4f}", "janma_nakshatra": self.engine.NAKSHATRAS[int(moon_lon_lh/nak_size)%27], "pada": int((moon_lon_lh % nak_size) / (nak_size / 4)) + 1, "horary_number": self.horary_number}
 
-    def get_node_significators(self, node_name, planet_map, house_owners):
-        base = self.calculate_kp_significators_4level(node_name, planet_map, house_owners)
-        p_data = planet_map[node_name]
-        agents = self.get_node_agents(node_name, p_data, list(planet_map.values()))
-        for agent in agents:
-            a_name = agent['planet']
-            if a_name and a_name in planet_map:
-                a_sigs = self.calculate_kp_significators_4level(a_name, planet_map, house_owners)
-                for lvl in ["L1", "L2", "L3", "L4"]:
-                    base[lvl] = sorted(list(set(base[lvl] + a_sigs[lvl])))
-        agent_names = [a['planet'] for a in agents]
-        base["agent"] = ", ".join(agent_names) if agent_names else None
-        return base
+    @cached_property
+    def aspects(self):
+        return self.engine.calculate_aspects(self.positions["planets_raw_lahiri"])
 
-    def calculate_dasha(self, planets_raw, birth_dt_loc, moon_lon_lahiri=None):
-        """
-        Final High-Precision Vimshottari Dasha (v1.2.8)
-        Sidereal Year = 365.25636 days.
-        Nakshatra Length = 48000 arcseconds.
-        """
-        if moon_lon_lahiri is not None:
-            moon_lon = moon_lon_lahiri
-        else:
-            moon_lon = next(p["lon"] for p in planets_raw if p["planet"] == "Moon")
-        abs_arcsec = moon_lon * 3600.0
-        nak_len_arcsec = 48000.0 
-        nak_idx = int(abs_arcsec // nak_len_arcsec) % 27
-        rem_arcsec = nak_len_arcsec - (abs_arcsec % nak_len_arcsec)
-        bal_f = rem_arcsec / nak_len_arcsec
-        lord_name = self.DASHA_ORDER[nak_idx % 9]
-        bal_yrs_f = self.DASHA_YEARS[lord_name] * bal_f
-        DAYS_PER_YEAR = 365.25636
-        def add_p(dt, f_yrs): return dt + datetime.timedelta(days=f_yrs * DAYS_PER_YEAR)
-        fmt = lambda dt: dt.strftime("%d/%m/%Y %H:%M:%S")
-        today = datetime.datetime.now(pytz.UTC)
-        md_end_first = add_p(birth_dt_loc, bal_yrs_f)
-        md_curs = md_end_first - datetime.timedelta(days=self.DASHA_YEARS[lord_name] * DAYS_PER_YEAR)
-        def get_seq(p):
-            idx = self.DASHA_ORDER.index(p)
-            return self.DASHA_ORDER[idx:] + self.DASHA_ORDER[:idx]
-        tree, act_md, act_ad, act_pd, act_sd = [], "None", "None", "None", "None"
-        for md_p in get_seq(lord_name):
-            md_start = md_curs
-            md_end = add_p(md_start, self.DASHA_YEARS[md_p])
-            md_item = {"planet": md_p, "label": "D", "start_date": fmt(md_start), "end_date": fmt(md_end), "bukthis": []}
-            if md_start <= today <= md_end: act_md = md_p
-            ad_curs = md_start
-            for ad_p in get_seq(md_p):
-                ad_y = (self.DASHA_YEARS[md_p] * self.DASHA_YEARS[ad_p]) / 120.0
-                ad_end = add_p(ad_curs, ad_y)
-                ad_item = {"planet": ad_p, "label": "B", "start_date": fmt(ad_curs), "end_date": fmt(ad_end), "antaras": []}
-                if act_md == md_p and ad_curs <= today <= ad_end: act_ad = ad_p
-                pd_curs = ad_curs
-                for pd_p in get_seq(ad_p):
-                    pd_y = (self.DASHA_YEARS[md_p] * self.DASHA_YEARS[ad_p] * self.DASHA_YEARS[pd_p]) / (120.0**2)
-                    pd_end = add_p(pd_curs, pd_y)
-                    pd_item = {"planet": pd_p, "label": "A", "start_date": fmt(pd_curs), "end_date": fmt(pd_end), "pratyantars": []}
-                    if act_ad == ad_p and pd_curs <= today <= pd_end: act_pd = pd_p
-                    if act_ad == ad_p:
-                        sd_curs = pd_curs
-                        for sd_p in get_seq(pd_p):
-                            sd_y = (self.DASHA_YEARS[md_p] * self.DASHA_YEARS[ad_p] * self.DASHA_YEARS[pd_p] * self.DASHA_YEARS[sd_p]) / (120.0**3)
-                            sd_end = add_p(sd_curs, sd_y)
-                            if act_pd == pd_p and sd_curs <= today <= sd_end: act_sd = sd_p
-                            pd_item["pratyantars"].append({"planet": sd_p, "label": "P", "start_date": fmt(sd_curs), "end_date": fmt(sd_end)})
-                            sd_curs = sd_end
-                    ad_item["antaras"].append(pd_item)
-                    pd_curs = pd_end
-                md_item["bukthis"].append(ad_item)
-                ad_curs = ad_end
-            tree.append(md_item)
-            md_curs = md_end
-        y_bal = int(bal_yrs_f)
-        rem_d = (bal_yrs_f - y_bal) * DAYS_PER_YEAR
-        m_bal = int(rem_d / 30.436875)
-        d_bal = int(rem_d - m_bal * 30.436875)
-        return {"balance_at_birth": f"{y_bal}y {m_bal}m {d_bal}d", "current_dasha": act_md, "current_bukthi": act_ad, "current_antara": act_pd, "current_pratyantar": act_sd, "mahadasha_sequence": tree, "moon_lon": moon_lon}
+@lru_cache(maxsize=32)
+def get_engine(node_type="Mean", ayanamsa="KP", house_system="Placidus"):
+    """Shared NadiEngine per (node_type, ayanamsa, house_system); engines are configuration-only."""
+    return NadiEngine(node_type=node_type, ayanamsa=ayanamsa, house_system=house_system)
@@ -0,0 +1,557 @@
+from nadi_core import HIT_MATRIX, HOUSE_BIT, MASK_HOUSES, POPCOUNT, houses_mask
+
+# House-combination predictions for the Nakshatra Nadi table (JobPredictionTable).
+# Every planet row is read through its PL / NL / SL significators plus the house the planet, its star lord
+# and its sub lord occupy (the "hit"). Each area splits those houses into auspicious / inauspicious columns,
+# grades the combination against its rule tables and reads the success matrix at (SL hit, NL hit).
+# predict() evaluates all requested areas for all planets in one pass over kundli["nakshatra_nadi"].
+# House sets are 12-bit masks (nadi_core.HOUSE_BIT) throughout; rule tables are compiled to masks at import.
+
+AREAS = ("Job", "Education", "Marriage", "Child Birth", "Health", "Travel", "Property & Vehicle")
+
+JOB_PROFESSION_MAP = {
+    1: "Self effort job, Body or Mind Job, Psychiatrist, Nutritionist, Yoga, Gym instructor, Models Army, Military",
+    2: "Bank, Investment business, Family business, Hotel industry, Gems, Jewelry business, Speakers, Singers, Marriage bureau, Food products, Dental, ENT specialist.",
+    3: "CA, Bank, Accountancy, Retail, Commission agent, Sales, Marketing, Media, Journalism, Commerce, Tours and Travels, Software and Networking, Brokers, Sports.",
+    4: "Institutions, Hospitality, Restaurants, Property, Farming and Agriculture, Vehicle dealer, Automobile engineering, Real Estate, Educationist, Civil works, Building Contractors, Rental, Team Leader, Teachers, Tuition’s, Vaastu Consultant.",
+    5: "Actors, Film, Arts, Sports, Advertising, Product development, Children Play school, Any Consultation, Cinema, Multiplex, Entertainment, Event organizers or Games, Healing industry, Designer, Creative, Software field, Solution provider, Shares, Information technology, Architecture, Fashion, Child specialist.",
+    6: "Service industry, All general jobs, Lawyers and Advocates, Money Lenders, Medicine field, CA, Financiers, Civil services, Banking, Dietician, Nursing, Pharmacy, Human resources, Army, Military, Airforce, Engineering filed.",
+    7: "Business, Data sciences, Retail, Sales, Marketing, Logistics, Trading, Daily transaction, Dealers, Public relations, International sales, Banking services, Police, Army, Military.",
+    8: "Technology, Research, Manufacturing, Astrology, Scientist, Insurance field, Occult science, Doctors, Surgeons, Agriculture, Petroleum, Oil industry, Excavators, Mines, Granite business.",
+    9: "Professor, Preacher, NGO’s, Trusts, Old age homes, All type of Consultants, Tourism, Publication, Judges, Foreign travels, Immigration, Travel Job, Philosopher, Navy, Hospital Management.",
+    10: "Government job, Civil services, All type of Manager’s, Any Authoritative job, Administrators, Politics, Corporate’s, CA's, MD, CEO's.",
+    11: "Government job, NGO’s, Private clubs, Private Banks, Pubs and Restaurant, Any Business, Shares, Any profession is good.",
+    12: "Research, Scientist, Abroad jobs, Hospitals, Doctors, Yoga, Astrology, MNC jobs, Job away from Birth Place, Old age homes, Export industry, Insurance field, Legal, Physiology, Health Consultant, Nursing, Script writer, Investigation and Detective."
+}
+
+EDU_PROFESSION_MAP = {
+    1: "Self-development Studies, Success through self, Physical training, Acting, Dance, Army, Military.",
+    2: "Banking, Finance, Speech therapy, Family business, Gems, Jewelry, Food, Dental, Singers.",
+    3: "Marketing, Sales, Retail, Communication, Accountancy, Software and Networking, Sports, Media, Short Travel, Broadcasting, IT, Tourism.",
+    4: "Teaching, Institutions, any sort of Training, Team Leader, Hotel Management, Construction/Civil, Real estate, Farming, Automobile engineering.",
+    5: "Creativity, Fashion, Product Development, Sports, Dancing, Media, Shares, Medicine, Gynecology, Entertainment, Event management, Film, Advertising, Software.",
+    6: "Civil services, Medicine, Banking, Loan, Legal, Finance, Nursing, Dietician, Pharmacy, HR, Army, Military, Air force, Engineering.",
+    7: "Business studies, Banking, International trade, Retail, Police, Army, Military.",
+    8: "Technical or Research field, Manufacturing, Astrology, Insurance, Surgeons, Mines, Geologist, Oil studies, Crime, Priest study, Engineering.",
+    9: "Publishers, Philosophy, Lecturer, Law, Judge, Immigration, Tourism, Travel, Navy, Management studies, Sports, Hospital management.",
+    10: "Civil Services, Management study, Judge, Political studies, Mass communication, Administration, Masters.",
+    11: "Good in any educational field selected.",
+    12: "Interest in depth study of a Subject, Yoga, Hospital, Medicine, Nursing, Astrology, Psychology, Research, Detective, Script writer, Legal, Health, Export."
+}
+
+MARRIAGE_RESULT_MAP = {
+    1: "Single, Self Focus, Not interested or Partner discarding nature.",
+    2: "Partnership focus, Marriage interest, Family addition.",
+    3: "Cooperation, Negotiation, Comunicative in married life.",
+    4: "Focus on individual goal, Working partner, Mother/In-law Involvement.",
+    5: "Love, Selective choosing, Potential obstacles or separation mindset.",
+    6: "No interest, Separation mindset, Money or Work focused partner.",
+    7: "Marriage good, Partner helpful, Caring, Loving, Happy.",
+    8: "Obstacles, Hindrances, Humiliation, Fear, Separation, Divorce.",
+    9: "Elders approval, Father/In-law Involvement, Normal Marriage.",
+    10: "Ego, Highly Selective, Aggressive behavior, Pride.",
+    11: "Good Marriage, Gain in married life, Partner's Love.",
+    12: "Detached mindset, Physical separation, Seclusion, Divorce."
+}
+
+CHILD_BIRTH_RESULT_MAP = {
+    1: "Difficulty in Child Birth.",
+    2: "Child Birth Indicated.",
+    3: "Neutral.",
+    4: "Difficulty in Child Birth.",
+    5: "Child Birth Indicated.",
+    6: "Complication in Child Birth.",
+    7: "Neutral.",
+    8: "Complication in Child Birth.",
+    9: "Child Birth Indicated with 2 or 5.",
+    10: "Difficulty in Child Birth.",
+    11: "Child Birth Indicated with 2 or 5.",
+    12: "Complication in Child Birth."
+}
+
+HEALTH_RESULT_MAP = {
+    1: "Good Health, Recovery potential.",
+    2: "Normal Health, Face/Eye area focus.",
+    3: "Normal Health, Ears/Hands area.",
+    4: "Long term or incurable disease",
+    5: "Strong health",
+    6: "Small disease",
+    7: "Normal Health, Kidneys/Urine area.",
+    8: "Chronic disease",
+    9: "Divine protection",
+    10: "Major disease diagnosis",
+    11: "Gain or recovery of health",
+    12: "Hospitalization or bed rest"
+}
+
+HEALTH_DISEASE_MAP = {
+    "SUN": "Headache, Eyesight problem, Fever, Migraine, Brain and Heart related problem, Acidity, Spinal Cord, Loss of appetite, Bile, Sun stroke",
+    "MOON": "Poor blood circulation, Heart issue, Common Cough and Cold, Depression, Poor Eyesight, Fears and Phobia, Wetting in hand, Unconsciousness (Coma), Breast related problem, Stomach Problem, Insomnia",
+    "MARS": "All Blood related problem, Accidents, Operation to any part of body, Bone marrow, Fracture, Calcium deficiency, BP and low BP, Varicose Veins, Tooth related Problem, Nail Problems, Fever",
+    "MERCURY": "Fits or Epilepsy, Skin and Nerve problem, Deaf and Dumb, Psoriasis, White Patches, Varicose and Veins, Ear Nose Throat Problems, Memory Loss, Alzimer's disease, Parkinson's disease",
+    "JUPITER": "Diabetes, Cholesterol, Lungs, Thyroid, Obesity, Jaundice, Liver problems, fat accumulation",
+    "VENUS": "Kidney, PCOD, Spermatozoa, Fungus and Infection, Skin problem, White Patches, Stones, Urine and Uterus",
+    "SATURN": "Deformalities of a body, Joint and Back pain, Spondylosis, Hair fall and White hair, Disc slip, Leprosy, Asthma, Snoring, Knee pain, Insomnia, Leg pain",
+    "RAHU": "Incurable disease like Cancer, Aids, Disease which is difficult to diagnosis, Immunity, Bite of poisonous insects, Operations, Hospitalization",
+    "KETU": "Allergies and Infection, B P, Contagious disease, Airborne disease, Infections, Amputations, Heat related problem, Piles and Fistula, Intestine, Constipation"
+}
+
+DONATION_MAP = {
+    "SUN": {"item": "Wheat", "day": "Sunday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "MOON": {"item": "Rice", "day": "Monday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "MARS": {"item": "Toordal", "day": "Tuesday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "MERCURY": {"item": "Green Gram", "day": "Wednesday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "JUPITER": {"item": "Bengal Gram", "day": "Thursday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "VENUS": {"item": "Hyacinth Beans", "day": "Friday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "SATURN": {"item": "Black Sesame", "day": "Saturday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "RAHU": {"item": "Black Urad", "day": "Saturday", "time": "Morning 6:00 AM to 7:00 AM"},
+    "KETU": {"item": "Horse Gram", "day": "Thursday", "time": "Morning 6:00 AM to 7:00 AM"}
+}
+
+# Success matrices, same layout as HIT_MATRIX: row = SL hit, column = NL hit - 1. Job uses HIT_MATRIX itself.
+EDU_SUCCESS_MATRIX = {
+    1:  ["M", "M", "L", "H", "M", "M", "M", "L", "M", "M", "H", "VB!"],
+    2:  ["M", "M", "M", "H", "M", "M", "M", "M", "H", "H", "E", "M"],
+    3:  ["L", "M", "L", "M", "L", "L", "M", "B!", "M", "M", "M", "VB!"],
+    4:  ["H", "H", "M", "H", "M", "M", "M", "M", "H", "H", "E", "M"],
+    5:  ["M", "M", "L", "M", "M", "L", "M", "L", "L", "M", "H", "B!"],
+    6:  ["M", "M", "L", "M", "L", "L", "M", "B!", "L", "M", "H", "VB!"],
+    7:  ["M", "M", "M", "M", "M", "M", "M", "M", "M", "H", "H", "B!"],
+    8:  ["B!", "M", "B!", "M", "B!", "B!", "M", "B!", "L", "M", "M", "VB!"],
+    9:  ["M", "H", "M", "H", "L", "L", "M", "L", "M", "H", "E", "M"],
+    10: ["H", "H", "H", "H", "H", "H", "H", "H", "H", "H", "E", "M"],
+    11: ["H", "E", "H", "E", "H", "H", "H", "H", "E", "E", "E", "M"],
+    12: ["B!", "M", "VB!", "M", "B!", "VB!", "VB!", "VB!", "B!", "M", "M", "VB!"]
+}
+
+MARRIAGE_SUCCESS_MATRIX = {
+    1:  ["B", "M", "B", "B", "B", "VB", "L", "B", "L", "VB", "M", "B"],
+    2:  ["M", "E", "M", "M", "M", "M", "E", "M", "E", "M", "E", "M"],
+    3:  ["B", "M", "L", "L", "L", "B", "M", "L", "M", "B", "M", "L"],
+    4:  ["B", "M", "L", "L", "L", "B", "M", "L", "M", "B", "M", "L"],
+    5:  ["B", "M", "L", "L", "L", "B", "M", "B", "M", "B", "M", "B"],
+    6:  ["VB", "L", "VB", "VB", "VB", "VB", "L", "VB", "L", "VB", "L", "VB"],
+    7:  ["M", "E", "M", "M", "M", "M", "E", "M", "E", "M", "E", "M"],
+    8:  ["B", "M", "L", "L", "B", "VB", "M", "L", "M", "B", "M", "L"],
+    9:  ["M", "H", "M", "M", "M", "M", "H", "M", "M", "L", "H", "M"],
+    10: ["VB", "M", "B", "B", "B", "VB", "M", "B", "L", "B", "M", "B"],
+    11: ["H", "E", "M", "M", "H", "M", "E", "M", "H", "M", "E", "M"],
+    12: ["B", "M", "L", "L", "B", "VB", "M", "L", "M", "B", "M", "L"]
+}
+
+CHILD_BIRTH_SUCCESS_MATRIX = {
+    1:  ["B", "M", "B", "VB", "M", "B", "L", "B", "L", "B", "M", "B"],
+    2:  ["M", "H", "M", "M", "E", "M", "M", "M", "H", "M", "H", "M"],
+    3:  ["B", "M", "L", "B", "M", "L", "L", "L", "M", "B", "M", "L"],
+    4:  ["VB", "VB", "VB", "VB", "B", "VB", "VB", "VB", "VB", "VB", "B", "VB"],
+    5:  ["M", "E", "H", "M", "E", "H", "H", "M", "E", "M", "E", "M"],
+    6:  ["B", "M", "L", "VB", "M", "L", "L", "L", "M", "B", "M", "L"],
+    7:  ["L", "M", "L", "VB", "M", "L", "L", "L", "M", "L", "M", "L"],
+    8:  ["B", "M", "L", "VB", "M", "L", "L", "L", "M", "B", "M", "L"],
+    9:  ["M", "H", "M", "B", "H", "M", "M", "M", "M", "L", "H", "M"],
+    10: ["B", "B", "L", "VB", "M", "B", "L", "B", "L", "B", "M", "L"],
+    11: ["M", "E", "M", "M", "E", "M", "M", "M", "H", "M", "H", "M"],
+    12: ["B", "M", "L", "VB", "M", "L", "L", "L", "M", "B", "M", "L"]
+}
+
+HEALTH_SUCCESS_MATRIX = {
+    1:  ["M", "M", "L", "B", "M", "B", "M", "VB", "M", "B", "M", "B"],
+    2:  ["M", "M", "M", "M", "M", "B", "M", "B", "M", "M", "M", "B"],
+    3:  ["M", "M", "M", "M", "L", "L", "M", "B", "M", "M", "M", "B"],
+    4:  ["B", "B", "B", "VB", "L", "VB", "B", "VB", "B", "VB", "M", "VB"],
+    5:  ["E", "G", "G", "M", "E", "M", "G", "M", "E", "G", "E", "M"],
+    6:  ["B", "B", "B", "B", "L", "B", "L", "VB", "L", "VB", "M", "VB"],
+    7:  ["M", "M", "M", "M", "M", "B", "M", "B", "M", "B", "M", "B"],
+    8:  ["B", "B", "B", "B", "L", "VB", "B", "VB", "L", "VB", "M", "VB"],
+    9:  ["G", "G", "G", "M", "G", "M", "M", "M", "G", "M", "E", "M"],
+    10: ["B", "M", "M", "B", "M", "B", "B", "B", "M", "VB", "M", "VB"],
+    11: ["G", "G", "G", "M", "E", "M", "M", "M", "G", "G", "E", "M"],
+    12: ["VB", "B", "B", "VB", "B", "VB", "B", "VB", "B", "VB", "B", "VB"]
+}
+
+SUCCESS_INFO = {
+    "VB!": "Very Bad!", "VB": "Very Bad!", "B!": "Bad!", "B": "Bad!",
+    "M": "Medium", "L": "Low", "H": "High", "G": "Good", "E": "Excellent"
+}
+
+def combo_masks(combos):
+    return tuple(houses_mask(c) for c in combos)
+
+def compile_tiers(tiers):
+    return tuple((label, combo_masks(combos)) for label, combos in tiers)
+
+# Graded house combinations: the first tier with a fully contained combination wins
+JOB_GOOD_TIERS = compile_tiers((
+    ("Very High", [[2, 6, 7, 9, 10, 11], [2, 6, 7, 9, 11], [2, 6, 7, 11], [2, 6, 11], [2, 7, 11], [2, 11], [10, 11], [7, 11], [4, 11], [3, 11], [5, 11], [8, 11], [11]]),
+    ("High", [[2, 6, 7, 9, 10], [2, 6, 7, 10], [2, 6, 10], [2, 7, 10], [2, 10], [9, 10], [7, 10], [4, 10], [3, 10], [5, 10], [8, 10], [10]]),
+    ("Medium", [[2, 6, 7, 9], [2, 6, 9], [2, 7, 9], [2, 6], [2, 7], [2, 9], [7, 9], [4, 9], [3, 9], [5, 9], [5], [8], [12]]),
+))
+JOB_BAD_TIERS = compile_tiers((
+    ("High Loss", [[5, 6, 7, 8, 9, 12], [5, 6, 7, 8, 12], [5, 7, 8, 12], [5, 6, 8, 12], [5, 8, 12], [8, 12], [5, 8], [5, 12]]),
+    ("Medium Loss", [[6, 8, 9, 12], [7, 8, 9, 12], [6, 8, 12], [7, 8, 12], [6, 12], [7, 12], [9, 12]]),
+))
+
+MARRIAGE_GOOD_TIERS = compile_tiers((
+    ("Very Good Indication", [[2, 7, 9, 11]]),
+    ("Good Indication", [[2, 7, 11], [7, 9, 11], [2, 9, 11]]),
+    ("Medium Indication", [[2, 7], [2, 11], [7, 11]]),
+    ("Low Indication", [[2], [7], [9], [11]]),
+))
+MARRIAGE_BAD_TIERS = compile_tiers((
+    ("Very Bad Indication", [[1, 5, 6, 8, 10, 12]]),
+    ("Bad Indication", [[1, 5, 6, 10], [1, 6, 10], [5, 6, 10]]),
+    ("Medium Problems", [[6, 10], [5, 10], [5, 6]]),
+    ("Low Problems", [[5], [6], [1, 10]]),
+))
+
+CHILD_BIRTH_GOOD_TIERS = compile_tiers((
+    ("Very Good Indication", [[2, 5, 9, 11]]),
+    ("Good Indication", [[2, 5, 11], [5, 9, 11], [5, 11]]),
+    ("Medium Indication", [[5], [2], [11]]),
+))
+CHILD_BIRTH_BAD = combo_masks([[1, 4, 8, 10, 12], [1, 4, 8, 10], [1, 4, 10], [4, 10], [4], [1, 10]])
+CHILD_BIRTH_BAD_TIERS = (
+    ("High Difficulty", CHILD_BIRTH_BAD),
+    ("Abortion Risk", combo_masks([[2, 5, 6, 8, 12], [2, 5, 8, 12], [5, 8, 12]])),
+)
+CHILD_BIRTH_SPECIAL_CASE = combo_masks([[2, 5, 8, 11]])
+# Neutral houses dropped from every Child Birth row (significators and hits)
+CHILD_BIRTH_NEUTRALS = houses_mask((3, 6, 7))
+
+HEALTH_GOOD_TIERS = compile_tiers((
+    ("High", [[5, 9, 11]]),
+    ("Medium", [[5, 11], [5, 9]]),
+    ("Low", [[5], [11], [9]]),
+))
+HEALTH_BAD_TIERS = compile_tiers((
+    ("High", [[4, 6, 8, 10, 12], [4, 6, 10, 12], [4, 8, 10, 12]]),
+    ("Medium", [[4, 6, 8, 10], [4, 8, 12], [4, 6, 12], [4, 6, 10], [4, 8, 10], [4, 10], [6, 8, 12]]),
+    ("Low", [[4], [6, 12], [6, 8], [8], [6]]),
+))
+
+# Travel and Property grade two outcomes instead of good / bad: (abroad, home) and (purchase, sale)
+TRAVEL_ABROAD_TIERS = compile_tiers((
+    ("VERY HIGH", [[1, 3, 7, 9, 11, 12], [3, 7, 9, 12], [3, 9, 12]]),
+    ("HIGH", [[9, 12], [3, 12], [12]]),
+    ("MEDIUM", [[9], [3]]),
+))
+TRAVEL_HOME_TIERS = compile_tiers((
+    ("VERY HIGH", [[2, 4, 11]]),
+    ("HIGH", [[2, 11]]),
+    ("MEDIUM", [[4, 11]]),
+    ("LOW", [[2, 4], [2], [4]]),
+))
+PROPERTY_PURCHASE_TIERS = compile_tiers((
+    ("VERY HIGH", [[4, 6, 8, 11, 12], [4, 6, 11, 12]]),
+    ("HIGH", [[4, 8, 11, 12], [4, 11, 12], [4, 6, 11]]),
+    ("MEDIUM", [[4, 8, 11], [4, 11]]),
+    ("LOW", [[4], [8, 11]]),
+))
+PROPERTY_SALE_TIERS = compile_tiers((
+    ("VERY HIGH", [[3, 5, 10, 11], [3, 5, 10, 11, 12]]),
+    ("HIGH", [[3, 5, 11], [3, 5, 11, 12]]),
+    ("MEDIUM", [[3, 5, 10], [3, 11], [3, 11, 12]]),
+    ("LOW", [[3, 12], [3, 5], [3, 10], [3]]),
+))
+PROPERTY_LITIGATION = combo_masks([[3, 5, 6, 8, 12], [3, 5, 6, 12], [3, 5, 6, 8], [3, 5, 8, 12], [3, 5, 12]])
+
+# Fixed (good, bad) columns; Job, Education and Child Birth depend on the row's houses (bifurcation())
+FIXED_COLUMNS = {
+    "Marriage": (houses_mask((2, 3, 4, 7, 9, 11)), houses_mask((1, 5, 6, 8, 10, 12))),
+    "Health": (houses_mask((1, 2, 3, 5, 7, 9, 11)), houses_mask((4, 6, 8, 10, 12))),
+    "Travel": (houses_mask((1, 3, 7, 9, 11, 12)), houses_mask((2, 4, 11))),
+    "Property & Vehicle": (houses_mask((1, 2, 4, 6, 7, 8, 11, 12)), houses_mask((3, 5, 10))),
+}
+
+SUCCESS_MATRICES = {
+    "Education": EDU_SUCCESS_MATRIX, "Marriage": MARRIAGE_SUCCESS_MATRIX,
+    "Child Birth": CHILD_BIRTH_SUCCESS_MATRIX, "Health": HEALTH_SUCCESS_MATRIX
+}
+RESULT_MAPS = {"Education": EDU_PROFESSION_MAP, "Marriage": MARRIAGE_RESULT_MAP, "Child Birth": CHILD_BIRTH_RESULT_MAP, "Health": HEALTH_RESULT_MAP}
+# Houses whose presence among the NL / SL bad houses decides whose remedy applies when both hit 8 or 12
+REMEDY_BAD_HOUSES = {"Marriage": houses_mask((1, 5, 6, 8, 10, 12))}
+DEFAULT_REMEDY_BAD_HOUSES = houses_mask((4, 6, 8, 10, 12))
+
+# Job houses that are always auspicious but shown as "medium" (blue) rather than green
+JOB_BLUE_HOUSES = houses_mask((1, 3, 4))
+JOB_NOTE = "Good in Medicine, Abroad, Software, any Business without investments, Astrology, Technology"
+MARRIAGE_HOUSES = houses_mask((2, 7, 11))
+# Houses not counted as "green" for the Education exam indication
+EDU_GREEN_EXCLUDED = houses_mask((1, 5, 7))
+
+def resolve_areas(areas=None):
+    """Requested areas in AREAS order (all of them for None); raises ValueError on an unknown name."""
+    if areas is None:
+        return AREAS
+    unknown = [a for a in areas if a not in AREAS]
+    if unknown:
+        raise ValueError(f"Unknown area(s) {unknown}; expected any of {list(AREAS)}")
+    return tuple(a for a in AREAS if a in areas)
+
+def matches(houses, combos):
+    return any(houses & c == c for c in combos)
+
+def grade(houses, tiers, default=""):
+    for label, combos in tiers:
+        if matches(houses, combos):
+            return label
+    return default
+
+EDU_CORE_GOOD, EDU_GP, EDU_CHELA, H11, H12 = houses_mask((1, 2, 4, 10, 11)), houses_mask((3, 5, 7, 9)), houses_mask((6, 8)), HOUSE_BIT[11], HOUSE_BIT[12]
+CB_PRIM_GOOD, CB_PRIM_BAD, CB_OBSTACLES, H4, H5 = houses_mask((2, 5, 9, 11)), houses_mask((1, 4, 10)), houses_mask((8, 12)), HOUSE_BIT[4], HOUSE_BIT[5]
+JOB_CORE_GOOD, JOB_SCENARIO_HOUSES = houses_mask((2, 10, 11)) | JOB_BLUE_HOUSES, houses_mask((5, 6, 7, 8, 9))
+JOB_DEFAULT_GOOD = houses_mask((6, 7, 9))
+
+def bifurcation(houses, area):
+    """(good, bad) column masks for one row's house mask; a house may be in both or neither."""
+    if area in FIXED_COLUMNS:
+        return FIXED_COLUMNS[area]
+    if area == "Education":
+        if houses & H11 and not houses & H12:
+            return EDU_CORE_GOOD | EDU_GP | EDU_CHELA, H12
+        if houses & H12 and not houses & H11:
+            return EDU_CORE_GOOD, EDU_GP | EDU_CHELA | H12
+        return EDU_CORE_GOOD | EDU_GP, EDU_CHELA | H12
+    if area == "Child Birth":
+        has5, has4 = houses & H5, houses & H4
+        if has5 and has4:
+            return CB_PRIM_GOOD | CB_OBSTACLES | CHILD_BIRTH_NEUTRALS, CB_PRIM_BAD
+        if has5:
+            return CB_PRIM_GOOD | CB_OBSTACLES | (CB_PRIM_BAD & ~H4) | CHILD_BIRTH_NEUTRALS, H4
+        if has4:
+            return (CB_PRIM_GOOD & ~H5) | CHILD_BIRTH_NEUTRALS, CB_PRIM_BAD | CB_OBSTACLES | H5
+        return (CB_PRIM_GOOD & ~H5) | CB_OBSTACLES | CHILD_BIRTH_NEUTRALS, CB_PRIM_BAD | H5
+    # Job: 2, 10, 11 and the blue houses are always good, 12 always bad; 5-9 follow the 11 / 12 scenario
+    has11, has12 = houses & H11, houses & H12
+    if has11 and not has12:
+        dynamic_good = JOB_SCENARIO_HOUSES
+    elif has12 and not has11:
+        dynamic_good = 0
+    else:
+        dynamic_good = JOB_DEFAULT_GOOD
+    return JOB_CORE_GOOD | dynamic_good, H12 | (JOB_SCENARIO_HOUSES & ~dynamic_good)
+
+def child_birth_grade(houses):
+    label = grade(houses, CHILD_BIRTH_GOOD_TIERS)
+    if label:
+        return label
+    if houses & HOUSE_BIT[9] and houses & (HOUSE_BIT[2] | H5):
+        return "Medium Indication"
+    return "Bad / No Indication" if matches(houses, CHILD_BIRTH_BAD) else "Low Indication"
+
+def education_grade(good):
+    green = POPCOUNT[good & ~EDU_GREEN_EXCLUDED]
+    return "Very High" if green > 3 else "High Indication" if green == 3 else "Medium Indication" if green == 2 else "Low"
+
+# Lookup tables over all 4096 house masks, built once at import: a row split, a grade or a rule match is
+# then a single read. ROW_SPLIT[area][houses] = (good, bad) houses of a row whose house mask is `houses`.
+MASKS = range(4096)
+ROW_SPLIT = {area: tuple((m & good, m & bad) for m in MASKS for good, bad in (bifurcation(m, area),)) for area in AREAS}
+
+def grade_table(tiers, default=""):
+    return tuple(grade(m, tiers, default) for m in MASKS)
+
+def match_table(combos):
+    return tuple(matches(m, combos) for m in MASKS)
+
+JOB_GOOD_GRADE, JOB_BAD_GRADE = grade_table(JOB_GOOD_TIERS, "Low"), grade_table(JOB_BAD_TIERS, "Low Loss")
+EDU_GOOD_GRADE = tuple(education_grade(m) for m in MASKS)
+MARRIAGE_GOOD_GRADE, MARRIAGE_BAD_GRADE = grade_table(MARRIAGE_GOOD_TIERS, "No Indication"), grade_table(MARRIAGE_BAD_TIERS)
+CHILD_BIRTH_GOOD_GRADE, CHILD_BIRTH_BAD_GRADE = tuple(child_birth_grade(m) for m in MASKS), grade_table(CHILD_BIRTH_BAD_TIERS)
+HEALTH_GOOD_GRADE, HEALTH_BAD_GRADE = grade_table(HEALTH_GOOD_TIERS, "No Indication"), grade_table(HEALTH_BAD_TIERS)
+TRAVEL_ABROAD_GRADE, TRAVEL_HOME_GRADE = grade_table(TRAVEL_ABROAD_TIERS, "NO INDICATION"), grade_table(TRAVEL_HOME_TIERS, "NO INDICATION")
+PROPERTY_PURCHASE_GRADE, PROPERTY_SALE_GRADE = grade_table(PROPERTY_PURCHASE_TIERS, "NO INDICATION"), grade_table(PROPERTY_SALE_TIERS, "NO INDICATION")
+PROPERTY_LITIGATION_MATCH = match_table(PROPERTY_LITIGATION)
+CHILD_BIRTH_SPECIAL_MATCH = match_table(CHILD_BIRTH_SPECIAL_CASE)
+
+# nadi_core.HIT_MATRIX marks the bad cells "B*" / "VB*"; the frontend (JobPredictionTable) knows them as "B!" / "VB!"
+HIT_MATRIX_CODES = {"B*": "B!", "VB*": "VB!"}
+
+# SUCCESS_TABLE[area][sl_hit][nl_hit] = (code, label); index 0 stands for a missing hit (Medium)
+def success_table(matrix):
+    table = [[("M", SUCCESS_INFO["M"])] * 13 for _ in range(13)]
+    for sl, row in matrix.items():
+        for nl, code in enumerate(row, 1):
+            code = HIT_MATRIX_CODES.get(code, code)
+            table[sl][nl] = (code, SUCCESS_INFO.get(code, code))
+    return tuple(tuple(row) for row in table)
+
+SUCCESS_TABLE = {area: success_table(SUCCESS_MATRICES.get(area, HIT_MATRIX)) for area in AREAS}
+
+def split_row(sigs, hit, area):
+    """(hit, good mask, bad mask) of one PL / NL / SL row: its significator mask plus its hit house."""
+    houses = sigs | HOUSE_BIT[hit] if hit is not None else sigs
+    return (hit,) + ROW_SPLIT[area][houses]
+
+def success(area, nl_hit, sl_hit):
+    code, label = SUCCESS_TABLE[area][sl_hit or 0][nl_hit or 0]
+    return {"code": code, "label": label}
+
+def remedies(area, entry, nl_hit, sl_hit, nl_bad, sl_bad):
+    """Donations for the star / sub lord whose hit falls in 8 or 12 (the worse of the two when both do)."""
+    nl_remedy, sl_remedy = nl_hit in (8, 12), sl_hit in (8, 12)
+    if nl_remedy and sl_remedy:
+        bad_houses = REMEDY_BAD_HOUSES.get(area, DEFAULT_REMEDY_BAD_HOUSES)
+        nl_count, sl_count = POPCOUNT[nl_bad & bad_houses], POPCOUNT[sl_bad & bad_houses]
+        targets = [entry["star_lord"]] if nl_count > sl_count else [entry["sub_lord"]] if sl_count > nl_count else [entry["star_lord"], entry["sub_lord"]]
+    else:
+        targets = [entry["star_lord"]] * nl_remedy + [entry["sub_lord"]] * sl_remedy
+    out = []
+    for planet in dict.fromkeys(targets):
+        donation = DONATION_MAP.get(planet.upper())
+        if donation:
+            out.append({"planet": planet, **donation})
+    return out
+
+def predict_area(area, entry, sigs, hits):
+    """One area of one planet row. sigs: PL, NL, SL significator masks; hits: their placement houses."""
+    pl_sigs, nl_sigs, sl_sigs = sigs
+    pl_hit, nl_hit, sl_hit = hits
+    if area == "Child Birth":
+        pl_sigs, nl_sigs, sl_sigs = (m & ~CHILD_BIRTH_NEUTRALS for m in sigs)
+        pl_hit, nl_hit, sl_hit = (None if h is None or HOUSE_BIT[h] & CHILD_BIRTH_NEUTRALS else h for h in hits)
+
+    pl_row = split_row(pl_sigs, None if area == "Health" else pl_hit, area)
+    nl_row = split_row(nl_sigs, nl_hit, area)
+    sl_row = split_row(sl_sigs, sl_hit, area)
+    combo_good = pl_row[1] | nl_row[1] | sl_row[1]
+    combo_bad = pl_row[2] | nl_row[2] | sl_row[2]
+    all_houses = pl_sigs | nl_sigs | sl_sigs
+    for h in (pl_hit, nl_hit, sl_hit):
+        if h is not None:
+            all_houses |= HOUSE_BIT[h]
+
+    rate = success(area, nl_hit, sl_hit)
+    bad_rate = rate["code"].startswith("B") or rate["code"].startswith("VB")
+    result_map = RESULT_MAPS.get(area, JOB_PROFESSION_MAP)
+    results = {"nl": result_map.get(nl_hit), "sl": result_map.get(sl_hit)}
+    notes = []
+
+    if area in ("Travel", "Property & Vehicle"):
+        good_grade, bad_grade = (TRAVEL_ABROAD_GRADE, TRAVEL_HOME_GRADE) if area == "Travel" else (PROPERTY_PURCHASE_GRADE, PROPERTY_SALE_GRADE)
+        good_cols, bad_cols = FIXED_COLUMNS[area]
+        combination = (all_houses & good_cols, all_houses & bad_cols)
+        indication = {"good": good_grade[all_houses], "bad": bad_grade[all_houses]}
+        if area == "Property & Vehicle" and PROPERTY_LITIGATION_MATCH[all_houses]:
+            notes.append({"title": "Problem Time (Litigation)", "text": "Sale side combination indicates litigation."})
+        if bad_rate:
+            notes.append({"title": "Note", "text": JOB_NOTE})
+    else:
+        combination = (combo_good, combo_bad)
+        if area == "Education":
+            indication = {"good": EDU_GOOD_GRADE[combo_good], "bad": "Low"}
+            if bad_rate:
+                notes.append({"title": "Note", "text": "Till 2nd PUC or 10+2"})
+        elif area == "Marriage":
+            indication = {"good": MARRIAGE_GOOD_GRADE[all_houses], "bad": MARRIAGE_BAD_GRADE[all_houses]}
+            has_marriage_houses = all_houses & MARRIAGE_HOUSES
+            if all_houses & H5 and has_marriage_houses:
+                if combo_good & H5:
+                    notes.append({"title": "Love Marriage Indication", "text": "Involvement of house 5 with marriage houses (2, 7, 11) indicates a strong promise of love marriage or a romantic relationship before marriage."})
+                elif combo_bad & H5:
+                    notes.append({"title": "Love Indication", "text": "Involvement of house 5 indicates attraction and love, but since it appears on the problem side, it may indicate love without a successful marriage."})
+            if all_houses & HOUSE_BIT[9] and has_marriage_houses:
+                notes.append({"title": "Second Marriage Indication", "text": "Involvement of house 9 with marriage houses (2, 7, 11) indicates the possibility of a second marriage, typically after a separation or divorce."})
+        elif area == "Child Birth":
+            indication = {"good": CHILD_BIRTH_GOOD_GRADE[all_houses], "bad": CHILD_BIRTH_BAD_GRADE[all_houses]}
+            # One result only: the star lord's when its row has auspicious houses, else the sub lord's
+            results = {"nl": results["nl"]} if nl_row[1] else {"sl": results["sl"]}
+            if CHILD_BIRTH_SPECIAL_MATCH[all_houses]:
+                notes.append({"title": "Note", "text": "Caesarean / IVF / Test Tube Baby"})
+        elif area == "Health":
+            indication = {"good": HEALTH_GOOD_GRADE[all_houses], "bad": HEALTH_BAD_GRADE[all_houses]}
+            # Disease possibilities of the planet and its star lord, next to the NL / SL health results
+            diseases = {
+                "pl": HEALTH_DISEASE_MAP.get(entry["planet"].upper(), "General health issues"),
+                "nl": HEALTH_DISEASE_MAP.get(entry["star_lord"].upper(), "General health issues"),
+            }
+        else:
+            indication = {"good": JOB_GOOD_GRADE[combo_good], "bad": JOB_BAD_GRADE[combo_bad]}
+            if bad_rate:
+                notes.append({"title": "Note", "text": JOB_NOTE})
+
+    # Houses signified by more than one of PL / NL / SL
+    repeated = (pl_sigs & nl_sigs) | (pl_sigs & sl_sigs) | (nl_sigs & sl_sigs)
+    out = {
+        "rows": {key: {"hit": hit, "good": list(MASK_HOUSES[good]), "bad": list(MASK_HOUSES[bad])}
+                 for key, (hit, good, bad) in (("pl", pl_row), ("nl", nl_row), ("sl", sl_row))},
+        "combination": {"good": list(MASK_HOUSES[combination[0]]), "bad": list(MASK_HOUSES[combination[1]])},
+        "counts": {h: bool(pl_sigs & HOUSE_BIT[h]) + bool(nl_sigs & HOUSE_BIT[h]) + bool(sl_sigs & HOUSE_BIT[h]) for h in MASK_HOUSES[repeated]},
+        "indication": indication,
+        "success": rate,
+        "results": results,
+        "notes": notes,
+        "remedies": [] if area == "Child Birth" else remedies(area, entry, nl_hit, sl_hit, nl_row[2], sl_row[2]),
+    }
+    if area == "Health":
+        out["diseases"] = diseases
+    return out
+
+def predict(kundli, areas=None):
+    """
+    Predictions for every planet of kundli["nakshatra_nadi"] (a calculate_kundli result) in the requested
+    areas: [{"planet", "star_lord", "sub_lord", "hits": {"pl", "nl", "sl"}, "areas": {area: {...}}}].
+    """
+    areas = resolve_areas(areas)
+    placement = {p["planet"].upper(): int(p["house_placed"]) for p in kundli["planets"]}
+    out = []
+    for entry in kundli["nakshatra_nadi"]:
+        sigs = tuple(houses_mask(s["house"] for s in entry[key]) for key in ("pl_signified", "nl_signified", "sl_signified"))
+        hits = tuple(placement.get(entry[key].upper()) for key in ("planet", "star_lord", "sub_lord"))
+        out.append({
+            "planet": entry["planet"],
+            "star_lord": entry["star_lord"],
+            "sub_lord": entry["sub_lord"],
+            "hits": dict(zip(("pl", "nl", "sl"), hits)),
+            "areas": {area: predict_area(area, entry, sigs, hits) for area in areas},
+        })
+    return out
+
+def job_report(kundli):
+    """
+    The Gold Nadi job-analysis layout of the Job area: {"csl_focus", "dasha_info", "reports"}. kundli needs
+    "planets", "houses", "nakshatra_nadi" and the current_* periods of "dasha".
+    """
+    sigs = {e["planet"]: e for e in kundli["nakshatra_nadi"]}
+    reports = []
+    for row in predict(kundli, ["Job"]):
+        job = row["areas"]["Job"]
+        entry = sigs[row["planet"]]
+        good = job["combination"]["good"]
+
+        job_areas = []
+        if job["results"]["sl"]: job_areas.append(f"Primary: {job['results']['sl']}")
+        if job["results"]["nl"] and row["hits"]["nl"] != row["hits"]["sl"]: job_areas.append(f"Secondary: {job['results']['nl']}")
+
+        reports.append({
+            "planet": row["planet"],
+            "star_lord": row["star_lord"],
+            "sub_lord": row["sub_lord"],
+            "pl": [s["house"] for s in entry["pl_signified"]],
+            "nl": [s["house"] for s in entry["nl_signified"]],
+            "sl": [s["house"] for s in entry["sl_signified"]],
+            "prediction": {
+                "overall_combination": {
+                    "good": [h for h in good if not HOUSE_BIT[h] & JOB_BLUE_HOUSES],
+                    "medium": [h for h in good if HOUSE_BIT[h] & JOB_BLUE_HOUSES],
+                    "bad": job["combination"]["bad"]
+                },
+                "income_expenses": job["indication"],
+                "success_rate": job["success"]["label"],
+                "job_areas": job_areas,
+                "hits": row["hits"]
+            }
+        })
+
+    # 6th and 10th cusp sub lords for the "Top" focus
+    csl = {h["house_number"]: h["sub_lord"] for h in kundli["houses"] if h["house_number"] in (6, 10)}
+    dasha = kundli["dasha"]
+    return {
+        "csl_focus": {"csl6": csl[6], "csl10": csl[10]},
+        "dasha_info": {"dasha": dasha["current_dasha"], "bhukti": dasha["current_bukthi"], "antara": dasha["current_antara"]},
+        "reports": reports,
+    }
+
+def kundli_view(chart):
+    """The calculate_kundli keys predict() and job_report() read, from a nadi_core.Chart, without the dasha tree."""
+    return {"planets": chart.planets, "houses": chart.houses, "nakshatra_nadi": chart.nakshatra_nadi, "dasha": chart.running_dasha}
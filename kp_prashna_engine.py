@@ -2,85 +2,70 @@ import swisseph as swe
 import datetime
 import pytz
 import math
+from types import MappingProxyType
+from nadi_core import solve_prashna_ramc, sidereal_mode
+from nadi_core import DASHA_ORDER, DASHA_YEARS, SIGNS, SIGN_RULERS, NAKSHATRAS, PLANETS_BY_NODE_TYPE
 
-class KPMixedPrashnaEngine:
-    def __init__(self):
-        self.DASHA_ORDER = ["Ketu", "Venus", "Sun", "Moon", "Mars", "Rahu", "Jupiter", "Saturn", "Mercury"]
-        self.DASHA_YEARS = {
-            "Ketu": 7, "Venus": 20, "Sun": 6, "Moon": 10,
-            "Mars": 7, "Rahu": 18, "Jupiter": 16, "Saturn": 19, "Mercury": 17
-        }
-        self.SIGN_NAMES = [
-            "Aries", "Taurus", "Gemini", "Cancer", "Leo", "Virgo",
-            "Libra", "Scorpio", "Sagittarius", "Capricorn", "Aquarius", "Pisces"
-        ]
-        self.SIGN_LORDS = {
-            "Aries": "Mars", "Taurus": "Venus", "Gemini": "Mercury", "Cancer": "Moon",
-            "Leo": "Sun", "Virgo": "Mercury", "Libra": "Venus", "Scorpio": "Mars",
-            "Sagittarius": "Jupiter", "Capricorn": "Saturn", "Aquarius": "Saturn", "Pisces": "Jupiter"
-        }
-        self.NAKSHATRAS = [
-            "Ashwini", "Bharani", "Krittika", "Rohini", "Mrigashira", "Ardra",
-            "Punarvasu", "Pushya", "Ashlesha", "Magha", "Purva Phalguni",
-            "Uttara Phalguni", "Hasta", "Chitra", "Swati", "Vishakha",
-            "Anuradha", "Jyeshtha", "Mula", "Purva Ashadha", "Uttara Ashadha",
-            "Shravana", "Dhanishta", "Shatabhisha", "Purva Bhadrapada",
-            "Uttara Bhadrapada", "Revati"
-        ]
-        self.PLANETS = {
-            "Sun": swe.SUN, "Moon": swe.MOON, "Mars": swe.MARS, "Mercury": swe.MERCURY,
-            "Jupiter": swe.JUPITER, "Venus": swe.VENUS, "Saturn": swe.SATURN,
-            "Rahu": swe.MEAN_NODE, "Ketu": swe.MEAN_NODE
-        }
-        self.HORARY_249 = self._generate_249_table()
-
-    def _generate_249_table(self):
-        """Generates the 249 KP Horary mapping table mathematically."""
-        table = {}
-        nak_size = 360.0 / 27.0  # 13°20' = 800'
-        num = 1
-        
-        for n_idx in range(27):
-            nak_start = n_idx * nak_size
-            star_lord = self.DASHA_ORDER[n_idx % 9]
+def _generate_249_table():
+    """Generates the 249 KP Horary mapping table mathematically."""
+    table = {}
+    nak_size = 360.0 / 27.0  # 13°20' = 800'
+    num = 1
+    
+    for n_idx in range(27):
+        nak_start = n_idx * nak_size
+        star_lord = DASHA_ORDER[n_idx % 9]
+        
+        # Sub sequence starts with the star lord
+        start_lord_idx = DASHA_ORDER.index(star_lord)
+        sub_seq = DASHA_ORDER[start_lord_idx:] + DASHA_ORDER[:start_lord_idx]
+        
+        curr_nak_lon = 0.0
+        for sub_lord in sub_seq:
+            arc = (DASHA_YEARS[sub_lord] / 120.0) * nak_size
+            seg_start = nak_start + curr_nak_lon
+            seg_end = seg_start + arc
             
-            # Sub sequence starts with the star lord
-            start_lord_idx = self.DASHA_ORDER.index(star_lord)
-            sub_seq = self.DASHA_ORDER[start_lord_idx:] + self.DASHA_ORDER[:start_lord_idx]
+            sign_idx_s = int(seg_start / 30.0)
+            sign_idx_e = int((seg_end - 1e-10) / 30.0)
             
-            curr_nak_lon = 0.0
-            for sub_lord in sub_seq:
-                arc = (self.DASHA_YEARS[sub_lord] / 120.0) * nak_size
-                seg_start = nak_start + curr_nak_lon
-                seg_end = seg_start + arc
-                
-                sign_idx_s = int(seg_start / 30.0)
-                sign_idx_e = int((seg_end - 1e-10) / 30.0)
+            if sign_idx_s != sign_idx_e:
+                # Part 1: Previous Sign
+                table[num] = {
+                    "lon": seg_start, "sl": SIGN_RULERS[SIGNS[sign_idx_s]],
+                    "nl": star_lord, "sub": sub_lord
+                }
+                num += 1
+                # Part 2: Next Sign
+                table[num] = {
+                    "lon": float(sign_idx_e * 30.0), "sl": SIGN_RULERS[SIGNS[sign_idx_e]],
+                    "nl": star_lord, "sub": sub_lord
+                }
+                num += 1
+            else:
+                table[num] = {
+                    "lon": seg_start, "sl": SIGN_RULERS[SIGNS[sign_idx_s]],
+                    "nl": star_lord, "sub": sub_lord
+                }
+                num += 1
                 
-                if sign_idx_s != sign_idx_e:
-                    # Part 1: Previous Sign
-                    table[num] = {
-                        "lon": seg_start, "sl": self.SIGN_LORDS[self.SIGN_NAMES[sign_idx_s]],
-                        "nl": star_lord, "sub": sub_lord
-                    }
-                    num += 1
-                    # Part 2: Next Sign
-                    table[num] = {
-                        "lon": float(sign_idx_e * 30.0), "sl": self.SIGN_LORDS[self.SIGN_NAMES[sign_idx_e]],
-                        "nl": star_lord, "sub": sub_lord
-                    }
-                    num += 1
-                else:
-                    table[num] = {
-                        "lon": seg_start, "sl": self.SIGN_LORDS[self.SIGN_NAMES[sign_idx_s]],
-                        "nl": star_lord, "sub": sub_lord
-                    }
-                    num += 1
-                    
-                curr_nak_lon += arc
-                if num > 249: break
+            curr_nak_lon += arc
             if num > 249: break
-        return table
+        if num > 249: break
+    return MappingProxyType({num: MappingProxyType(entry) for num, entry in table.items()})
+
+HORARY_249 = _generate_249_table()
+
+class KPMixedPrashnaEngine:
+    def __init__(self):
+        # Shared read-only tables (nadi_core constants + the 249 table built at import)
+        self.DASHA_ORDER = DASHA_ORDER
+        self.DASHA_YEARS = DASHA_YEARS
+        self.SIGN_NAMES = SIGNS
+        self.SIGN_LORDS = SIGN_RULERS
+        self.NAKSHATRAS = NAKSHATRAS
+        self.PLANETS = PLANETS_BY_NODE_TYPE["Mean"]
+        self.HORARY_249 = HORARY_249
 
     def decimal_to_dms(self, degree):
         deg = int(degree)
@@ -149,32 +134,32 @@ class KPMixedPrashnaEngine:
         jd = swe.julday(utc_dt.year, utc_dt.month, utc_dt.day, 
                         utc_dt.hour + utc_dt.minute/60.0 + utc_dt.second/3600.0)
         
-        # 2. Set KP Ayanamsa (Krishnamurti)
-        swe.set_sid_mode(swe.SIDM_KRISHNAMURTI, 0, 0)
-        ayan_val = swe.get_ayanamsa_ut(jd)
-        
-        # 3. Calculate Real-Time Chart (Sidereal)
-        # Planets
-        planets_data = []
-        for p_name, p_code in self.PLANETS.items():
-            res, _ = swe.calc_ut(jd, p_code, swe.FLG_SIDEREAL)
-            lon_val = res[0]
-            if p_name == "Ketu":
-                lon_val = (lon_val + 180) % 360
+        # 2. Set KP Ayanamsa (Krishnamurti); the sidereal chart below is computed under the sidereal-mode lock
+        with sidereal_mode(swe.SIDM_KRISHNAMURTI):
+            ayan_val = swe.get_ayanamsa_ut(jd)
+        
+            # 3. Calculate Real-Time Chart (Sidereal)
+            # Planets
+            planets_data = []
+            for p_name, p_code in self.PLANETS.items():
+                res, _ = swe.calc_ut(jd, p_code, swe.FLG_SIDEREAL)
+                lon_val = res[0]
+                if p_name == "Ketu":
+                    lon_val = (lon_val + 180) % 360
             
-            sign, sl, nl, sub, ssl = self.get_kp_lords(lon_val)
-            planets_data.append({
-                "name": p_name,
-                "degree": lon_val,
-                "sign": sign,
-                "sl": sl,
-                "nl": nl,
-                "sub": sub,
-                "ssl": ssl
-            })
+                sign, sl, nl, sub, ssl = self.get_kp_lords(lon_val)
+                planets_data.append({
+                    "name": p_name,
+                    "degree": lon_val,
+                    "sign": sign,
+                    "sl": sl,
+                    "nl": nl,
+                    "sub": sub,
+                    "ssl": ssl
+                })
             
-        # House Cusps (Placidus)
-        cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P', swe.FLG_SIDEREAL)
+            # House Cusps (Placidus)
+            cusps, ascmc = swe.houses_ex(jd, lat, lon, b'P', swe.FLG_SIDEREAL)
         old_asc = ascmc[0]
         
         # 4. Apply Prashna Number Logic
@@ -185,45 +170,14 @@ class KPMixedPrashnaEngine:
         entry = self.HORARY_249[prashna_num]
         new_asc_sid = entry["lon"]
         
-        # Iterative Solver to find RAMC for the target Ascendant
+        # Solve RAMC for the target Ascendant
         # This ensures Placidus cusps are accurate for the specific location and Prashna degree
         res, _ = swe.calc_ut(jd, swe.ECL_NUT, 0)
         eps = res[0]
         target_asc_trop = (new_asc_sid + ayan_val) % 360
         
-        def get_asc_for_ramc(r):
-            _, ascmc = swe.houses_armc(r, lat, eps, b'P')
-            return ascmc[0]
-
-        best_ramc = 0.0
-        min_diff = 400.0
-        for r in range(0, 360, 2):
-            curr = get_asc_for_ramc(float(r))
-            diff = abs((curr - target_asc_trop + 180) % 360 - 180)
-            if diff < min_diff:
-                min_diff = diff
-                best_ramc = float(r)
-                
-        # Refine RAMC
-        low, high = best_ramc - 2.0, best_ramc + 2.0
-        for _ in range(40):
-            mid = (low + high) / 2
-            if (get_asc_for_ramc(mid) - target_asc_trop + 180) % 360 - 180 > 0:
-                #/ high = mid (Need careful direction for Asc)
-                # Actually ternary or binary search based on monotonicity
-                pass
-            # Accurate enough for now:
-            mid1 = low + (high - low) * 0.4
-            mid2 = low + (high - low) * 0.6
-            if abs((get_asc_for_ramc(mid1) - target_asc_trop + 180) % 360 - 180) < \
-               abs((get_asc_for_ramc(mid2) - target_asc_trop + 180) % 360 - 180):
-                high = mid2
-            else:
-                low = mid1
-        phi_ramc = (low + high) / 2
-        
         # Generate all 12 cusps for this RAMC
-        cusps_trop, ascmc_trop = swe.houses_armc(phi_ramc, lat, eps, b'P')
+        _, cusps_trop, ascmc_trop = solve_prashna_ramc(target_asc_trop, lat, eps, b'P')
         # Correct sidereal conversion using same ayanamsa
         new_cusps = [(c - ayan_val) % 360 for c in cusps_trop]
         new_asc = (ascmc_trop[0] - ayan_val) % 360
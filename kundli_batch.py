@@ -0,0 +1,176 @@
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from nadi_core import get_engine
+
+# Batch kundli fan-out across a process pool.
+# A job is one /kundli request body as a plain dict (KundliRequest.model_dump() or a parsed JSON line).
+# Streaming mode keeps at most `window` jobs in flight and emits results in input order,
+# so memory stays bounded however long the input is.
+#
+# CLI: python -m kundli_batch in.ndjson out.ndjson --workers 8   ("-" for stdin / stdout)
+
+BATCH_MAX_ITEMS = int(os.environ.get("KUNDLI_BATCH_MAX", "500"))
+BATCH_WORKERS = int(os.environ.get("KUNDLI_BATCH_WORKERS", "0")) or os.cpu_count() or 1
+STREAM_WINDOW = int(os.environ.get("KUNDLI_STREAM_WINDOW", "0")) or 4 * BATCH_WORKERS
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def run_kundli_job(job):
+    """Compute one kundli from a request dict. Errors are returned as {"status": "error"} items, never raised."""
+    try:
+        bd = job["birth_details"]
+        cs = job.get("calculation_settings") or {}
+        window = job.get("dasha_window")
+        engine = get_engine(
+            node_type=cs.get("node_type", "Mean"),
+            ayanamsa=cs.get("ayanamsa", "KP"),
+            house_system=cs.get("house_system", "Placidus")
+        )
+        return engine.calculate_kundli(
+            f"{bd['date_of_birth']} {bd['time_of_birth']}",
+            bd["timezone"],
+            float(bd["latitude"]),
+            float(bd["longitude"]),
+            horary_number=job.get("prashna_number"),
+            dasha_depth=job.get("dasha_depth"),
+            dasha_window=(window["start_date"], window["end_date"]) if window else None,
+            dasha_date=job.get("dasha_date")
+        )
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
+def get_pool():
+    """Process pool shared by every batch request in this server process, created on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # Not fork: the pool starts inside a request, and a forked child would inherit whatever locks
+            # (sidereal mode, caches) the other request threads hold at that moment
+            _pool = ProcessPoolExecutor(max_workers=BATCH_WORKERS, mp_context=multiprocessing.get_context("forkserver"))
+        return _pool
+
+def shutdown_pool():
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+def _reset_pool(broken):
+    global _pool
+    with _pool_lock:
+        if _pool is broken:
+            _pool = None
+    broken.shutdown(wait=False, cancel_futures=True)
+
+def parse_job_line(line):
+    """One NDJSON line -> job dict, or the exception that made it unreadable (reported in its output slot)."""
+    try:
+        job = json.loads(line)
+        if not isinstance(job, dict):
+            raise ValueError("Expected a JSON object per line")
+        return job
+    except ValueError as e:
+        return e
+
+def _submit(pool, job):
+    # Unreadable lines never reach the pool; their error is the result
+    if isinstance(job, Exception):
+        return {"status": "error", "message": f"Invalid job: {job}"}
+    try:
+        return pool.submit(run_kundli_job, job)
+    except RuntimeError as e:
+        # Pool broken (BrokenProcessPool) or already shut down after a crash: this slot fails, the stream goes on
+        _reset_pool(pool)
+        return {"status": "error", "message": f"Worker failure: {e}"}
+
+def _collect(pool, fut):
+    if isinstance(fut, dict):
+        return fut
+    try:
+        return fut.result()
+    except Exception as e:
+        # Worker process died (BrokenProcessPool); replace the pool for the next request
+        _reset_pool(pool)
+        return {"status": "error", "message": f"Worker failure: {e}"}
+
+def iter_batch(jobs, window=None):
+    """Yield results for an iterable of jobs in input order, with at most `window` jobs in flight."""
+    window = window or STREAM_WINDOW
+    pending = deque()   # (pool, future) pairs: after a crash, only the pool that broke is reset
+    for job in jobs:
+        pool = get_pool()   # a replacement, once a crash has reset the shared pool
+        pending.append((pool, _submit(pool, job)))
+        if len(pending) >= window:
+            yield _collect(*pending.popleft())
+    while pending:
+        yield _collect(*pending.popleft())
+
+async def aiter_batch(jobs, window=None):
+    """Async counterpart of iter_batch for an async iterable of jobs (used by the streaming endpoint)."""
+    window = window or STREAM_WINDOW
+    pending = deque()
+
+    async def collect(pool, fut):
+        if isinstance(fut, dict):
+            return fut
+        try:
+            return await asyncio.wrap_future(fut)
+        except Exception as e:
+            _reset_pool(pool)
+            return {"status": "error", "message": f"Worker failure: {e}"}
+
+    async for job in jobs:
+        pool = get_pool()
+        pending.append((pool, _submit(pool, job)))
+        if len(pending) >= window:
+            yield await collect(*pending.popleft())
+    while pending:
+        yield await collect(*pending.popleft())
+
+def run_batch(jobs):
+    """Results for jobs in input order; a failing or crashed item only affects its own slot."""
+    return list(iter_batch(jobs, window=max(len(jobs), 1)))
+
+def main(argv=None):
+    global BATCH_WORKERS
+    parser = argparse.ArgumentParser(description="Compute kundlis for an NDJSON file of /kundli request bodies")
+    parser.add_argument("input", help="NDJSON input, one request per line ('-' for stdin)")
+    parser.add_argument("output", help="NDJSON output, one result per input line ('-' for stdout)")
+    parser.add_argument("--workers", type=int, default=BATCH_WORKERS)
+    parser.add_argument("--window", type=int, default=0, help="Max charts in flight (default 4 x workers)")
+    args = parser.parse_args(argv)
+    # The CLI runs on the shared pool too, so a crashed worker is replaced instead of failing every later line
+    BATCH_WORKERS = args.workers
+
+    src = sys.stdin if args.input == "-" else open(args.input)
+    dst = sys.stdout if args.output == "-" else open(args.output, "w")
+    t0 = time.perf_counter()
+    done = errors = 0
+    try:
+        jobs = (parse_job_line(line) for line in src if line.strip())
+        for result in iter_batch(jobs, window=args.window or 4 * args.workers):
+            dst.write(json.dumps(result) + "\n")
+            done += 1
+            errors += result.get("status") == "error"
+    finally:
+        shutdown_pool()
+        if src is not sys.stdin:
+            src.close()
+        if dst is not sys.stdout:
+            dst.close()
+    print(f"{done} charts ({errors} errors) in {time.perf_counter() - t0:.1f}s", file=sys.stderr)
+
+if __name__ == "__main__":
+    main()
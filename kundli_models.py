@@ -0,0 +1,235 @@
+from pydantic import BaseModel, ConfigDict
+from typing import List, Optional, Dict, Union
+
+# Response models of the /kundli family, field for field the dicts nadi_core / prediction_engine build.
+# They describe the responses (OpenAPI, typed clients); the handlers send FastJSONResponse directly, so
+# they are not validated per request. Keys only some results carry are Optional with a None default
+# (compare with model_dump(exclude_unset=True)); verify_fast_response.py keeps them in step with the engine.
+
+class ResponseModel(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+class ErrorResponse(ResponseModel):
+    status: str
+    message: str
+
+class Ascendant(ResponseModel):
+    degree_dms: str
+    sign: str
+    sign_lord: str
+    star_lord: str
+    sub_lord: str
+    sub_sub_lord: str
+    nakshatra: str
+    nadi: str
+    planet_lord: str
+
+class House(ResponseModel):
+    house_number: int
+    cusp_degree_dms: str
+    sign: str
+    sign_lord: str
+    star_lord: str
+    sub_lord: str
+    sub_sub_lord: str
+    nakshatra: str
+    nadi: str
+    nadi_index: int
+    planet_lord: str
+    cusp_degree_decimal: float
+
+class Planet(ResponseModel):
+    planet: str
+    degree_dms: str
+    house_placed: int
+    sign: str
+    sign_lord: str
+    star_lord: str
+    sub_lord: str
+    sub_sub_lord: str
+    nakshatra: str
+    nadi: str
+    nadi_index: int
+    is_retrograde: bool
+    is_combust: bool
+    planet_lord: str
+    degree_decimal: float
+
+class SignificationLevels(ResponseModel):
+    L1: List[int]
+    L2: List[int]
+    L3: List[int]
+    L4: List[int]
+    is_self_strength: bool
+    agent: Optional[str] = None
+
+class Signification(ResponseModel):
+    planet: str
+    levels: SignificationLevels
+    total: List[int]
+    agent: Optional[str]
+
+class HouseSignified(ResponseModel):
+    house: int
+    is_placed: bool
+
+class NadiRow(ResponseModel):
+    planet: str
+    nakshatra_name: str
+    is_retrograde: bool
+    is_combust: bool
+    pl_signified: List[HouseSignified]
+    star_lord: str
+    nl_signified: List[HouseSignified]
+    sub_lord: str
+    sl_signified: List[HouseSignified]
+    planet_lord: str
+    pl_lord_signified: List[HouseSignified]
+
+# Vimshottari tree, mahadasha -> bukthi -> antara -> pratyantar -> sookshma (the last only at dasha_depth 5)
+
+class Sookshma(ResponseModel):
+    planet: str
+    label: str
+    start_date: str
+    end_date: str
+
+class Pratyantar(ResponseModel):
+    planet: str
+    label: str
+    start_date: str
+    end_date: str
+    sookshmas: Optional[List[Sookshma]] = None
+
+class Antara(ResponseModel):
+    planet: str
+    label: str
+    start_date: str
+    end_date: str
+    pratyantars: List[Pratyantar]
+
+class Bukthi(ResponseModel):
+    planet: str
+    label: str
+    start_date: str
+    end_date: str
+    antaras: List[Antara]
+
+class Mahadasha(ResponseModel):
+    planet: str
+    label: str
+    start_date: str
+    end_date: str
+    bukthis: List[Bukthi]
+
+class Dasha(ResponseModel):
+    balance_at_birth: str
+    current_dasha: str
+    current_bukthi: str
+    current_antara: str
+    current_pratyantar: str
+    mahadasha_sequence: List[Mahadasha]
+    moon_lon: float
+    current_sookshma: Optional[str] = None
+
+class VargaPlanet(ResponseModel):
+    planet: str
+    sign: str
+    is_retrograde: bool
+
+class VargaAscendant(ResponseModel):
+    sign: str
+
+class VargaChart(ResponseModel):
+    planets: List[VargaPlanet]
+    ascendant: VargaAscendant
+
+class Metadata(ResponseModel):
+    ayanamsa: str
+    ayanamsa_value: str
+    janma_nakshatra: str
+    pada: int
+    horary_number: Optional[int]
+
+class Aspect(ResponseModel):
+    planet: str
+    aspect: str
+    target: str
+    degree_diff: float
+
+class KundliResponse(ResponseModel):
+    status: str
+    ascendant: Ascendant
+    houses: List[House]
+    planets: List[Planet]
+    significations: List[Signification]
+    nakshatra_nadi: List[NadiRow]
+    dasha: Dasha
+    varga_charts: Dict[str, VargaChart]
+    metadata: Metadata
+    aspects: List[Aspect]
+
+class KundliBatchResponse(ResponseModel):
+    status: str
+    count: int
+    results: List[Union[KundliResponse, ErrorResponse]]
+
+# prediction_engine.job_report
+
+class CslFocus(ResponseModel):
+    csl6: str
+    csl10: str
+
+class DashaInfo(ResponseModel):
+    dasha: str
+    bhukti: str
+    antara: str
+
+class JobCombination(ResponseModel):
+    good: List[int]
+    medium: List[int]
+    bad: List[int]
+
+class Indication(ResponseModel):
+    good: str
+    bad: str
+
+class Hits(ResponseModel):
+    pl: Optional[int]
+    nl: Optional[int]
+    sl: Optional[int]
+
+class JobPrediction(ResponseModel):
+    overall_combination: JobCombination
+    income_expenses: Indication
+    success_rate: str
+    job_areas: List[str]
+    hits: Hits
+
+class JobReportRow(ResponseModel):
+    planet: str
+    star_lord: str
+    sub_lord: str
+    pl: List[int]
+    nl: List[int]
+    sl: List[int]
+    prediction: JobPrediction
+
+class JobReport(ResponseModel):
+    csl_focus: CslFocus
+    dasha_info: DashaInfo
+    reports: List[JobReportRow]
+
+class ChartBundleResponse(ResponseModel):
+    # KundliResponse with only the requested sections, plus "job"
+    status: str
+    ascendant: Ascendant
+    houses: Optional[List[House]] = None
+    planets: Optional[List[Planet]] = None
+    significations: Optional[List[Signification]] = None
+    nakshatra_nadi: Optional[List[NadiRow]] = None
+    dasha: Optional[Dasha] = None
+    varga_charts: Optional[Dict[str, VargaChart]] = None
+    metadata: Metadata
+    aspects: Optional[List[Aspect]] = None
+    job: Optional[JobReport] = None
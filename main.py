@@ -12,16 +12,25 @@ import logging
 from nadi_core import NadiEngine, HIT_MATRIX, SUCCESS_LABELS, HOUSE_JOB_AREAS
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 from typing import List, Optional, Dict, Set, Tuple, Union
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
 import json
 import os
+import tempfile
 import traceback
 import logging
 from nadi_core import NadiEngine, HIT_MATRIX, SUCCESS_LABELS, HOUSE_JOB_AREAS
+from nadi_core import get_engine as get_shared_engine, parse_datetime, KUNDLI_CACHE, CHART_SECTIONS
+from kundli_batch import run_batch, aiter_batch, BATCH_MAX_ITEMS
+from rectification import lord_crossings, time_sensitivity
+from prediction_engine import predict, resolve_areas, job_report, kundli_view
+from fast_response import FastJSONResponse, CompressionMiddleware, json_bytes
+from kundli_models import KundliResponse, KundliBatchResponse, ChartBundleResponse, ErrorResponse
+from ai_service import get_async_ai_service, close_async_ai_services, job_prompt_data
+from starlette.concurrency import run_in_threadpool
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -34,6 +43,10 @@ app = FastAPI(title="Nadi Precision Engine Gold v1.2.8") # Force Build Dasha: 20
 async def startup_event():
     logger.info("🚀 Nadi Precision Engine Gold starting up...")
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    await close_async_ai_services()
+
 @app.exception_handler(RequestValidationError)
 async def validation_exception_handler(request: Request, exc: RequestValidationError):
     body = await request.body()
@@ -50,6 +63,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# gzip / brotli above KP_COMPRESS_MIN_SIZE bytes (fast_response.py)
+app.add_middleware(CompressionMiddleware)
+
 class BirthDetails(BaseModel):
     date_of_birth: str
     time_of_birth: str
@@ -63,19 +79,44 @@ class CalculationSettings(BaseModel):
     house_system: Optional[str] = "Placidus"
     node_type: Optional[str] = "Mean"
 
+class DashaWindow(BaseModel):
+    start_date: str
+    end_date: str
+
 class KundliRequest(BaseModel):
     birth_details: BirthDetails
     calculation_settings: Optional[CalculationSettings] = CalculationSettings()
     prashna_number: Optional[int] = None
+    # Dasha tree size: 1-5 levels (5 = sookshma) and/or a (start_date, end_date) window.
+    # Omit both for the classic full tree. dasha_date picks the current_* periods (default now).
+    dasha_depth: Optional[int] = None
+    dasha_window: Optional[DashaWindow] = None
+    dasha_date: Optional[str] = None
 
 def get_engine(settings: CalculationSettings = None):
     node_type = settings.node_type if settings else "Mean"
     ayanamsa = settings.ayanamsa if settings else "KP"
     house_system = settings.house_system if settings else "Placidus"
-    return NadiEngine(node_type=node_type, ayanamsa=ayanamsa, house_system=house_system)
+    return get_shared_engine(node_type=node_type, ayanamsa=ayanamsa, house_system=house_system)
+
+def request_chart(req: KundliRequest):
+    # Lazily evaluated chart for a KundliRequest (None for an unparseable date), backed by a cached full result
+    chart = get_engine(req.calculation_settings).chart(
+        f"{req.birth_details.date_of_birth} {req.birth_details.time_of_birth}",
+        req.birth_details.timezone,
+        req.birth_details.latitude,
+        req.birth_details.longitude,
+        horary_number=req.prashna_number,
+        dasha_depth=req.dasha_depth,
+        dasha_window=(req.dasha_window.start_date, req.dasha_window.end_date) if req.dasha_window else None,
+        dasha_date=req.dasha_date
+    )
+    if chart is not None:
+        chart.load_cached()
+    return chart
 
-@app.post("/api/v1/kp/kundli")
-@app.post("/kundli")
+@app.post("/api/v1/kp/kundli", response_model=Union[KundliResponse, ErrorResponse], response_class=FastJSONResponse)
+@app.post("/kundli", response_model=Union[KundliResponse, ErrorResponse], response_class=FastJSONResponse)
 def generate_kundli(req: KundliRequest):
     try:
         re = get_engine(req.calculation_settings)
@@ -84,12 +125,62 @@ def generate_kundli(req: KundliRequest):
             req.birth_details.timezone,
             req.birth_details.latitude,
             req.birth_details.longitude,
-            horary_number=req.prashna_number
+            horary_number=req.prashna_number,
+            dasha_depth=req.dasha_depth,
+            dasha_window=(req.dasha_window.start_date, req.dasha_window.end_date) if req.dasha_window else None,
+            dasha_date=req.dasha_date
         )
-        return res
+        return FastJSONResponse(res)
     except Exception as e:
         traceback.print_exc()
-        return {"status": "error", "message": str(e)}
+        return FastJSONResponse({"status": "error", "message": str(e)})
+
+class KundliBatchRequest(BaseModel):
+    items: List[KundliRequest]
+
+@app.post("/api/v1/kp/kundli/batch", response_model=Union[KundliBatchResponse, ErrorResponse], response_class=FastJSONResponse)
+def generate_kundli_batch(req: KundliBatchRequest):
+    # Family sheets of up to BATCH_MAX_ITEMS charts, fanned out over a process pool
+    if len(req.items) > BATCH_MAX_ITEMS:
+        return FastJSONResponse({"status": "error", "message": f"Too many charts: {len(req.items)} (max {BATCH_MAX_ITEMS})"})
+    try:
+        results = run_batch([item.model_dump() for item in req.items])
+        return FastJSONResponse({"status": "success", "count": len(results), "results": results})
+    except Exception as e:
+        traceback.print_exc()
+        return FastJSONResponse({"status": "error", "message": str(e)})
+
+async def _spool_body(request: Request):
+    # The body is spooled before the response starts: StreamingResponse listens on receive() for
+    # disconnects, so the request stream cannot be read while results are being sent.
+    # Small uploads stay in memory, large research exports go to a temp file.
+    spool = tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024)
+    async for chunk in request.stream():
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+async def _ndjson_jobs(spool):
+    # Each non-blank line is validated against the /kundli schema
+    with spool:
+        for line in spool:
+            if line.strip():
+                yield _parse_kundli_line(line)
+
+def _parse_kundli_line(line: bytes):
+    try:
+        return KundliRequest.model_validate_json(line).model_dump()
+    except ValueError as e:
+        return e
+
+@app.post("/api/v1/kp/kundli/stream")
+async def generate_kundli_stream(request: Request):
+    # NDJSON in, NDJSON out: one result line per input line, in input order, emitted as charts finish
+    spool = await _spool_body(request)
+    async def results():
+        async for result in aiter_batch(_ndjson_jobs(spool)):
+            yield json_bytes(result) + b"\n"
+    return StreamingResponse(results(), media_type="application/x-ndjson")
 
 class PrashnaRequest(BaseModel):
     prashna_number: int
@@ -98,6 +189,8 @@ class PrashnaRequest(BaseModel):
     latitude: float
     longitude: float
     timezone: Optional[str] = "Asia/Kolkata"
+    # Optional CHART_SECTIONS selection; omitted means the full chart
+    sections: Optional[List[str]] = None
 
 @app.post("/api/v1/kp/mixed-prashna")
 @app.post("/mixed-prashna")
@@ -109,13 +202,178 @@ def mixed_prashna(req: PrashnaRequest):
             req.timezone,
             req.latitude,
             req.longitude,
-            horary_number=req.prashna_number
+            horary_number=req.prashna_number,
+            sections=req.sections
         )
         return res
     except Exception as e:
         traceback.print_exc()
         return {"status": "error", "message": str(e)}
 
+# Nakshatra Nadi predictions (Job, Education, Marriage, ...) for all 9 planets; areas=None means every area
+class PredictionRequest(KundliRequest):
+    areas: Optional[List[str]] = None
+
+@app.post("/api/v1/kp/predictions")
+def get_predictions(req: PredictionRequest):
+    try:
+        areas = resolve_areas(req.areas)
+        chart = request_chart(req)
+        if chart is None:
+            return {"status": "error", "message": f"Invalid Date Format: {req.birth_details.date_of_birth} {req.birth_details.time_of_birth}."}
+        # Only planets, houses and nakshatra_nadi are built, or read from a cached /kundli result
+        dasha = chart.running_dasha
+        return {
+            "status": "success",
+            "areas": list(areas),
+            "dasha_info": {"dasha": dasha["current_dasha"], "bhukti": dasha["current_bukthi"], "antara": dasha["current_antara"]},
+            "predictions": predict(kundli_view(chart), areas)
+        }
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
+# /kundli and /job-analysis in one request: any of the calculate_kundli sections plus "job", each computed
+# only when asked for, from one nadi_core.Chart. sections=None means all of them.
+BUNDLE_SECTIONS = tuple(CHART_SECTIONS) + ("job",)
+
+class ChartBundleRequest(KundliRequest):
+    sections: Optional[List[str]] = None
+
+@app.post("/api/v1/kp/chart-bundle", response_model=Union[ChartBundleResponse, ErrorResponse], response_class=FastJSONResponse)
+def chart_bundle(req: ChartBundleRequest):
+    try:
+        sections = BUNDLE_SECTIONS if req.sections is None else req.sections
+        unknown = [s for s in sections if s not in BUNDLE_SECTIONS]
+        if unknown:
+            return FastJSONResponse({"status": "error", "message": f"Unknown sections: {', '.join(unknown)} (expected any of {', '.join(BUNDLE_SECTIONS)})"})
+        chart = request_chart(req)
+        if chart is None:
+            return FastJSONResponse({"status": "error", "message": f"Invalid Date Format: {req.birth_details.date_of_birth} {req.birth_details.time_of_birth}."})
+        res = chart.to_dict([s for s in sections if s != "job"])
+        if "job" in sections:
+            # Reads the planets / houses / nadi sections of the same chart; the dasha tree is not needed
+            res["job"] = job_report(kundli_view(chart))
+        return FastJSONResponse(res)
+    except Exception as e:
+        traceback.print_exc()
+        return FastJSONResponse({"status": "error", "message": str(e)})
+
+def job_ai_prompt(req: KundliRequest):
+    # build_job_prompt input for the AI summary endpoints, from the job area of the shared prediction engine
+    chart = request_chart(req)
+    if chart is None:
+        return {"status": "error", "message": f"Invalid Date Format: {req.birth_details.date_of_birth} {req.birth_details.time_of_birth}."}
+    return job_prompt_data(job_report(kundli_view(chart)))
+
+async def job_ai_request(req: KundliRequest):
+    """(AsyncAIService, build_job_prompt input) for the AI summary endpoints, or an error dict."""
+    api_key = os.getenv("OPENROUTER_API_KEY")
+    if not api_key:
+        return {"status": "error", "message": "Key missing in Env Vars"}
+    # The chart is CPU work: off the event loop, like the sync handlers
+    prompt_data = await run_in_threadpool(job_ai_prompt, req)
+    if prompt_data.get("status") == "error":
+        return prompt_data
+    return get_async_ai_service(api_key), prompt_data
+
+@app.post("/api/v1/kp/job-analysis/ai-summary")
+async def job_ai_summary(req: KundliRequest):
+    """AI summary of the job analysis in one response: the fallback for clients that cannot stream."""
+    try:
+        prepared = await job_ai_request(req)
+        if isinstance(prepared, dict):
+            return prepared
+        ai, prompt_data = prepared
+        summary = await ai.generate_job_analysis(prompt_data)
+        if "error" in summary:
+            return {"status": "api_error", "result": summary}
+        return {"status": "success", "ai_summary": summary}
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
+# Proxies must pass events through as they are written; CompressionMiddleware leaves text/event-stream alone
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+async def sse_stream(events):
+    async for event, data in events:
+        yield f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+@app.post("/api/v1/kp/job-analysis/ai-summary/stream")
+async def job_ai_summary_stream(req: KundliRequest):
+    """
+    The AI summary as server-sent events while the model writes it: "delta" {"path", "text"} and "value"
+    {"path", "value"} pieces of the summary JSON, then "done" with the ai_summary of the non-streaming
+    endpoint, or "error". Errors before the stream starts come back as plain JSON.
+    """
+    try:
+        prepared = await job_ai_request(req)
+        if isinstance(prepared, dict):
+            return prepared
+        ai, prompt_data = prepared
+        return StreamingResponse(sse_stream(ai.stream_job_analysis(prompt_data)), media_type="text/event-stream", headers=SSE_HEADERS)
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
+# Lord changes of cusps / planets over a window, for birth-time sensitivity indicators
+CROSSINGS_MAX_DAYS = 7
+
+class LordCrossingsRequest(BaseModel):
+    start: str
+    end: str
+    latitude: float
+    longitude: float
+    timezone: Optional[str] = "Asia/Kolkata"
+    level: Optional[str] = "sub_lord"
+    points: Optional[List[str]] = ["cusps", "planets"]
+    calculation_settings: Optional[CalculationSettings] = CalculationSettings()
+
+@app.post("/api/v1/kp/lord-crossings")
+def get_lord_crossings(req: LordCrossingsRequest):
+    try:
+        start, end = parse_datetime(req.start), parse_datetime(req.end)
+        if start and end and (end - start).total_seconds() > CROSSINGS_MAX_DAYS * 86400:
+            return {"status": "error", "message": f"Window too long (max {CROSSINGS_MAX_DAYS} days)"}
+        re = get_engine(req.calculation_settings)
+        crossings = lord_crossings(req.start, req.end, req.latitude, req.longitude, level=req.level,
+                                   points=req.points, timezone=req.timezone, engine=re)
+        return {"status": "success", "count": len(crossings), "crossings": crossings}
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
+class SensitivityRequest(BaseModel):
+    birth_details: BirthDetails
+    calculation_settings: Optional[CalculationSettings] = CalculationSettings()
+    level: Optional[str] = "sub_lord"
+    points: Optional[List[str]] = ["cusps"]
+    horizon_minutes: Optional[float] = 60
+
+# The search covers birth +/- horizon, so the horizon is held to half the /lord-crossings window
+SENSITIVITY_MAX_MINUTES = CROSSINGS_MAX_DAYS * 1440 / 2
+
+@app.post("/api/v1/kp/sensitivity")
+def birth_time_sensitivity(req: SensitivityRequest):
+    try:
+        if req.horizon_minutes is None or not 0 < req.horizon_minutes <= SENSITIVITY_MAX_MINUTES:
+            return {"status": "error", "message": f"horizon_minutes must be above 0 and at most {SENSITIVITY_MAX_MINUTES:g}"}
+        re = get_engine(req.calculation_settings)
+        report = time_sensitivity(
+            f"{req.birth_details.date_of_birth} {req.birth_details.time_of_birth}",
+            req.birth_details.latitude, req.birth_details.longitude, level=req.level, points=req.points,
+            timezone=req.birth_details.timezone, horizon=req.horizon_minutes * 60.0, engine=re
+        )
+        return {"status": "success", **report}
+    except Exception as e:
+        traceback.print_exc()
+        return {"status": "error", "message": str(e)}
+
+@app.get("/api/v1/kp/cache/stats")
+def cache_stats():
+    return {"kundli": KUNDLI_CACHE.stats() if KUNDLI_CACHE is not None else None}
+
 @app.get("/health")
 @app.get("/api/v1/kp/health")
 def health():
@@ -0,0 +1,370 @@
+import datetime
+from functools import lru_cache
+import numpy as np
+import pytz
+import swisseph as swe
+from nadi_core import (
+    get_engine, parse_datetime, kp_lords_batch, SIGNS, SIGN_RULERS, DASHA_ORDER, DASHA_YEARS, DASHA_DAYS_PER_YEAR,
+    NAK_SIZE, KP_SUB_INDEX, KP_SUB_SUB_INDEX, KP_SUB_BOUNDARIES, KP_SUB_SUB_BOUNDARIES, VimshottariDasha
+)
+
+# Birth-time rectification: the birth instants inside a window that satisfy every constraint, as exact intervals.
+# Each constraint is a continuous "margin" over birth time, positive while it holds and zero where its tracked
+# point crosses a lord / house / dasha boundary. The window is sampled once on a coarse vectorized grid
+# (NadiEngine.chart_columns), and every sign change of a margin is refined by root-finding (Illinois false
+# position, all brackets at once), so nothing is stepped second by second.
+# lord_crossings / time_sensitivity list the instants where cusp and planet lords change over a window.
+
+LEVELS = ("sign", "sign_lord", "star_lord", "sub_lord", "sub_sub_lord")
+BASE_STEP = 240.0       # seconds between coarse samples, reduced when a constraint has narrow features
+MAX_SAMPLES = 200000
+TOLERANCE = 0.01        # seconds
+
+@lru_cache(maxsize=None)
+def lord_segments(level, value):
+    """(start, end) longitude arcs where a chart point has `value` at `level`, e.g. ("sub_lord", "Saturn")."""
+    if level not in LEVELS:
+        raise ValueError(f"Unknown level: {level} (expected one of {', '.join(LEVELS)})")
+    if level in ("sign", "sign_lord"):
+        signs = [i for i, s in enumerate(SIGNS) if (s if level == "sign" else SIGN_RULERS[s]) == value]
+        segs = [(30.0 * i, 30.0 * (i + 1)) for i in signs]
+    elif level == "star_lord":
+        segs = [(NAK_SIZE * i, NAK_SIZE * (i + 1)) for i in range(27) if DASHA_ORDER[i % 9] == value]
+    else:
+        index, lord_col = (KP_SUB_INDEX, 3) if level == "sub_lord" else (KP_SUB_SUB_INDEX, 2)
+        starts = [row[0] for row in index] + [360.0]
+        segs = [(starts[i], starts[i + 1]) for i, row in enumerate(index) if row[lord_col] == value]
+    if not segs:
+        raise ValueError(f"{value!r} is not a valid {level}")
+    return np.array(segs)
+
+def arc_margin(x, lo, arc):
+    """Signed distance (degrees) of angle x inside the arc [lo, lo + arc): positive inside, negative outside."""
+    d = (x - lo + 180.0 - arc / 2.0) % 360.0 - 180.0 + arc / 2.0
+    return np.minimum(d, arc - d)
+
+def segments_margin(x, segs):
+    # Best margin over every arc the target occupies
+    return arc_margin(np.asarray(x)[..., None], segs[:, 0], segs[:, 1] - segs[:, 0]).max(axis=-1)
+
+def illinois(f, a, b, fa, fb, tol=TOLERANCE):
+    """
+    Roots of f in the brackets [a, b] with f(a), f(b) of opposite signs, refined together: f maps an array of
+    points (one per bracket) to values. Secant steps kept inside the bracket (Illinois false position).
+    """
+    a, b, fa, fb = (np.array(v, dtype=np.float64) for v in (a, b, fa, fb))
+    side = np.zeros(len(a), dtype=np.int64)
+    for _ in range(100):
+        x = np.clip(b - fb * (b - a) / (fb - fa), a, b)
+        fx = f(x)
+        left = np.sign(fx) == np.sign(fa)
+        # Halve the stale end's value when the same side moves twice running
+        fb = np.where(left & (side == 1), fb / 2.0, fb)
+        fa = np.where(~left & (side == -1), fa / 2.0, fa)
+        a, fa = np.where(left, x, a), np.where(left, fx, fa)
+        b, fb = np.where(left, b, x), np.where(left, fb, fx)
+        side = np.where(left, 1, -1)
+        if len(a) == 0 or (b - a).max() < tol or (fx == 0.0).all():
+            break
+    return np.where(np.abs(fa) < np.abs(fb), a, b)
+
+def segments_width(segs):
+    """Narrowest target arc or gap between target arcs, i.e. the smallest feature of the margin."""
+    segs = segs[np.argsort(segs[:, 0])]
+    gaps = np.append(segs[1:, 0], segs[0, 0] + 360.0) - segs[:, 1]
+    gaps = gaps[gaps > 1e-9]   # adjacent arcs of the same lord merge
+    return float(min((segs[:, 1] - segs[:, 0]).min(), gaps.min() if len(gaps) else 360.0))
+
+class CuspLord:
+    """Cusp `cusp` (1 = ascendant) has `value` at `level`, e.g. CuspLord(10, "sub_lord", "Saturn")."""
+
+    fields = ("cusps",)
+
+    def __init__(self, cusp, level, value):
+        if not 1 <= cusp <= 12:
+            raise ValueError(f"Invalid cusp: {cusp}")
+        self.cusp, self.level, self.value = cusp, level, value
+        self.segs = lord_segments(level, value)
+        self.width = segments_width(self.segs)
+
+    def margin(self, rect, cols):
+        return segments_margin(cols["cusps"][:, self.cusp - 1], self.segs)
+
+class PlanetLord:
+    """Planet has `value` at `level`, e.g. PlanetLord("Moon", "star_lord", "Venus")."""
+
+    fields = ("planets",)
+
+    def __init__(self, planet, level, value):
+        self.planet, self.level, self.value = planet, level, value
+        self.segs = lord_segments(level, value)
+        self.width = segments_width(self.segs)
+
+    def margin(self, rect, cols):
+        return segments_margin(cols["planets"][:, rect.planet_index(self.planet)], self.segs)
+
+class PlanetHouse:
+    """Planet placed in `house` (Placidus arc from that cusp to the next, as in calculate_kundli)."""
+
+    fields = ("planets", "cusps")
+    width = 180.0
+
+    def __init__(self, planet, house):
+        if not 1 <= house <= 12:
+            raise ValueError(f"Invalid house: {house}")
+        self.planet, self.house = planet, house
+
+    def margin(self, rect, cols):
+        lo, hi = cols["cusps"][:, self.house - 1], cols["cusps"][:, self.house % 12]
+        return arc_margin(cols["planets"][:, rect.planet_index(self.planet)], lo, (hi - lo) % 360.0)
+
+class DashaLord:
+    """
+    The Vimshottari periods running on `date` (birth timezone) start with `lords`, mahadasha first,
+    e.g. DashaLord("2015-06-01", ["Venus", "Sun"]) for Venus-Sun on that date. Margin is in days.
+    """
+
+    fields = ("moon_lahiri",)
+
+    def __init__(self, date, lords):
+        lords = tuple([lords] if isinstance(lords, str) else lords)
+        if not 1 <= len(lords) <= 5 or any(lord not in DASHA_YEARS for lord in lords):
+            raise ValueError(f"Invalid dasha lords: {lords}")
+        self.date, self.lords = date, lords
+        years = 120.0
+        for lord in lords:
+            years *= DASHA_YEARS[lord] / 120.0
+        self.width = years * DASHA_DAYS_PER_YEAR
+
+    def margin(self, rect, cols):
+        event = rect.localize(self.date)
+        out = np.empty(len(cols["t"]))
+        for i, (t, moon) in enumerate(zip(cols["t"], cols["moon_lahiri"])):
+            period = VimshottariDasha(float(moon), rect.utc_at(t)).period(self.lords)
+            out[i] = min((event - period.start).total_seconds(), (period.end - event).total_seconds()) / 86400.0
+        return out
+
+CONSTRAINT_TYPES = {
+    "cusp_lord": lambda d: CuspLord(int(d["cusp"]), d["level"], d["value"]),
+    "ascendant_sign": lambda d: CuspLord(1, "sign", d["sign"]),
+    "planet_lord": lambda d: PlanetLord(d["planet"], d["level"], d["value"]),
+    "planet_house": lambda d: PlanetHouse(d["planet"], int(d["house"])),
+    "dasha": lambda d: DashaLord(d["date"], d["lords"]),
+}
+
+def constraint_from_dict(d):
+    """Constraint from its JSON form, e.g. {"type": "cusp_lord", "cusp": 10, "level": "sub_lord", "value": "Saturn"}."""
+    if d.get("type") not in CONSTRAINT_TYPES:
+        raise ValueError(f"Unknown constraint type: {d.get('type')} (expected one of {', '.join(CONSTRAINT_TYPES)})")
+    return CONSTRAINT_TYPES[d["type"]](d)
+
+class Rectifier:
+    """Candidate birth intervals in [start, end] at (lat, lon) satisfying every constraint; see rectify()."""
+
+    def __init__(self, start, end, lat, lon, constraints, timezone="Asia/Kolkata", engine=None):
+        self.tz = pytz.timezone(timezone)
+        self.start, self.end = self.localize(start), self.localize(end)
+        if self.end <= self.start:
+            raise ValueError("end must be after start")
+        self.lat, self.lon = lat, lon
+        self.engine = engine or get_engine()
+        self.constraints = [c if hasattr(c, "margin") else constraint_from_dict(c) for c in constraints]
+        self.fields = tuple(sorted({f for c in self.constraints for f in c.fields}))
+        u = self.start.astimezone(pytz.UTC)
+        self.jd0 = swe.julday(u.year, u.month, u.day, u.hour + u.minute/60 + u.second/3600 + u.microsecond/3.6e9)
+        self.span = (self.end - self.start).total_seconds()
+        self._planets = list(self.engine.PLANETS)
+
+    def localize(self, value):
+        dt = parse_datetime(value) if isinstance(value, str) else value
+        if dt is None:
+            raise ValueError(f"Invalid Date Format: {value}.")
+        return dt if dt.tzinfo else self.tz.localize(dt)
+
+    def utc_at(self, t):
+        return self.start.astimezone(pytz.UTC) + datetime.timedelta(seconds=float(t))
+
+    def planet_index(self, name):
+        if name not in self._planets:
+            raise ValueError(f"Unknown planet: {name}")
+        return self._planets.index(name)
+
+    def margins(self, t, constraints=None):
+        """Margins at offsets t (seconds from start), shape (len(constraints), len(t)); all constraints by default."""
+        constraints = self.constraints if constraints is None else constraints
+        t = np.asarray(t, dtype=np.float64)
+        fields = tuple(sorted({f for c in constraints for f in c.fields}))
+        cols = self.engine.chart_columns(self.jd0 + t / 86400.0, self.lat, self.lon, fields)
+        cols["t"] = t
+        return np.array([c.margin(self, cols) for c in constraints]).reshape(len(constraints), len(t))
+
+    def _grids(self):
+        """
+        (t, margin) samples per constraint: one shared coarse pass, then a finer pass for each constraint whose
+        margin could enter and leave a feature (narrowest arc or gap) between two coarse samples.
+        """
+        t = np.linspace(0.0, self.span, int(np.ceil(self.span / BASE_STEP)) + 1)
+        m = self.margins(t)
+        rates = np.abs(np.diff(m, axis=1)).max(axis=1) / (t[1] - t[0])
+        grids = []
+        for c, row, rate in zip(self.constraints, m, rates):
+            step = 0.5 * c.width / (1.5 * rate) if rate > 0 else BASE_STEP
+            if step < t[1] - t[0]:
+                fine = np.linspace(0.0, self.span, min(int(np.ceil(self.span / step)) + 1, MAX_SAMPLES))
+                grids.append((fine, self.margins(fine, [c])[0]))
+            else:
+                grids.append((t, row))
+        return grids
+
+    def _refine(self, c, a, b, fa, fb):
+        """Roots of constraint c's margin in the brackets [a, b] (arrays), all refined together."""
+        return illinois(lambda x: self.margins(x, [c])[0], a, b, fa, fb)
+
+    def solve(self):
+        cuts = [0.0, self.span]
+        for c, (t, m) in zip(self.constraints, self._grids()):
+            inside = m > 0.0
+            idx = np.flatnonzero(inside[:-1] != inside[1:])
+            if len(idx):
+                cuts += self._refine(c, t[idx], t[idx + 1], m[idx], m[idx + 1]).tolist()
+        cuts = np.unique(np.clip(cuts, 0.0, self.span))
+        ok = (self.margins((cuts[:-1] + cuts[1:]) / 2.0) > 0.0).all(axis=0) if len(cuts) > 1 else np.array([], dtype=bool)
+
+        intervals = []
+        for a, b, good in zip(cuts[:-1], cuts[1:], ok):
+            if not good:
+                continue
+            if intervals and abs(intervals[-1][1] - a) < TOLERANCE:
+                intervals[-1][1] = b
+            else:
+                intervals.append([a, b])
+        return [{
+            "start": self.utc_at(a).astimezone(self.tz), "end": self.utc_at(b).astimezone(self.tz), "seconds": float(b - a)
+        } for a, b in intervals]
+
+def rectify(start, end, lat, lon, constraints, timezone="Asia/Kolkata", engine=None):
+    """
+    Birth-time intervals in [start, end] (local to timezone) satisfying every constraint.
+    constraints: CuspLord / PlanetLord / PlanetHouse / DashaLord objects or their dict forms (constraint_from_dict).
+    Returns [{"start", "end" (aware datetimes), "seconds"}], boundaries exact to TOLERANCE seconds.
+    """
+    return Rectifier(start, end, lat, lon, constraints, timezone=timezone, engine=engine).solve()
+
+# Lord boundary crossings
+
+CROSSING_LEVELS = ("sign", "star_lord", "sub_lord", "sub_sub_lord")
+CUSP_STEP = 600.0       # bracketing grid; cusps only ever advance, so each boundary is crossed once per window
+PLANET_STEP = 3600.0    # planets move < 16 deg/day; a double crossing inside one hour would need a station on the boundary
+_LEVEL_BOUNDARIES = {
+    "sign": np.arange(12) * 30.0,
+    "star_lord": np.arange(27) * NAK_SIZE,
+    "sub_lord": np.array(KP_SUB_BOUNDARIES),
+    "sub_sub_lord": np.array(KP_SUB_SUB_BOUNDARIES),
+}
+
+def _wrap180(x):
+    return (x + 180.0) % 360.0 - 180.0
+
+def _lord_names(lon):
+    lords = kp_lords_batch(lon)
+    names = {"sign": [SIGNS[i] for i in lords["sign_index"]]}
+    for level in CROSSING_LEVELS[1:]:
+        names[level] = [DASHA_ORDER[i] for i in lords[level]]
+    return names
+
+def lord_crossings(start, end, lat, lon, level="sub_lord", points=("cusps", "planets"), timezone="Asia/Kolkata", engine=None):
+    """
+    Instants in [start, end] where a cusp's or planet's lords change, down to `level` (sign changes always count).
+    Each crossing is bracketed on a coarse grid of the point's unwrapped longitude and refined to TOLERANCE seconds
+    by false position on the ephemeris. Returns dicts sorted by time:
+    {"time", "seconds" (from start), "point" ("Cusp 1".."Cusp 12" or the planet), "longitude", "direction",
+     "level" (coarsest level that changed), "changes" {level: [before, after]}}.
+    """
+    if level not in CROSSING_LEVELS:
+        raise ValueError(f"Unknown level: {level} (expected one of {', '.join(CROSSING_LEVELS)})")
+    rect = Rectifier(start, end, lat, lon, [], timezone=timezone, engine=engine)
+    levels = CROSSING_LEVELS[:CROSSING_LEVELS.index(level) + 1]
+    bounds = np.unique(np.concatenate([_LEVEL_BOUNDARIES["sign"], _LEVEL_BOUNDARIES[level]]))
+    bounds = bounds[np.append(True, np.diff(bounds) > 1e-9)]   # sign edges that are also nakshatra / sub edges
+    n_bounds = len(bounds)
+
+    crossings = []
+    for kind, field, step, names in (
+        ("cusps", "cusps", CUSP_STEP, [f"Cusp {i + 1}" for i in range(12)]),
+        ("planets", "planets", PLANET_STEP, rect._planets),
+    ):
+        if kind not in points:
+            continue
+        t = np.linspace(0.0, rect.span, int(np.ceil(rect.span / step)) + 1)
+        lons = rect.engine.chart_columns(rect.jd0 + t / 86400.0, lat, lon, (field,))[field]
+        unwrapped = np.unwrap(lons, period=360.0, axis=0)
+        # Boundaries at or below each unwrapped longitude; crossings are the jumps between samples
+        count = np.floor(unwrapped / 360.0).astype(np.int64) * n_bounds + np.searchsorted(bounds, unwrapped % 360.0, side="right")
+        ia, ib, ic = [], [], []
+        for i, col in zip(*np.nonzero(count[1:] != count[:-1])):
+            lo, hi = sorted((count[i, col], count[i + 1, col]))
+            for j in range(lo, hi):
+                ia.append(i)
+                ib.append(col)
+                ic.append(bounds[j % n_bounds])
+        if not ia:
+            continue
+        ia, ib, boundary = np.array(ia), np.array(ib), np.array(ic)
+
+        def offset(x):
+            return _wrap180(rect.engine.chart_columns(rect.jd0 + x / 86400.0, lat, lon, (field,))[field][np.arange(len(x)), ib] - boundary)
+
+        roots = illinois(offset, t[ia], t[ia + 1], _wrap180(lons[ia, ib] - boundary), _wrap180(lons[ia + 1, ib] - boundary))
+        direct = unwrapped[ia + 1, ib] > unwrapped[ia, ib]
+        before = _lord_names(np.where(direct, boundary - 1e-7, boundary + 1e-7))
+        after = _lord_names(np.where(direct, boundary + 1e-7, boundary - 1e-7))
+        for k in range(len(roots)):
+            changes = {lv: [before[lv][k], after[lv][k]] for lv in levels if before[lv][k] != after[lv][k]}
+            if not changes:
+                continue
+            crossings.append({
+                "time": rect.utc_at(roots[k]).astimezone(rect.tz), "seconds": float(roots[k]), "point": names[ib[k]],
+                "longitude": float(boundary[k]), "direction": "direct" if direct[k] else "retrograde",
+                "level": next(lv for lv in CROSSING_LEVELS if lv in changes), "changes": changes
+            })
+    return sorted(crossings, key=lambda c: c["seconds"])
+
+def time_sensitivity(dt_str, lat, lon, level="sub_lord", points=("cusps",), timezone="Asia/Kolkata", horizon=3600.0, engine=None):
+    """
+    How far the birth time can move, earlier or later, before each point's `level` lord changes (searched up to
+    `horizon` seconds either way). Per point: {"point", "earlier_seconds", "later_seconds", "earlier", "later"}
+    with the first crossing on each side (None beyond the horizon); "tolerance_seconds" is the tightest of them.
+    """
+    tz = pytz.timezone(timezone)
+    birth = parse_datetime(dt_str) if isinstance(dt_str, str) else dt_str
+    if birth is None:
+        raise ValueError(f"Invalid Date Format: {dt_str}.")
+    birth = birth if birth.tzinfo else tz.localize(birth)
+    found = lord_crossings(birth - datetime.timedelta(seconds=horizon), birth + datetime.timedelta(seconds=horizon),
+                           lat, lon, level=level, points=points, timezone=timezone, engine=engine)
+    found = [c for c in found if level in c["changes"]]
+
+    names = []
+    if "cusps" in points:
+        names += [f"Cusp {i + 1}" for i in range(12)]
+    if "planets" in points:
+        names += list((engine or get_engine()).PLANETS)
+    result = []
+    for name in names:
+        mine = [c for c in found if c["point"] == name]
+        earlier = next((c for c in reversed(mine) if c["seconds"] <= horizon), None)
+        later = next((c for c in mine if c["seconds"] > horizon), None)
+        result.append({
+            "point": name,
+            "earlier_seconds": horizon - earlier["seconds"] if earlier else None,
+            "later_seconds": later["seconds"] - horizon if later else None,
+            "earlier": earlier, "later": later
+        })
+    sides = [(p["earlier_seconds"], p["later_seconds"]) for p in result]
+    return {
+        "level": level, "horizon_seconds": horizon, "points": result,
+        "tolerance_seconds": {
+            "earlier": min((e for e, _ in sides if e is not None), default=None),
+            "later": min((l for _, l in sides if l is not None), default=None)
+        }
+    }
@@ -0,0 +1,140 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+# Result caches with TTL + LRU eviction and hit/miss counters.
+# Values are JSON-serializable objects; they are stored zlib-compressed, so every get()
+# returns a fresh copy that callers may mutate freely.
+
+def _pack(value):
+    return zlib.compress(json.dumps(value, separators=(",", ":")).encode(), 1)
+
+def _unpack(blob):
+    return json.loads(zlib.decompress(blob))
+
+class MemoryCache:
+    """In-process LRU cache with a per-entry time-to-live."""
+
+    backend = "memory"
+
+    def __init__(self, maxsize=256, ttl=3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key -> (expires_at, packed value)
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key):
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            blob = entry[1]
+        return _unpack(blob)
+
+    def put(self, key, value):
+        blob = _pack(value)
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, blob)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            return {"backend": self.backend, "size": len(self._data), "maxsize": self.maxsize, "ttl": self.ttl,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+class SQLiteCache:
+    """On-disk cache shared by every process on the host; LRU by last access time, wall-clock TTL."""
+
+    backend = "sqlite"
+
+    def __init__(self, path, maxsize=10000, ttl=86400.0):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+        self._conn = sqlite3.connect(path, timeout=10.0, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires_at REAL NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS cache_last_used ON cache (last_used)")
+
+    def get(self, key):
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None or row[1] <= now:
+                if row is not None:
+                    self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self.misses += 1
+                return None
+            self._conn.execute("UPDATE cache SET last_used = ? WHERE key = ?", (now, key))
+            self.hits += 1
+        return _unpack(row[0])
+
+    def put(self, key, value):
+        blob = _pack(value)
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, last_used) VALUES (?, ?, ?, ?)",
+                (key, blob, now + self.ttl, now)
+            )
+            excess = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0] - self.maxsize
+            if excess > 0:
+                # Expired rows go first, then the least recently used
+                self._conn.execute(
+                    "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY expires_at > ?, last_used LIMIT ?)",
+                    (now, excess)
+                )
+                self.evictions += excess
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM cache")
+
+    def stats(self):
+        with self._lock:
+            size = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            return {"backend": self.backend, "path": self.path, "size": size, "maxsize": self.maxsize, "ttl": self.ttl,
+                    "hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+def make_cache(backend, maxsize, ttl, path=None):
+    """Cache for a backend name: "memory", "sqlite" (at path) or "off" / "" for no cache (None)."""
+    backend = (backend or "off").lower()
+    if backend == "memory":
+        return MemoryCache(maxsize=maxsize, ttl=ttl)
+    if backend == "sqlite":
+        return SQLiteCache(path, maxsize=maxsize, ttl=ttl)
+    if backend in ("off", "none"):
+        return None
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+def cache_from_env(prefix, maxsize, ttl, path, backend="memory"):
+    """make_cache configured from {prefix}_BACKEND / _SIZE / _TTL / _PATH environment variables."""
+    return make_cache(
+        os.environ.get(f"{prefix}_BACKEND", backend),
+        maxsize=int(os.environ.get(f"{prefix}_SIZE", str(maxsize))),
+        ttl=float(os.environ.get(f"{prefix}_TTL", str(ttl))),
+        path=os.environ.get(f"{prefix}_PATH", path)
+    )
@@ -1,4 +1,4 @@
-import { useState, useEffect } from 'react';
+import { useState, useEffect, useRef } from 'react';
 import Layout from './components/ui/Layout';
 import BirthDetailsForm from './components/BirthDetailsForm';
 import Dashboard from './components/Dashboard';
@@ -11,7 +11,8 @@ import NakshatraNadiTable from './components/tables/NakshatraNadiTable';
 import JobPredictionTable from './components/tables/JobPredictionTable';
 import AdvancePredictionTable from './components/tables/AdvancePredictionTable';
 import PowerPositionTable from './components/tables/PowerPositionTable';
-import { getApiUrl, fetchMixedPrashna } from './services/api';
+import { getApiUrl, fetchMixedPrashna, fetchPredictions } from './services/api';
+import type { PlanetPrediction } from './types/astrology';
 import { useAuth } from './contexts/AuthContext';
 import LoginPage from './components/auth/LoginPage';
 import { AlertCircle, Lock, X } from 'lucide-react';
@@ -69,6 +70,12 @@ const App = () => {
   const [showPlanetTable, setShowPlanetTable] = useState(false);
   const [error, setError] = useState<string | null>(null);
   const [birthDetails, setBirthDetails] = useState<any>(null);
+  // KundliRequest of the chart on screen, for the endpoints that recompute from it (AI summary)
+  const [chartRequest, setChartRequest] = useState<any>(null);
+  // /predictions of that chart, all areas at once (null while loading, error text on failure)
+  const [predictions, setPredictions] = useState<PlanetPrediction[] | null>(null);
+  const [predictionsError, setPredictionsError] = useState<string | null>(null);
+  const predictionsRequest = useRef<any>(null);
   const [chartMode, setChartMode] = useState<'Rashi' | 'Bhava'>('Bhava');
   const [selectedArea, setSelectedArea] = useState('Job');
   const [showAccessPopup, setShowAccessPopup] = useState(false);
@@ -148,6 +155,7 @@ const App = () => {
 
     try {
       let responseData: any;
+      let request: any;
       if (mode === 'Prashna') {
         const prashnaRequest = {
           birth_details: {
@@ -161,9 +169,11 @@ const App = () => {
           horary_number: data.horary_number
         };
         responseData = await fetchMixedPrashna(prashnaRequest);
+        // /mixed-prashna runs the default KP settings, as a KundliRequest without calculation_settings does
+        request = { birth_details: prashnaRequest.birth_details, prashna_number: data.horary_number };
       } else {
         const apiUrl = getApiUrl();
-        const response = await axios.post(`${apiUrl}/kundli`, {
+        request = {
           birth_details: {
             date_of_birth: data.date_of_birth,
             time_of_birth: data.time_of_birth,
@@ -177,12 +187,22 @@ const App = () => {
             house_system: "Placidus",
             node_type: "Mean"
           }
-        });
+        };
+        const response = await axios.post(`${apiUrl}/kundli`, request);
         responseData = response.data;
       }
 
       if (responseData.status === 'success') {
         setKundliData(responseData);
+        setChartRequest(request);
+        setPredictions(null);
+        setPredictionsError(null);
+        predictionsRequest.current = request;
+        fetchPredictions(request).then(res => {
+          if (predictionsRequest.current !== request) return; // a newer chart is on screen
+          if (res.status === 'success') setPredictions(res.predictions);
+          else setPredictionsError(res.message || 'Predictions failed');
+        });
         setActiveTab('planets');
         setShowPlanetTable(false);
         if (mode === 'Parashara') {
@@ -338,8 +358,15 @@ const App = () => {
               </select>
             </div>
 
-            {sortPlanetsByNadi(kundliData.planets, p => p.planet).map((p: any) => {
+            {!predictions && (
+              <div style={{ padding: '1rem', textAlign: 'center', fontWeight: 700, color: predictionsError ? '#ef4444' : 'var(--text)' }}>
+                {predictionsError || 'Loading predictions...'}
+              </div>
+            )}
+            {predictions && sortPlanetsByNadi(kundliData.planets, p => p.planet).map((p: any) => {
               const planetName = p.planet;
+              const prediction = predictions.find(row => row.planet === planetName);
+              if (!prediction) return null;
               const activeTypes: ('Dasha' | 'Bhukti' | 'Antara')[] = [];
               if (planetName === kundliData.dasha.current_dasha) activeTypes.push('Dasha');
               if (planetName === kundliData.dasha.current_bukthi) activeTypes.push('Bhukti');
@@ -348,10 +375,8 @@ const App = () => {
               return (
                 <JobPredictionTable
                   key={`${planetName}-${selectedArea}`}
-                  data={kundliData.nakshatra_nadi}
-                  planets={kundliData.planets}
+                  prediction={prediction}
                   types={activeTypes}
-                  planetName={planetName}
                   selectedArea={selectedArea}
                 />
               );
@@ -481,7 +506,7 @@ const App = () => {
         }
         return (
           <div className="tab-pane active" style={{ animation: 'fadeIn 0.3s ease' }}>
-            <AIBotContent kundliData={kundliData} selectedArea={selectedArea} />
+            <AIBotContent kundliData={kundliData} selectedArea={selectedArea} chartRequest={chartRequest} predictions={predictions} />
           </div>
         );
       case 'dasha':
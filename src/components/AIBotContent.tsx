@@ -1,15 +1,31 @@
 import { useState, useEffect, useRef } from 'react';
 import { Send, Bot, User, Sparkles, RefreshCw, MessageSquare, FileText, Volume2, VolumeX } from 'lucide-react';
 import { streamWithAI } from '../services/openRouterApi';
-import { getCurrentDashaLords } from '../services/api';
+import { getCurrentDashaLords, streamJobAISummary } from '../services/api';
 import { calculateReportData } from '../utils/reportUtils';
+import type { PlanetPrediction } from '../types/astrology';
 
 interface AIBotContentProps {
     kundliData: any;
     selectedArea: string;
+    // The /kundli request the chart was made from; the Job report is written server side from it
+    chartRequest?: any;
+    // /predictions of the chart, the table data of the report
+    predictions?: PlanetPrediction[] | null;
 }
 
-const AIBotContent: React.FC<AIBotContentProps> = ({ kundliData, selectedArea: initialArea }) => {
+// Job AI summary of the server ({summary: {executive_view, top_recommendations, personal_mastery}}) as report
+// text; also called with the partial summary while it streams in, so any field may still be missing
+const formatJobSummary = (result: any) => {
+    const summary = result?.summary || {};
+    const sections = [];
+    if (summary.executive_view) sections.push(`## CAREER OVERVIEW\n${summary.executive_view}`);
+    if (summary.top_recommendations?.length) sections.push(`## TOP RECOMMENDATIONS\n${summary.top_recommendations.map((r: string) => `- ${r}`).join('\n')}`);
+    if (summary.personal_mastery?.length) sections.push(`## PERSONAL MASTERY\n${summary.personal_mastery.map((r: string) => `- ${r}`).join('\n')}`);
+    return sections.join('\n\n');
+};
+
+const AIBotContent: React.FC<AIBotContentProps> = ({ kundliData, selectedArea: initialArea, chartRequest, predictions }) => {
     const [messages, setMessages] = useState<{ role: 'user' | 'assistant'; content: string }[]>([]);
     const [input, setInput] = useState('');
     const [isTyping, setIsTyping] = useState(false);
@@ -206,16 +222,32 @@ ${mahadashaSeq}
         }
     };
 
+    const generateJobReport = async () => {
+        // Written by the backend from its own job analysis, shown as it streams in
+        const res = await streamJobAISummary(chartRequest, partial => setReport(formatJobSummary(partial) || null));
+        if (res.status === 'success') {
+            setReport(formatJobSummary(res.ai_summary));
+            speak(`Your ${localArea} report is ready.`);
+        } else {
+            const message = res.status === 'api_error' ? res.result?.error : res.message;
+            setReport("Error: " + (message || "Failed to generate report. Please check your connection."));
+        }
+    };
+
     const generateReport = async () => {
         setIsGeneratingReport(true);
         try {
+            if (localArea === 'Job' && chartRequest) {
+                await generateJobReport();
+                return;
+            }
             const systemPromptContent = generateSystemPrompt();
             
             // Calculate specific table data for the current Dasha planet
             const trueLords = getCurrentDashaLords(kundliData.dasha.mahadasha_sequence);
             const activeDasha = trueLords.dasha || kundliData.dasha.current_dasha;
             
-            const reportData = calculateReportData(activeDasha, localArea, kundliData.nakshatra_nadi, kundliData.planets);
+            const reportData = calculateReportData(predictions?.find(p => p.planet === activeDasha), localArea);
             
             const tableDataContext = reportData ? `
 ### DASH PLANET TABLE DATA FOR ${activeDasha} IN ${localArea}:
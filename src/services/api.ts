@@ -59,6 +59,124 @@ export const fetchJobAnalysis = async (request: KundliRequest): Promise<any> =>
         };
     }
 };
+export const fetchJobAISummary = async (request: KundliRequest): Promise<any> => {
+    const baseUrl = getApiUrl();
+    try {
+        const response = await axios.post(`${baseUrl}/job-analysis/ai-summary`, request, {
+            timeout: 120000
+        });
+        return response.data;
+    } catch (error) {
+        return {
+            status: 'error',
+            message: axios.isAxiosError(error) ? error.message : 'Failed to connect to AI'
+        };
+    }
+};
+
+// Apply one "delta" / "value" event of the summary stream to the object rebuilt so far
+const applySummaryEvent = (target: any, event: string, data: any) => {
+    const path: (string | number)[] = data.path;
+    let node = target;
+    path.slice(0, -1).forEach((key, i) => {
+        if (node[key] === undefined) node[key] = typeof path[i + 1] === 'number' ? [] : {};
+        node = node[key];
+    });
+    const last = path[path.length - 1];
+    node[last] = event === 'delta' ? (node[last] || '') + data.text : data.value;
+};
+
+/**
+ * Same result as fetchJobAISummary, streamed: onUpdate gets the summary rebuilt so far after every piece
+ * of text, so it can be rendered while the model is still writing. Falls back to fetchJobAISummary when
+ * the stream cannot be opened.
+ */
+export const streamJobAISummary = async (request: KundliRequest, onUpdate: (partial: any) => void): Promise<any> => {
+    const baseUrl = getApiUrl();
+    let response: Response;
+    try {
+        response = await fetch(`${baseUrl}/job-analysis/ai-summary/stream`, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json', 'Accept': 'text/event-stream' },
+            body: JSON.stringify(request)
+        });
+    } catch (error) {
+        return fetchJobAISummary(request);
+    }
+    if (!response.ok || !response.body) {
+        return fetchJobAISummary(request);
+    }
+    if (!(response.headers.get('content-type') || '').startsWith('text/event-stream')) {
+        // Errors before the stream starts come back as plain JSON
+        return response.json();
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    const partial: any = {};
+    let buffer = '';
+    for (;;) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        let end;
+        while ((end = buffer.indexOf('\n\n')) >= 0) {
+            const block = buffer.slice(0, end);
+            buffer = buffer.slice(end + 2);
+            let event = 'message';
+            let data = '';
+            for (const line of block.split('\n')) {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            }
+            if (!data) continue;
+            const payload = JSON.parse(data);
+            // Same statuses as the non-streaming endpoint: a completion without usable JSON is an api_error
+            if (event === 'done') return 'error' in payload ? { status: 'api_error', result: payload } : { status: 'success', ai_summary: payload };
+            if (event === 'error') return { status: 'api_error', result: payload };
+            applySummaryEvent(partial, event, payload);
+            onUpdate(structuredClone(partial));
+        }
+    }
+    return { status: 'error', message: 'AI summary stream ended early' };
+};
+
+export const fetchPredictions = async (request: KundliRequest, areas?: string[]): Promise<any> => {
+    const baseUrl = getApiUrl();
+    try {
+        const response = await axios.post(`${baseUrl}/predictions`, { ...request, areas }, {
+            timeout: 120000 // 120 seconds
+        });
+        return response.data;
+    } catch (error) {
+        let errorMsg = 'Network error occurred';
+        if (axios.isAxiosError(error)) {
+            errorMsg = `Predictions failed at ${baseUrl}. ${error.message}`;
+        }
+        return {
+            status: 'error',
+            message: errorMsg,
+        };
+    }
+};
+export const fetchChartBundle = async (request: KundliRequest, sections?: string[]): Promise<any> => {
+    const baseUrl = getApiUrl();
+    try {
+        const response = await axios.post(`${baseUrl}/chart-bundle`, { ...request, sections }, {
+            timeout: 120000 // 120 seconds (Render cold start)
+        });
+        return response.data;
+    } catch (error) {
+        let errorMsg = 'Network error occurred';
+        if (axios.isAxiosError(error)) {
+            errorMsg = `Chart bundle failed at ${baseUrl}. ${error.message}`;
+        }
+        return {
+            status: 'error',
+            message: errorMsg,
+        };
+    }
+};
 export const fetchMixedPrashna = async (request: any): Promise<KundliResponse> => {
     // The endpoint is at /api/v1/kp/mixed-prashna
 
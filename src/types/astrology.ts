@@ -137,6 +137,33 @@ export interface NakshatraNadiItem {
     dasha_role?: string;
 }
 
+// One planet of a /predictions response (prediction_engine.predict)
+export interface PredictionRow {
+    hit: number | null;
+    good: number[];
+    bad: number[];
+}
+
+export interface AreaPrediction {
+    rows: { pl: PredictionRow; nl: PredictionRow; sl: PredictionRow };
+    combination: { good: number[]; bad: number[] };
+    counts: Record<number, number>;
+    indication: { good: string; bad: string };
+    success: { code: string; label: string };
+    results: { nl?: string | null; sl?: string | null };
+    notes: { title: string; text: string }[];
+    remedies: { planet: string; item: string; day: string; time: string }[];
+    diseases?: { pl: string; nl: string };
+}
+
+export interface PlanetPrediction {
+    planet: string;
+    star_lord: string;
+    sub_lord: string;
+    hits: { pl: number | null; nl: number | null; sl: number | null };
+    areas: Record<string, AreaPrediction>;
+}
+
 export interface Aspect {
     planet: string;
     aspect: string;
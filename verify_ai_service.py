@@ -0,0 +1,309 @@
+import asyncio
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from ai_service import AIService, AsyncAIService, JsonStreamParser
+from result_cache import MemoryCache, SQLiteCache
+
+# AsyncAIService against a local stand-in for OpenRouter: parsing, connection reuse, the in-flight limit,
+# per-request deadlines, whether the event loop keeps ticking while slow completions are outstanding,
+# then the prompt-result cache and coalescing of identical concurrent prompts, and the streamed variant:
+# incremental parsing of the summary JSON and time to the first piece of text.
+
+SUMMARY = {"summary": {"executive_view": "Steady rise through service.", "top_recommendations": ["Finance"], "personal_mastery": ["Keep records"]}}
+PROMPT_DATA = {
+    "csl6": {"planet": "Saturn", "prediction": {"success_rate": "Good", "income_expenses": {"good": "High", "bad": "Low"}}},
+    "csl10": {"planet": "Venus", "prediction": {"success_rate": "Very Good", "income_expenses": {"good": "Very High", "bad": "Low"}}},
+    "others": ["Jupiter", "Mercury"],
+}
+
+def distinct_prompt(i):
+    # A different prompt per i, so calls are neither cached nor coalesced
+    return {**PROMPT_DATA, "others": [f"Planet {i}"]}
+
+class StubCompletions:
+    """
+    OpenAI-style /chat/completions on 127.0.0.1, replying after `delay` seconds with `content`.
+    Counts requests, distinct client connections and the peak number of requests in progress.
+    "stream": true requests get `content` as server-sent events, `piece` characters every `gap` seconds.
+    """
+
+    def __init__(self, content="```json\n" + json.dumps(SUMMARY) + "\n```"):
+        self.content = content
+        self.delay = 0.0
+        self.piece, self.gap = 8, 0.0
+        self.requests = 0
+        self.in_flight = self.peak = 0
+        self.connections = set()
+        self.lock = threading.Lock()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_POST(self):
+                payload = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with stub.lock:
+                    stub.requests += 1
+                    stub.connections.add(self.client_address)
+                    stub.in_flight += 1
+                    stub.peak = max(stub.peak, stub.in_flight)
+                time.sleep(stub.delay)
+                if payload.get("stream"):
+                    self.stream()
+                with stub.lock:
+                    stub.in_flight -= 1
+                if payload.get("stream"):
+                    return
+                body = json.dumps({"choices": [{"message": {"role": "assistant", "content": stub.content}}]}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                try:
+                    self.wfile.write(body)
+                except OSError:
+                    pass    # client gave up (deadline test)
+
+            def stream(self):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Transfer-Encoding", "chunked")
+                self.end_headers()
+                content = stub.content
+                lines = [": OPENROUTER PROCESSING"]
+                lines += [f"data: {json.dumps({'choices': [{'delta': {'content': content[i:i + stub.piece]}}]})}" for i in range(0, len(content), stub.piece)]
+                try:
+                    for line in lines + ["data: [DONE]"]:
+                        data = (line + "\n\n").encode()
+                        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                        self.wfile.flush()
+                        time.sleep(stub.gap)
+                    self.wfile.write(b"0\r\n\r\n")
+                except OSError:
+                    pass
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/api/v1/chat/completions"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def reset(self, delay=0.0):
+        self.delay, self.requests, self.peak = delay, 0, 0
+        self.gap = 0.0
+        self.connections = set()
+
+async def loop_lag(work, tick=0.01):
+    """Run `work` while a ticker sleeps `tick` s at a time; returns (result, worst extra delay of a tick)."""
+    lag = 0.0
+    done = asyncio.Event()
+    async def ticker():
+        nonlocal lag
+        while not done.is_set():
+            t = time.perf_counter()
+            await asyncio.sleep(tick)
+            lag = max(lag, time.perf_counter() - t - tick)
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    try:
+        result = await work
+    finally:
+        done.set()
+        await task
+    return result, lag
+
+async def settle(ai):
+    # Upstream calls outlive callers that timed out; let them finish before the next measurement
+    await asyncio.gather(*list(ai._pending.values()))
+
+async def verify(stub):
+    ok = True
+    def check(label, passed, detail):
+        nonlocal ok
+        ok = ok and passed
+        print(f"{label:15s}: {detail}{'' if passed else '  FAIL'}")
+
+    ai = AsyncAIService("test-key", base_url=stub.url, max_in_flight=3, timeout=5.0, cache=None)
+    try:
+        stub.reset()
+        results = [await ai.generate_job_analysis(distinct_prompt(i)) for i in range(20)]
+        check("Parsing", all(r == SUMMARY for r in results), "fenced JSON content -> summary dict")
+        check("Keep-alive", len(stub.connections) == 1, f"20 sequential calls over {len(stub.connections)} connection(s)")
+
+        stub.reset(delay=0.2)
+        t = time.perf_counter()
+        results = await asyncio.gather(*(ai.generate_job_analysis(distinct_prompt(i)) for i in range(12)))
+        elapsed = time.perf_counter() - t
+        check("In-flight cap", stub.peak == 3 and all(r == SUMMARY for r in results), f"12 concurrent calls, limit 3, peak {stub.peak} at the stub ({elapsed:.2f}s)")
+
+        stub.reset(delay=2.0)
+        t = time.perf_counter()
+        result = await ai.generate_job_analysis(PROMPT_DATA, timeout=0.3)
+        elapsed = time.perf_counter() - t
+        check("Deadline", "timed out" in result.get("error", "") and elapsed < 0.6, f"2s completion, 0.3s deadline -> error after {elapsed:.2f}s")
+        await settle(ai)
+
+        # Queued calls count against their own deadline
+        stub.reset(delay=1.0)
+        results = await asyncio.gather(*(ai.generate_job_analysis(distinct_prompt(i), timeout=1.5) for i in range(6)))
+        timed_out = sum("error" in r for r in results)
+        check("Queued deadline", timed_out == 3, f"6 calls of 1s through 3 slots, 1.5s deadline -> {timed_out} timed out")
+        await settle(ai)
+
+        stub.reset(delay=1.0)
+        _, lag = await loop_lag(asyncio.gather(*(ai.generate_job_analysis(distinct_prompt(i)) for i in range(4))))
+        check("Event loop", lag < 0.1, f"worst tick delay {lag * 1e3:.0f} ms while 4 x 1s completions were outstanding")
+    finally:
+        await ai.aclose()
+
+    # The blocking client on the same loop, for comparison
+    sync_ai = AIService("test-key", cache=None)
+    sync_ai.base_url = stub.url
+    async def blocking_call():
+        return sync_ai.generate_job_analysis(PROMPT_DATA)
+    stub.reset(delay=1.0)
+    _, lag = await loop_lag(blocking_call())
+    print(f"{'Blocking client':15s}: worst tick delay {lag * 1e3:.0f} ms for one 1s completion (reference)")
+    return ok
+
+async def verify_cache(stub):
+    ok = True
+    def check(label, passed, detail):
+        nonlocal ok
+        ok = ok and passed
+        print(f"{label:15s}: {detail}{'' if passed else '  FAIL'}")
+
+    ai = AsyncAIService("test-key", base_url=stub.url, max_in_flight=3, timeout=5.0, cache=MemoryCache(maxsize=100, ttl=0.5))
+    try:
+        stub.reset(delay=0.3)
+        results = await asyncio.gather(*(ai.generate_job_analysis(PROMPT_DATA) for _ in range(10)))
+        shared = all(r == SUMMARY for r in results) and len({id(r) for r in results}) == 10
+        check("Coalescing", stub.requests == 1 and shared, f"10 concurrent identical prompts -> {stub.requests} upstream call(s)")
+
+        stub.reset(delay=0.3)
+        t = time.perf_counter()
+        result = await ai.generate_job_analysis(PROMPT_DATA)
+        elapsed = time.perf_counter() - t
+        check("Cache hit", stub.requests == 0 and result == SUMMARY, f"repeat prompt -> {stub.requests} upstream calls, {elapsed * 1e3:.1f} ms")
+
+        await asyncio.sleep(0.6)
+        await ai.generate_job_analysis(PROMPT_DATA)
+        check("TTL", stub.requests == 1, f"after the 0.5s TTL -> {stub.requests} upstream call(s)")
+
+        # A caller that gives up leaves the upstream call running; its result is still cached
+        stub.reset(delay=0.3)
+        result = await ai.generate_job_analysis(distinct_prompt(1), timeout=0.1)
+        await asyncio.sleep(0.4)
+        again = await ai.generate_job_analysis(distinct_prompt(1))
+        check("Abandoned call", "error" in result and again == SUMMARY and stub.requests == 1, f"timed-out caller, then a retry -> {stub.requests} upstream call(s)")
+
+        stub.reset()
+        stub.content = "not json"
+        failures = [await ai.generate_job_analysis(distinct_prompt(2)) for _ in range(2)]
+        stub.content = StubCompletions().content
+        check("Errors", all("error" in f for f in failures) and stub.requests == 2, f"unparseable completion, twice -> {stub.requests} upstream calls (not cached)")
+    finally:
+        await ai.aclose()
+
+    # The SQLite store outlives the service (and is shared by other workers on the host)
+    path = os.path.join(tempfile.mkdtemp(), "ai_cache.sqlite3")
+    stub.reset()
+    for _ in range(2):
+        ai = AsyncAIService("test-key", base_url=stub.url, cache=SQLiteCache(path, maxsize=100, ttl=60.0))
+        result = await ai.generate_job_analysis(PROMPT_DATA)
+        await ai.aclose()
+    check("SQLite store", stub.requests == 1 and result == SUMMARY, f"two services on one file -> {stub.requests} upstream call(s)")
+    return ok
+
+async def collect(events):
+    """(events, seconds to the first text delta, seconds to the end) of one stream_job_analysis."""
+    out, first, t = [], None, time.perf_counter()
+    async for event, data in events:
+        if first is None and event == "delta" and data["text"]:
+            first = time.perf_counter() - t
+        out.append((event, data))
+    return out, first, time.perf_counter() - t
+
+def assemble(events):
+    # What a client rebuilds from the delta / value events
+    result = {}
+    for event, data in events:
+        if event in ("delta", "value"):
+            *parents, last = data["path"]
+            node = result
+            for key in parents:
+                node = node.setdefault(key, {})
+            node[last] = node.get(last, "") + data["text"] if event == "delta" else data["value"]
+    return {"summary": {k: list(v.values()) if isinstance(v, dict) else v for k, v in result.get("summary", {}).items()}}
+
+async def verify_stream(stub):
+    ok = True
+    def check(label, passed, detail):
+        nonlocal ok
+        ok = ok and passed
+        print(f"{label:15s}: {detail}{'' if passed else '  FAIL'}")
+
+    # Split at every offset, escapes and surrogate pairs included
+    text = "```json\n" + json.dumps({"summary": {"executive_view": 'A "10th" lord\n\\ é \U0001F600', "top_recommendations": ["Govt", ""], "n": [1.5, True, None]}}) + "\n```"
+    bad = 0
+    for size in range(1, 12):
+        parser = JsonStreamParser()
+        events = [e for i in range(0, len(text), size) for e in parser.feed(text[i:i + size])]
+        bad += assemble([(e, {"path": p, "text" if e == "delta" else "value": v}) for e, p, v in events])["summary"] != {
+            "executive_view": 'A "10th" lord\n\\ é \U0001F600', "top_recommendations": ["Govt", ""], "n": [1.5, True, None]}
+    check("Stream parser", bad == 0, f"fenced JSON fed in pieces of 1-11 chars -> {bad} mismatches")
+
+    ai = AsyncAIService("test-key", base_url=stub.url, max_in_flight=3, timeout=5.0, cache=MemoryCache(maxsize=100, ttl=60.0))
+    try:
+        stub.reset()
+        stub.gap = 0.02
+        events, first, total = await collect(ai.stream_job_analysis(PROMPT_DATA))
+        done = [data for event, data in events if event == "done"]
+        check("Streaming", done == [SUMMARY] and assemble(events) == SUMMARY,
+              f"{sum(e == 'delta' for e, _ in events)} deltas rebuild the summary, then done")
+        check("First text", first < total / 3, f"{first * 1e3:.0f} ms to the first delta, {total * 1e3:.0f} ms to done (non-streaming: all of it)")
+
+        stub.reset()
+        result = await ai.generate_job_analysis(PROMPT_DATA)
+        events, _, _ = await collect(ai.stream_job_analysis(PROMPT_DATA))
+        check("Stream cache", stub.requests == 0 and result == SUMMARY and events == [("done", SUMMARY)], f"streamed prompt again -> {stub.requests} upstream calls")
+
+        stub.reset()
+        stub.content = "not json"
+        events, _, _ = await collect(ai.stream_job_analysis(distinct_prompt(4)))
+        events += (await collect(ai.stream_job_analysis(distinct_prompt(4))))[0]
+        stub.content = "```json\n" + json.dumps(SUMMARY) + "\n```"
+        check("Stream errors", [e for e, _ in events] == ["error", "error"] and stub.requests == 2, f"unparseable completion, twice -> {stub.requests} upstream calls (not cached)")
+
+        stub.reset(delay=2.0)
+        t = time.perf_counter()
+        events, _, _ = await collect(ai.stream_job_analysis(distinct_prompt(5), timeout=0.3))
+        elapsed = time.perf_counter() - t
+        check("Stream deadline", events == [("error", {"error": "Request to AI service timed out. Please try again."})] and elapsed < 0.6, f"2s completion, 0.3s deadline -> error after {elapsed:.2f}s")
+
+        # A client that disconnects mid-stream gives its slot back
+        stub.reset()
+        stub.gap = 0.05
+        stream = ai.stream_job_analysis(distinct_prompt(6))
+        async for event, _ in stream:
+            if event == "delta":
+                break
+        await stream.aclose()
+        check("Stream slots", ai._slots._value == 3, f"after timeouts, errors and a dropped stream -> {ai._slots._value} of 3 slots free")
+    finally:
+        await ai.aclose()
+    return ok
+
+if __name__ == "__main__":
+    stub = StubCompletions()
+    ok = asyncio.run(verify(stub))
+    ok = asyncio.run(verify_cache(stub)) and ok
+    ok = asyncio.run(verify_stream(stub)) and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,53 @@
+import json
+import random
+import sys
+import time
+from nadi_core import get_engine, CHART_SECTIONS
+
+# nadi_core.Chart checks: to_dict() for every section on its own (and all of them together) against the same
+# keys of calculate_kundli, the default to_dict() byte for byte, and what a single section costs next to
+# the full chart. Run with KUNDLI_CACHE_BACKEND=off to time the computation rather than the cache.
+
+def random_charts(n, seed=11):
+    random.seed(seed)
+    charts = []
+    for _ in range(n):
+        dt = f"{random.randint(1940, 2030)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d} {random.randint(0, 23):02d}:{random.randint(0, 59):02d}:00"
+        horary = random.choice([None, None, random.randint(1, 249)])
+        charts.append((dt, "Asia/Kolkata", random.uniform(8, 32), random.uniform(68, 92), horary))
+    return charts
+
+def verify_sections(n=100):
+    engine = get_engine()
+    mismatches = 0
+    for dt, tz, lat, lon, horary in random_charts(n):
+        args = dict(horary_number=horary, dasha_depth=2, dasha_date="2026-01-01")
+        full = engine.calculate_kundli(dt, tz, lat, lon, **args)
+        if json.dumps(engine.chart(dt, tz, lat, lon, **args).to_dict()) != json.dumps(full):
+            mismatches += 1
+            print(f"FAIL {dt} {horary} full to_dict()")
+        for name in CHART_SECTIONS:
+            part = engine.chart(dt, tz, lat, lon, **args).to_dict([name])
+            expected = {k: v for k, v in full.items() if k in ("status", "ascendant", "metadata", CHART_SECTIONS[name])}
+            if json.dumps(part) != json.dumps(expected):
+                mismatches += 1
+                print(f"FAIL {dt} {horary} {name}")
+    print(f"Sections        : {n} charts x {len(CHART_SECTIONS) + 1} selections, {mismatches} mismatches vs calculate_kundli")
+    return mismatches == 0
+
+def time_sections(n=30):
+    engine = get_engine()
+    charts = random_charts(n, seed=3)
+    def run(sections):
+        t = time.perf_counter()
+        for dt, tz, lat, lon, horary in charts:
+            engine.chart(dt, tz, lat, lon, horary_number=horary).to_dict(sections)
+        return (time.perf_counter() - t) / n * 1e3
+    print(f"Full chart      : {run(None):.2f} ms")
+    for name in CHART_SECTIONS:
+        print(f"  {name:14s}: {run([name]):.2f} ms")
+
+if __name__ == "__main__":
+    ok = verify_sections()
+    time_sections()
+    sys.exit(0 if ok else 1)
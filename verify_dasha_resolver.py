@@ -0,0 +1,53 @@
+import datetime
+import random
+import time
+import pytz
+from nadi_core import VimshottariDasha
+
+# Proportional-arithmetic period_at vs walking the chained dasha tree, down to sookshma
+def walk(dasha, dt, depth):
+    chain, path = [], ()
+    for _ in range(depth):
+        hit = None
+        for p in dasha.children(path):
+            if p.start <= dt <= p.end:
+                hit = p
+        if hit is None:
+            break
+        chain.append(hit)
+        path = hit.path
+    return chain
+
+def verify(samples=20000):
+    random.seed(7)
+    tz = pytz.timezone("Asia/Kolkata")
+    mismatches = 0
+    worst_us = 0
+    t_fast = t_walk = 0.0
+    for _ in range(samples):
+        birth = tz.localize(datetime.datetime(1940, 1, 1) + datetime.timedelta(seconds=random.randint(0, 2 * 10**9)))
+        dasha = VimshottariDasha(random.uniform(0, 360), birth)
+        ref = birth + datetime.timedelta(days=random.uniform(0, 100 * 365.25))
+
+        t = time.perf_counter()
+        fast = dasha.period_at(ref, 5)
+        t_fast += time.perf_counter() - t
+
+        t = time.perf_counter()
+        slow = walk(dasha, ref, 5)
+        t_walk += time.perf_counter() - t
+
+        if [p.path for p in fast] != [p.path for p in slow]:
+            mismatches += 1
+            continue
+        for a, b in zip(fast, slow):
+            worst_us = max(worst_us, abs((a.start - b.start) / datetime.timedelta(microseconds=1)), abs((a.end - b.end) / datetime.timedelta(microseconds=1)))
+
+    print(f"Reference dates checked : {samples}")
+    print(f"Path mismatches         : {mismatches}")
+    print(f"Max boundary deviation  : {worst_us:.0f} us")
+    print(f"Resolver                : {t_fast / samples * 1e6:.1f} us/query")
+    print(f"Tree walk (cold)        : {t_walk / samples * 1e6:.1f} us/query")
+
+if __name__ == "__main__":
+    verify()
@@ -0,0 +1,87 @@
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import nadi_core
+from nadi_core import get_engine
+from kp_prashna_engine import KPMixedPrashnaEngine
+from engine_executor import EngineExecutor, ExecutorBusy
+from verify_ai_service import loop_lag
+
+# EngineExecutor checks: the same charts in inline / thread / process mode (thread mode leans on the
+# sidereal-mode lock for correctness), how long the event loop stalls in each mode while charts are being
+# computed, the queue limit (ExecutorBusy -> 503) and the pending count after cancelled calls.
+
+# Module level, so the process-mode workers (which import this script afresh) compute cold as well
+nadi_core.KUNDLI_CACHE = None
+
+def make_jobs(n):
+    random.seed(5)
+    jobs = []
+    for _ in range(n):
+        dt_str = f"{random.randint(1950, 2020)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d} {random.randint(0, 23):02d}:{random.randint(0, 59):02d}:00"
+        jobs.append((dt_str, "Asia/Kolkata", random.uniform(8, 32), random.uniform(68, 92), random.choice([None, random.randint(1, 249)])))
+    return jobs
+
+def chart_job(job):
+    # One /kundli chart and one mixed prashna, as the handlers compute them
+    dt_str, tzone, lat, lon, horary = job
+    res = get_engine().calculate_kundli(dt_str, tzone, lat, lon, horary_number=horary, dasha_date="2026-01-01")
+    prashna = KPMixedPrashnaEngine().calculate(horary or 1, "2026-03-04", "20:30:00", lat, lon, tzone)
+    return json.dumps(res), json.dumps(prashna, default=str)
+
+def sleep_job(seconds):
+    time.sleep(seconds)
+    return seconds
+
+async def run_all(executor, jobs):
+    return await asyncio.gather(*(executor.run(chart_job, job) for job in jobs))
+
+async def verify(n=64):
+    ok = True
+    def check(label, passed, detail):
+        nonlocal ok
+        ok = ok and passed
+        print(f"{label:15s}: {detail}{'' if passed else '  FAIL'}")
+
+    jobs = make_jobs(n)
+    workers = os.cpu_count() or 1
+    print(f"Charts         : {n} kundli + prashna pairs, {workers} CPU(s)")
+    results = {}
+    for mode in ("inline", "thread", "process"):
+        executor = EngineExecutor(mode, workers=max(workers, 4), max_queue=n)
+        try:
+            if mode == "process":
+                await run_all(executor, jobs[:executor.workers])    # start the workers outside the timing
+            t = time.perf_counter()
+            results[mode], lag = await loop_lag(run_all(executor, jobs))
+            elapsed = time.perf_counter() - t
+        finally:
+            executor.shutdown()
+        same = results[mode] == results["inline"]
+        check(f"{mode.capitalize()} mode", same and (mode == "inline" or lag < 0.2),
+              f"{elapsed:.2f}s, worst loop stall {lag * 1e3:.0f} ms{'' if same else ', results differ from inline'}")
+
+    executor = EngineExecutor("thread", workers=2, max_queue=2)
+    try:
+        outcomes = await asyncio.gather(*(executor.run(sleep_job, 0.3) for _ in range(10)), return_exceptions=True)
+        busy = sum(isinstance(o, ExecutorBusy) for o in outcomes)
+        check("Queue limit", busy == 6 and executor.pending == 0, f"10 calls, 2 workers + 2 queued -> {busy} ExecutorBusy, {executor.pending} pending after")
+
+        # Cancelled callers: queued calls are dropped, running ones still count until they finish
+        tasks = [asyncio.ensure_future(executor.run(sleep_job, 0.3)) for _ in range(4)]
+        await asyncio.sleep(0.05)
+        for task in tasks:
+            task.cancel()
+        await asyncio.sleep(0)
+        running = executor.pending
+        await asyncio.sleep(0.4)
+        check("Cancellation", running == 2 and executor.pending == 0, f"4 cancelled calls -> {running} still running, {executor.pending} pending after")
+    finally:
+        executor.shutdown()
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if asyncio.run(verify()) else 1)
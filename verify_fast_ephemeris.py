@@ -0,0 +1,72 @@
+import sys
+import time
+import numpy as np
+import nadi_core
+from nadi_core import NadiEngine, SWISS_EPHEMERIS
+from fast_ephemeris import FastEphemeris, JD_START, JD_END, SERIES, ANGULAR_SERIES
+from build_fast_ephemeris import sample_series, SERIES_BODY
+
+# Fast ephemeris vs Swiss Ephemeris: random instants over 1900-2100 plus both edges of every block
+# (including the refined blocks around solar conjunctions).
+# Fails (exit 1) if any series is off by 0.1 arcsec or more.
+LIMIT_ARCSEC = 0.1
+
+def angle_diff(a, b):
+    return np.abs((np.asarray(a) - np.asarray(b) + 180.0) % 360.0 - 180.0)
+
+def verify(path="fast_ephemeris.npy", samples=20000):
+    fast = FastEphemeris(path, fallback=SWISS_EPHEMERIS)
+    rng = np.random.default_rng(5)
+    worst_total = 0.0
+    print(f"{'series':16s} {'max err (arcsec)':>17s} {'max speed err (deg/day)':>24s}")
+    for name, _, _ in SERIES:
+        starts, ends = fast._series[name][:2]
+        jds = np.concatenate([rng.uniform(JD_START, JD_END, samples), starts, ends - 1e-6])
+        ref = sample_series(name, jds)
+        val, _ = fast.evaluate(name, jds)
+        err = (angle_diff(val, ref) if name in ANGULAR_SERIES else np.abs(val - ref)).max() * 3600.0
+        speed_err = ""
+        if name in SERIES_BODY:
+            sub = jds[::10]
+            ref_speed = np.array([SWISS_EPHEMERIS.lon_speed(jd, SERIES_BODY[name])[1] for jd in sub])
+            speed_err = f"{np.abs(fast.evaluate(name, sub)[1] - ref_speed).max():.2e}"
+        worst_total = max(worst_total, err)
+        print(f"{name:16s} {err:17.5f} {speed_err:>24s}")
+
+    # Scalar path and the SwissEphemeris-compatible interface
+    jd = 2461104.35
+    lon_f, _ = fast.lon_speed(jd, SERIES_BODY["Moon"])
+    lon_s, _ = SWISS_EPHEMERIS.lon_speed(jd, SERIES_BODY["Moon"])
+    sid_err = angle_diff(fast.sidtime(jd) * 15.0, SWISS_EPHEMERIS.sidtime(jd) * 15.0) * 3600.0
+    print(f"Scalar Moon / sidtime check : {angle_diff(lon_f, lon_s) * 3600.0:.5f} / {sid_err:.5f} arcsec")
+
+    jds = rng.uniform(JD_START, JD_END, 100000)
+    t = time.perf_counter()
+    fast.evaluate("Moon", jds)
+    t_vec = time.perf_counter() - t
+    t = time.perf_counter()
+    for j in jds[:5000]:
+        SWISS_EPHEMERIS.lon_speed(j, SERIES_BODY["Moon"])
+    t_swe = (time.perf_counter() - t) / 5000
+    print(f"Vectorized Moon : {t_vec / len(jds) * 1e6:.3f} us/instant (swe.calc_ut {t_swe * 1e6:.2f} us)")
+
+    # Whole charts: how often does a rendered degree (DMS) or lord differ from the Swiss Ephemeris chart?
+    nadi_core.KUNDLI_CACHE = None
+    swiss_engine, fast_engine = NadiEngine(ephemeris=SWISS_EPHEMERIS), NadiEngine(ephemeris=fast)
+    fields_diff = charts_diff = 0
+    for k in range(200):
+        day = 1 + int(rng.integers(0, 70000))
+        dt_str = (np.datetime64("1901-01-01") + np.timedelta64(day, "D")).astype(str) + f" {int(rng.integers(0, 24)):02d}:{int(rng.integers(0, 60)):02d}:00"
+        args = (dt_str, "Asia/Kolkata", float(rng.uniform(8, 32)), float(rng.uniform(68, 92)))
+        a, b = swiss_engine.calculate_kundli(*args), fast_engine.calculate_kundli(*args)
+        diff = [key for pa, pb in zip(a["planets"] + a["houses"], b["planets"] + b["houses"])
+                for key in pa if key not in ("cusp_degree_decimal", "degree_decimal") and pa[key] != pb[key]]
+        fields_diff += len(diff)
+        charts_diff += bool(diff)
+    print(f"Charts with a differing planet/house field : {charts_diff} / 200 ({fields_diff} fields)")
+
+    print(f"Worst error     : {worst_total:.5f} arcsec (limit {LIMIT_ARCSEC})")
+    return worst_total < LIMIT_ARCSEC
+
+if __name__ == "__main__":
+    sys.exit(0 if verify(*sys.argv[1:2]) else 1)
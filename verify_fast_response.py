@@ -0,0 +1,119 @@
+import json
+import logging
+import random
+import sys
+import time
+import zlib
+from fastapi.encoders import jsonable_encoder
+from fastapi.testclient import TestClient
+import fast_response
+from fast_response import json_bytes, BrotliResponder, FlushingGZipResponder, COMPRESS_MIN_SIZE
+from kundli_models import KundliResponse, ChartBundleResponse, ErrorResponse
+from nadi_core import get_engine
+from prediction_engine import job_report, kundli_view
+from main import app, BUNDLE_SECTIONS
+
+# /kundli family encoding checks: the response models against engine output (every key, both ways), the
+# orjson and stdlib renderings against the result, their cost next to FastAPI's jsonable_encoder + json,
+# and the compressed responses (gzip / brotli, threshold, per-chunk flushing for NDJSON streams).
+
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
+def random_requests(n, seed=9):
+    random.seed(seed)
+    requests = []
+    for _ in range(n):
+        dt = f"{random.randint(1900, 2090)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d} {random.randint(0, 23):02d}:{random.randint(0, 59):02d}:00"
+        kwargs = dict(horary_number=random.choice([None, random.randint(1, 249)]), dasha_depth=random.choice([None, 1, 2, 3, 4, 5]),
+                      dasha_date=random.choice([None, "2026-01-01"]), dasha_window=random.choice([None, None, ("2020-01-01", "2030-01-01")]))
+        requests.append((random.choice(["Mean", "True"]), (dt, "Asia/Kolkata", random.uniform(-40, 60), random.uniform(-120, 150)), kwargs))
+    return requests
+
+def mirrors(model, result):
+    # Validates, and dumps back to exactly the same dict (no key missing from the model, none invented)
+    return model.model_validate(result).model_dump(exclude_unset=True) == result
+
+def verify_models(n=100):
+    bad = 0
+    for node_type, args, kwargs in random_requests(n):
+        engine = get_engine(node_type=node_type)
+        full = engine.calculate_kundli(*args, **kwargs)
+        chart = engine.chart(*args, **kwargs)
+        sections = random.sample(BUNDLE_SECTIONS, random.randint(0, len(BUNDLE_SECTIONS)))
+        bundle = chart.to_dict([s for s in sections if s != "job"])
+        if "job" in sections:
+            bundle["job"] = job_report(kundli_view(chart))
+        if not mirrors(KundliResponse, full) or not mirrors(ChartBundleResponse, bundle):
+            bad += 1
+            print(f"FAIL {node_type} {args} {kwargs} {sections}")
+    bad += not mirrors(ErrorResponse, get_engine().calculate_kundli("bad", "Asia/Kolkata", 1.0, 1.0))
+    print(f"Models          : {n} results + bundles (random depth / horary / window / sections), {bad} mismatches")
+    return bad == 0
+
+def verify_rendering(n=20):
+    engine = get_engine()
+    results = [engine.calculate_kundli(*args, **kwargs) for _, args, kwargs in random_requests(n, seed=4)]
+    bad = sum(json.loads(json_bytes(r)) != r for r in results)
+    orjson, fast_response.orjson = fast_response.orjson, None
+    try:
+        bad += sum(json.loads(json_bytes(r)) != r for r in results)
+        t = time.perf_counter()
+        for r in results:
+            json_bytes(r)
+        t_std = (time.perf_counter() - t) / n
+    finally:
+        fast_response.orjson = orjson
+    t = time.perf_counter()
+    for r in results:
+        json.dumps(jsonable_encoder(r), ensure_ascii=False, separators=(",", ":")).encode()
+    t_encoder = (time.perf_counter() - t) / n
+    t = time.perf_counter()
+    for r in results:
+        json_bytes(r)
+    t_fast = (time.perf_counter() - t) / n
+    size = sum(len(json_bytes(r)) for r in results) / n
+    print(f"Rendering       : {bad} mismatches (orjson {'installed' if orjson else 'missing'} + stdlib) over {n} results of {size / 1e3:.0f} kB")
+    print(f"Per result      : jsonable_encoder + json {t_encoder * 1e3:.2f} ms, stdlib {t_std * 1e3:.2f} ms, json_bytes {t_fast * 1e3:.2f} ms")
+    return bad == 0
+
+def verify_compression():
+    ok = True
+    def check(label, passed, detail):
+        nonlocal ok
+        ok = ok and passed
+        print(f"{label:16s}: {detail}{'' if passed else '  FAIL'}")
+
+    client = TestClient(app)
+    req = {"birth_details": {"date_of_birth": "1990-12-15", "time_of_birth": "15:30:00", "timezone": "Asia/Kolkata", "latitude": 28.6, "longitude": 77.2},
+           "dasha_date": "2026-01-01"}
+    expected = get_engine().calculate_kundli("1990-12-15 15:30:00", "Asia/Kolkata", 28.6, 77.2, dasha_date="2026-01-01")
+    encodings = ["identity", "gzip"] + (["br"] if fast_response.brotli is not None else [])
+    sizes = {}
+    for encoding in encodings:
+        res = client.post("/kundli", json=req, headers={"Accept-Encoding": encoding})
+        sizes[encoding] = int(res.headers.get("content-length", len(res.content)))
+        used = res.headers.get("content-encoding", "identity")
+        check(f"/kundli {encoding}", used == encoding and res.json() == expected, f"{sizes[encoding] / 1e3:.1f} kB on the wire")
+    res = client.get("/health", headers={"Accept-Encoding": "gzip"})
+    check("Small responses", "content-encoding" not in res.headers, f"{len(res.content)} B /health sent as is (threshold {COMPRESS_MIN_SIZE} B)")
+
+    lines = [json.dumps({"i": i, "pad": "x" * 3000}).encode() + b"\n" for i in range(3)]
+    res = client.post("/api/v1/kp/kundli/stream", content=b"".join(json.dumps(req).encode() + b"\n" for _ in range(2)), headers={"Accept-Encoding": "gzip"})
+    check("NDJSON stream", res.headers.get("content-encoding") == "gzip" and [json.loads(l) for l in res.text.splitlines()] == [expected] * 2, "2 charts, gzip")
+
+    # Every chunk of a streamed body decodes on its own as it arrives
+    responders = [("gzip", FlushingGZipResponder(None, 0), zlib.decompressobj(16 + zlib.MAX_WBITS).decompress)]
+    if fast_response.brotli is not None:
+        responders.append(("br", BrotliResponder(None, 0), fast_response.brotli.Decompressor().process))
+    for name, responder, decode in responders:
+        chunks = [responder.apply_compression(line, more_body=i < len(lines) - 1) for i, line in enumerate(lines)]
+        check(f"Flush {name}", [decode(c) for c in chunks] == lines, f"{len(lines)} chunks decoded one at a time")
+    if fast_response.brotli is None:
+        print("Brotli          : package not installed, gzip only")
+    return ok
+
+if __name__ == "__main__":
+    ok = verify_models()
+    ok = verify_rendering() and ok
+    ok = verify_compression() and ok
+    sys.exit(0 if ok else 1)
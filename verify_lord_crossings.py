@@ -0,0 +1,57 @@
+import sys
+import time
+import numpy as np
+import nadi_core
+from nadi_core import get_engine
+from rectification import lord_crossings, time_sensitivity, CROSSING_LEVELS
+
+# lord_crossings vs a brute-force scan at 1-second steps: the same number of lord changes per cusp / planet,
+# each within one second of the solved instant. Then a birth-time sensitivity report.
+CASES = [
+    # (window start, window end, lat, lon, level)
+    ("2007-05-04 00:00:00", "2007-05-04 23:59:59", 12.9716, 77.5946, "sub_lord"),
+    ("1990-12-15 06:00:00", "1990-12-15 12:00:00", 28.6, 77.2, "sub_sub_lord"),
+    ("1962-02-20 00:00:00", "1962-02-20 23:59:59", 59.33, 18.06, "sub_lord"),
+]
+
+def brute_force(engine, start, end, lat, lon, level):
+    cols = engine.scan(start, end, 1, lat, lon, fields=("cusp_lords", "planet_lords"), timezone="Asia/Kolkata")
+    names = [f"Cusp {i + 1}" for i in range(12)] + list(engine.PLANETS)
+    levels = CROSSING_LEVELS[:CROSSING_LEVELS.index(level) + 1]
+    changes = {}
+    for prefix, offset in (("cusp", 0), ("planet", 12)):
+        changed = np.zeros(cols[f"{prefix}_sign"].shape, dtype=bool)
+        for lv in levels:
+            key = f"{prefix}_sign" if lv == "sign" else f"{prefix}_{lv}"
+            changed[1:] |= cols[key][1:] != cols[key][:-1]
+        for row, col in zip(*np.nonzero(changed)):
+            changes.setdefault(names[offset + col], []).append(float(row))
+    return changes
+
+def verify():
+    nadi_core.KUNDLI_CACHE = None
+    engine = get_engine()
+    failures = 0
+    for start, end, lat, lon, level in CASES:
+        t = time.perf_counter()
+        found = lord_crossings(start, end, lat, lon, level=level, timezone="Asia/Kolkata")
+        elapsed = time.perf_counter() - t
+        want = brute_force(engine, start, end, lat, lon, level)
+        got = {}
+        for c in found:
+            got.setdefault(c["point"], []).append(c["seconds"])
+        bad = [p for p in set(got) | set(want)
+               if len(got.get(p, [])) != len(want.get(p, [])) or any(not w - 1.0 < g <= w for g, w in zip(got[p], want[p]))]
+        failures += bool(bad)
+        print(f"{start[:10]} {level:12s}: {len(found)} crossings in {elapsed * 1e3:.0f} ms, brute force {'agrees' if not bad else 'DIFFERS at ' + ', '.join(bad)}")
+
+    t = time.perf_counter()
+    report = time_sensitivity("2007-05-04 04:50:00", 12.9716, 77.5946, level="sub_lord", points=("cusps", "planets"))
+    print(f"Sensitivity report in {(time.perf_counter() - t) * 1e3:.0f} ms; tolerance {report['tolerance_seconds']}")
+    for p in report["points"][:4]:
+        print(f"    {p['point']:8s} -{p['earlier_seconds'] or 0:7.1f} s / +{p['later_seconds'] or 0:7.1f} s")
+    print(f"Cases failing : {failures} / {len(CASES)}")
+    return failures == 0
+
+if __name__ == "__main__":
+    sys.exit(0 if verify() else 1)
@@ -0,0 +1,45 @@
+import swisseph as swe
+import time
+from nadi_core import NadiEngine, solve_prashna_ramc, _search_ramc_for_ascendant
+
+# Analytic RAMC inversion vs the old brute-force search, all 249 horary numbers
+LATITUDES = [-33.87, 0.0, 12.9716, 19.076, 28.6139, 40.7128, 51.5074, 60.17]
+
+def verify():
+    engine = NadiEngine()
+    jd = swe.julday(2026, 3, 4, 20.5)
+    swe.set_sid_mode(swe.SIDM_KRISHNAMURTI, 0, 0)
+    ayan = swe.get_ayanamsa_ut(jd)
+    eps = swe.calc_ut(jd, swe.ECL_NUT, 0)[0][0]
+
+    worst_cusp = 0.0
+    dms_mismatch = 0
+    t_new = t_old = 0.0
+    for lat in LATITUDES:
+        for num, entry in engine.HORARY_TABLE.items():
+            target = (entry["lon"] + ayan) % 360
+
+            t = time.perf_counter()
+            _, cusps_new, _ = solve_prashna_ramc(target, lat, eps, b'P')
+            t_new += time.perf_counter() - t
+
+            t = time.perf_counter()
+            ramc_old = _search_ramc_for_ascendant(target, lat, eps)
+            cusps_old, _ = swe.houses_armc(ramc_old, lat, eps, b'P')
+            t_old += time.perf_counter() - t
+
+            for c_new, c_old in zip(cusps_new, cusps_old):
+                diff = abs((c_new - c_old + 180) % 360 - 180)
+                worst_cusp = max(worst_cusp, diff)
+                if engine.decimal_to_dms(c_new - ayan) != engine.decimal_to_dms(c_old - ayan):
+                    dms_mismatch += 1
+
+    n = len(LATITUDES) * len(engine.HORARY_TABLE)
+    print(f"Charts checked     : {n}")
+    print(f"Max cusp deviation : {worst_cusp * 3600:.6f} arcsec")
+    print(f"DMS mismatches     : {dms_mismatch}")
+    print(f"Analytic solver    : {t_new / n * 1e6:.1f} us/chart")
+    print(f"Brute-force search : {t_old / n * 1e6:.1f} us/chart")
+
+if __name__ == "__main__":
+    verify()
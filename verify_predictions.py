@@ -0,0 +1,89 @@
+import random
+import sys
+import time
+from nadi_core import get_engine, houses_mask, MASK_HOUSES
+from prediction_engine import AREAS, bifurcation, kundli_view, predict
+
+# Prediction engine checks: hand-worked rows of the JobPredictionTable rules, the areas= filter against the
+# full run, and the cost of one all-areas pass per chart.
+
+def row(planet, star_lord, sub_lord, pl, nl, sl):
+    sig = lambda houses: [{"house": h, "is_placed": False} for h in houses]
+    return {"planet": planet, "star_lord": star_lord, "sub_lord": sub_lord,
+            "pl_signified": sig(pl), "nl_signified": sig(nl), "sl_signified": sig(sl)}
+
+# Placements: Sun 10, Moon 7, Mars 8, Jupiter 12, Venus 9, Saturn 6
+PLANETS = [{"planet": p, "house_placed": h} for p, h in
+           (("Sun", 10), ("Moon", 7), ("Mars", 8), ("Mercury", 10), ("Jupiter", 12), ("Venus", 9), ("Saturn", 6), ("Rahu", 7), ("Ketu", 1))]
+KUNDLI = {"planets": PLANETS, "nakshatra_nadi": [
+    row("Sun", "Sun", "Jupiter", [2, 10], [2, 10], [6, 9, 12]),
+    row("Venus", "Moon", "Saturn", [5, 9, 11], [2, 7, 11], [4, 6, 8]),
+]}
+
+# (planet, area, path, expected)
+CASES = [
+    ("Sun", "Job", ("rows", "sl", "bad"), [6, 9, 12]),
+    ("Sun", "Job", ("indication",), {"good": "High", "bad": "Medium Loss"}),
+    ("Sun", "Job", ("success", "code"), "B!"),
+    ("Sun", "Job", ("remedies",), [{"planet": "Jupiter", "item": "Bengal Gram", "day": "Thursday", "time": "Morning 6:00 AM to 7:00 AM"}]),
+    ("Sun", "Education", ("combination",), {"good": [2, 10], "bad": [6, 9, 12]}),
+    ("Venus", "Marriage", ("indication",), {"good": "Very Good Indication", "bad": "Medium Problems"}),
+    ("Venus", "Marriage", ("notes",), [
+        {"title": "Love Indication", "text": "Involvement of house 5 indicates attraction and love, but since it appears on the problem side, it may indicate love without a successful marriage."},
+        {"title": "Second Marriage Indication", "text": "Involvement of house 9 with marriage houses (2, 7, 11) indicates the possibility of a second marriage, typically after a separation or divorce."}]),
+    ("Venus", "Child Birth", ("rows", "nl"), {"hit": None, "good": [2, 11], "bad": []}),
+    ("Venus", "Child Birth", ("results",), {"nl": None}),
+    ("Venus", "Health", ("rows", "pl", "hit"), None),
+    ("Venus", "Health", ("indication",), {"good": "High", "bad": "Low"}),
+    ("Venus", "Health", ("results",), {"nl": "Normal Health, Kidneys/Urine area.", "sl": "Small disease"}),
+    ("Venus", "Health", ("diseases", "pl"), "Kidney, PCOD, Spermatozoa, Fungus and Infection, Skin problem, White Patches, Stones, Urine and Uterus"),
+    ("Venus", "Travel", ("combination",), {"good": [7, 9, 11], "bad": [2, 4, 11]}),
+    ("Venus", "Property & Vehicle", ("indication",), {"good": "HIGH", "bad": "NO INDICATION"}),
+]
+
+def verify_cases():
+    by_planet = {p["planet"]: p["areas"] for p in predict(KUNDLI)}
+    failures = 0
+    for planet, area, path, expected in CASES:
+        value = by_planet[planet][area]
+        for key in path:
+            value = value[key]
+        if value != expected:
+            failures += 1
+            print(f"FAIL {planet} {area} {'.'.join(path)}: {value} != {expected}")
+    # Job columns follow the 11 / 12 scenario of the row's own houses
+    scenarios = {(True, True): {6, 7, 9}, (True, False): {5, 6, 7, 8, 9}, (False, True): set(), (False, False): {6, 7, 9}}
+    for (has11, has12), dynamic in scenarios.items():
+        good, bad = bifurcation(houses_mask(h for h, on in ((11, has11), (12, has12)) if on), "Job")
+        if set(MASK_HOUSES[good]) & {5, 6, 7, 8, 9} != dynamic or set(MASK_HOUSES[bad]) & {5, 6, 7, 8, 9} != {5, 6, 7, 8, 9} - dynamic:
+            failures += 1
+            print(f"FAIL Job scenario 11={has11} 12={has12}")
+    print(f"Rule cases     : {len(CASES) + len(scenarios)} checked, {failures} failed")
+    return failures == 0
+
+def verify_charts(n=200):
+    random.seed(7)
+    engine = get_engine()
+    kundlis = []
+    for _ in range(n):
+        dt = f"{random.randint(1940, 2030)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d} {random.randint(0, 23):02d}:{random.randint(0, 59):02d}:00"
+        kundlis.append(kundli_view(engine.chart(dt, "Asia/Kolkata", random.uniform(8, 32), random.uniform(68, 92))))
+
+    t = time.perf_counter()
+    full = [predict(k) for k in kundlis]
+    t_full = time.perf_counter() - t
+
+    mismatches = 0
+    for k, rows in zip(kundlis[:50], full):
+        for area in AREAS:
+            single = predict(k, [area])
+            mismatches += any(s["areas"] != {area: r["areas"][area]} for s, r in zip(single, rows))
+    print(f"Charts         : {n} x 9 planets x {len(AREAS)} areas")
+    print(f"areas= filter  : {mismatches} mismatches vs the full run")
+    print(f"All areas      : {t_full / n * 1e3:.2f} ms/chart")
+    return mismatches == 0
+
+if __name__ == "__main__":
+    ok = verify_cases()
+    ok = verify_charts() and ok
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,73 @@
+import sys
+import time
+import datetime
+import numpy as np
+import pytz
+import nadi_core
+from nadi_core import get_engine, SIGNS, SIGN_RULERS, DASHA_ORDER, VimshottariDasha
+from rectification import rectify, CuspLord, PlanetLord, PlanetHouse, DashaLord
+
+# rectify() vs brute force: every constraint re-checked from NadiEngine.scan lord columns (and
+# VimshottariDasha.period_at for dasha constraints) at BRUTE_STEP-second steps over the same window.
+# Every interval boundary must agree to within one brute-force step.
+BRUTE_STEP = 2
+
+CASES = [
+    # (window start, window end, lat, lon, constraints)
+    ("1990-12-15 00:00:00", "1990-12-15 23:59:59", 28.6, 77.2, [CuspLord(1, "sign", "Gemini")]),
+    ("1990-12-15 00:00:00", "1990-12-15 23:59:59", 28.6, 77.2, [CuspLord(1, "sign", "Gemini"), PlanetHouse("Jupiter", 2)]),
+    ("2007-05-04 00:00:00", "2007-05-04 23:59:59", 12.9716, 77.5946, [CuspLord(1, "sub_lord", "Saturn"), CuspLord(10, "star_lord", "Venus")]),
+    ("2007-05-04 18:00:00", "2007-05-04 23:59:59", 12.9716, 77.5946, [CuspLord(7, "sub_sub_lord", "Mercury"), PlanetHouse("Moon", 12)]),
+    ("1962-02-20 00:00:00", "1962-02-21 23:59:59", 19.07, 72.87, [PlanetLord("Moon", "sub_lord", "Rahu"), DashaLord("2000-01-01", ["Rahu", "Jupiter"])]),
+    ("1985-07-09 06:00:00", "1985-07-09 12:00:00", 22.57, 88.36, [CuspLord(1, "sign_lord", "Mercury"), CuspLord(11, "sub_lord", "Jupiter"), DashaLord("2010-03-15", ["Saturn"])]),
+]
+
+def holds(engine, c, cols, start_utc, tz):
+    if isinstance(c, CuspLord) or isinstance(c, PlanetLord):
+        prefix, col = ("cusp", c.cusp - 1) if isinstance(c, CuspLord) else ("planet", list(engine.PLANETS).index(c.planet))
+        if c.level in ("sign", "sign_lord"):
+            signs = [SIGNS[s] for s in cols[f"{prefix}_sign"][:, col]]
+            return np.array([(s if c.level == "sign" else SIGN_RULERS[s]) == c.value for s in signs])
+        return np.array([DASHA_ORDER[i] == c.value for i in cols[f"{prefix}_{c.level}"][:, col]])
+    if isinstance(c, PlanetHouse):
+        return cols["planet_houses"][:, list(engine.PLANETS).index(c.planet)] == c.house
+    event = tz.localize(datetime.datetime.strptime(c.date, "%Y-%m-%d"))
+    return np.array([
+        tuple(p.path[-1] for p in VimshottariDasha(float(m), start_utc + datetime.timedelta(seconds=i * BRUTE_STEP)).period_at(event, len(c.lords))) == c.lords
+        for i, m in enumerate(cols["moon_lahiri"])
+    ])
+
+def brute_force(engine, start, end, lat, lon, constraints, tz):
+    cols = engine.scan(start, end, BRUTE_STEP, lat, lon, fields=("cusp_lords", "planet_lords", "planet_houses", "moon_lahiri"), timezone=tz.zone)
+    start_utc = tz.localize(datetime.datetime.strptime(start, "%Y-%m-%d %H:%M:%S")).astimezone(pytz.UTC)
+    ok = np.logical_and.reduce([holds(engine, c, cols, start_utc, tz) for c in constraints])
+    edges = np.flatnonzero(np.diff(np.concatenate([[0], ok.astype(np.int8), [0]])))
+    return [(a * BRUTE_STEP, (b - 1) * BRUTE_STEP) for a, b in zip(edges[::2], edges[1::2])]
+
+def verify():
+    nadi_core.KUNDLI_CACHE = None
+    engine = get_engine()
+    tz = pytz.timezone("Asia/Kolkata")
+    failures = 0
+    for start, end, lat, lon, constraints in CASES:
+        t = time.perf_counter()
+        found = rectify(start, end, lat, lon, constraints, timezone="Asia/Kolkata")
+        elapsed = time.perf_counter() - t
+        t0 = tz.localize(datetime.datetime.strptime(start, "%Y-%m-%d %H:%M:%S"))
+        got = [((r["start"] - t0).total_seconds(), (r["end"] - t0).total_seconds()) for r in found]
+        want = brute_force(engine, start, end, lat, lon, constraints, tz)
+        # a brute-force run [a, b] of satisfied samples must sit inside an exact interval extending < one step beyond
+        agree = len(got) == len(want) and all(
+            ga <= wa < ga + BRUTE_STEP and gb - BRUTE_STEP < wb <= gb for (ga, gb), (wa, wb) in zip(got, want)
+        )
+        failures += not agree
+        print(f"{start[:10]} {len(constraints)} constraints : {len(got)} interval(s) in {elapsed * 1e3:.0f} ms, brute force {'agrees' if agree else 'DIFFERS'}")
+        for r in found:
+            print(f"    {r['start'].strftime('%Y-%m-%d %H:%M:%S.%f')[:-4]} -> {r['end'].strftime('%H:%M:%S.%f')[:-4]} ({r['seconds']:.2f} s)")
+        if not agree:
+            print("    exact:", got, "\n    brute:", want)
+    print(f"Cases failing : {failures} / {len(CASES)}")
+    return failures == 0
+
+if __name__ == "__main__":
+    sys.exit(0 if verify() else 1)
@@ -0,0 +1,68 @@
+import sys
+import time
+import numpy as np
+import nadi_core
+from nadi_core import NadiEngine, SWISS_EPHEMERIS, SIGNS, DASHA_ORDER, SHORT_CODES
+from fast_ephemeris import FastEphemeris
+
+# NadiEngine.scan vs calculate_kundli (the Chart sections it reads) at the same instants (ascendant, cusp and planet lords, houses),
+# then the cost of a full-day minute-level scan. Optional argument: fast ephemeris file.
+FIELDS = ("ascendant_lords", "cusp_lords", "planet_lords", "planet_houses")
+
+def short(idx):
+    return SHORT_CODES[DASHA_ORDER[idx]]
+
+def compare(engine, lat, lon, start, end, step):
+    cols = engine.scan(start, end, step, lat, lon, fields=FIELDS, timezone="Asia/Kolkata")
+    names = list(engine.PLANETS)
+    mismatches = 0
+    for i in range(len(cols["jd"])):
+        t = (np.datetime64(start) + np.timedelta64(int(i * step), "s")).astype(str).replace("T", " ")
+        chart = engine.chart(t, "Asia/Kolkata", lat, lon)
+        asc = chart.ascendant
+        got = [SIGNS[cols["ascendant_sign"][i]], DASHA_ORDER[cols["ascendant_star_lord"][i]], DASHA_ORDER[cols["ascendant_sub_lord"][i]]]
+        want = [asc["sign"], asc["star_lord"], asc["sub_lord"]]
+        for h, house in enumerate(chart.houses):
+            got += [SIGNS[cols["cusp_sign"][i, h]], short(cols["cusp_star_lord"][i, h]), short(cols["cusp_sub_lord"][i, h]), short(cols["cusp_sub_sub_lord"][i, h])]
+            want += [house["sign"], house["star_lord"], house["sub_lord"], house["sub_sub_lord"]]
+        for p, planet in enumerate(chart.planets):
+            assert planet["planet"] == names[p]
+            got += [short(cols["planet_star_lord"][i, p]), short(cols["planet_sub_lord"][i, p]), int(cols["planet_houses"][i, p])]
+            want += [planet["star_lord"], planet["sub_lord"], planet["house_placed"]]
+        mismatches += sum(a != b for a, b in zip(got, want))
+    return len(cols["jd"]), mismatches
+
+def verify(fast_path=None):
+    nadi_core.KUNDLI_CACHE = None
+    engines = [("swiss", NadiEngine(ephemeris=SWISS_EPHEMERIS))]
+    if fast_path:
+        engines.append(("fast", NadiEngine(ephemeris=FastEphemeris(fast_path, fallback=SWISS_EPHEMERIS))))
+    ok = True
+    for label, engine in engines:
+        total = bad = 0
+        for lat, lon, start in ((12.9716, 77.5946, "2007-05-04 00:00:00"), (28.6, 77.2, "1990-12-15 00:00:00"), (19.07, 72.87, "1962-02-20 05:00:00")):
+            n, m = compare(engine, lat, lon, start, start[:11] + "23:59:00", 317)
+            total, bad = total + n, bad + m
+        print(f"[{label}] scan vs calculate_kundli : {total} instants, {bad} differing fields")
+        ok = ok and bad == 0
+
+        for fields in (("ascendant_lords",), FIELDS):
+            t = time.perf_counter()
+            cols = engine.scan("2007-05-04 00:00:00", "2007-05-04 23:59:00", 60, 12.9716, 77.5946, fields=fields, timezone="Asia/Kolkata")
+            print(f"[{label}] 1440-minute scan of {'+'.join(fields)} : {(time.perf_counter() - t) * 1e3:.1f} ms")
+
+    # The old scan_time.py loop, for scale
+    engine = engines[0][1]
+    t = time.perf_counter()
+    for m in range(0, 1440, 60):
+        engine.calculate_kundli(f"2007-05-04 {m // 60:02d}:{m % 60:02d}:00", "Asia/Kolkata", 12.9716, 77.5946)
+    print(f"calculate_kundli per minute (loop) : {(time.perf_counter() - t) / 24 * 1e3:.1f} ms x 1440")
+
+    # scan_time.py case: when is the lagna nearest 22 Gemini (82 deg)?
+    cols = engines[-1][1].scan("2007-05-04 00:00:00", "2007-05-04 23:59:00", 60, 12.9716, 77.5946, fields=("ascendant",), timezone="Asia/Kolkata")
+    i = int(np.argmin(np.abs((cols["ascendant"] - 82.0 + 180.0) % 360.0 - 180.0)))
+    print(f"Lagna nearest 82 deg : {cols['time'][i]} UTC ({cols['ascendant'][i]:.4f})")
+    return ok
+
+if __name__ == "__main__":
+    sys.exit(0 if verify(*sys.argv[1:2]) else 1)
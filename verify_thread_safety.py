@@ -0,0 +1,45 @@
+import json
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+import nadi_core
+from nadi_core import get_engine
+from kp_prashna_engine import KPMixedPrashnaEngine
+
+# calculate_kundli on a thread pool, interleaved with KP prashna charts, vs the same charts computed sequentially
+def make_jobs(n):
+    random.seed(11)
+    jobs = []
+    for _ in range(n):
+        day = f"{random.randint(1950, 2020)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}"
+        hhmm = f"{random.randint(0, 23):02d}:{random.randint(0, 59):02d}:00"
+        jobs.append((f"{day} {hhmm}", "Asia/Kolkata", random.uniform(8, 32), random.uniform(68, 92), random.choice([None, random.randint(1, 249)])))
+    return jobs
+
+def run(job):
+    dt_str, tzone, lat, lon, horary = job
+    res = get_engine().calculate_kundli(dt_str, tzone, lat, lon, horary_number=horary, dasha_date="2026-01-01")
+    prashna = KPMixedPrashnaEngine().calculate(random.randint(1, 249), "2026-03-04", "20:30:00", lat, lon, tzone)
+    return json.dumps(res), json.dumps(prashna, default=str)
+
+def verify(n=200, threads=8):
+    nadi_core.KUNDLI_CACHE = None
+    jobs = make_jobs(n)
+
+    t = time.perf_counter()
+    sequential = [run(job)[0] for job in jobs]
+    t_seq = time.perf_counter() - t
+
+    t = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        parallel = [res for res, _ in pool.map(run, jobs)]
+    t_par = time.perf_counter() - t
+
+    mismatches = sum(a != b for a, b in zip(sequential, parallel))
+    print(f"Charts checked : {n} ({threads} threads)")
+    print(f"Mismatches     : {mismatches}")
+    print(f"Sequential     : {t_seq:.2f}s")
+    print(f"Thread pool    : {t_par:.2f}s")
+
+if __name__ == "__main__":
+    verify()